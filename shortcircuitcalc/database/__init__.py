@@ -19,4 +19,4 @@ Modules:
 from shortcircuitcalc.database.units import *
 from shortcircuitcalc.database.models import *
 from shortcircuitcalc.database.install import *
-from shortcircuitcalc.database.mixins import BT
+from shortcircuitcalc.database.mixins import BT, JoinedMixin
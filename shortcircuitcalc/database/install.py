@@ -14,10 +14,9 @@ import typing as ty
 from pathlib import Path
 
 import sqlalchemy as sa
-import sqlalchemy.exc
 
 from shortcircuitcalc.tools import (
-    Base, engine, metadata, session_scope, config_manager
+    Base, get_engine, session_scope, config_manager
 )
 from shortcircuitcalc.database.models import (
     PowerNominal, VoltageNominal, Scheme, Transformer,
@@ -45,25 +44,32 @@ def db_install(clear: bool = False) -> None:
             session.execute(sa.text("CREATE TABLE test (id INTEGER PRIMARY KEY AUTOINCREMENT);"))
             session.execute(sa.text("DROP TABLE test;"))
 
+    existing_tables = set(sa.inspect(get_engine()).get_table_names())
+
     # Deploying part of the database for equipment category 'Transformers'
     for table in (PowerNominal, VoltageNominal, Scheme, Transformer):
-        __deploy_if_not_exist(table, DATA_DIR / 'transformer_catalog' / Path(table.__tablename__ + 's'), clear)
+        __deploy_if_not_exist(table, DATA_DIR / 'transformer_catalog' / Path(table.__tablename__ + 's'),
+                              clear, existing_tables)
 
     # Deploying part of the database for equipment category 'Cables and wires'
     for table in (Mark, Amount, RangeVal, Cable):
-        __deploy_if_not_exist(table, DATA_DIR / 'cable_catalog' / Path(table.__tablename__ + 's'), clear)
+        __deploy_if_not_exist(table, DATA_DIR / 'cable_catalog' / Path(table.__tablename__ + 's'),
+                              clear, existing_tables)
 
     # Deploying part of the database for equipment category 'Current breaker devices'
     for table in (Device, CurrentNominal, CurrentBreaker):
-        __deploy_if_not_exist(table, DATA_DIR / 'current_breaker_catalog' / Path(table.__tablename__ + 's'), clear)
+        __deploy_if_not_exist(table, DATA_DIR / 'current_breaker_catalog' / Path(table.__tablename__ + 's'),
+                              clear, existing_tables)
 
     # Deploying part of the database for equipment category 'Other resistances'
-    __deploy_if_not_exist(OtherContact, DATA_DIR / Path(OtherContact.__tablename__ + 's'), clear)
+    __deploy_if_not_exist(OtherContact, DATA_DIR / Path(OtherContact.__tablename__ + 's'),
+                          clear, existing_tables)
 
 
 def __deploy_if_not_exist(db_table: ty.Type[Base],
                           pathlike: ty.Union[str, Path],
-                          full: bool = False
+                          full: bool = False,
+                          existing_tables: ty.Optional[ty.Set[str]] = None
                           ) -> None:
     """
     Function to deploy a table if it does not already exist in the database.
@@ -72,15 +78,16 @@ def __deploy_if_not_exist(db_table: ty.Type[Base],
         db_table (Base): The table object to deploy.
         pathlike (Union[str, pathlib.WindowsPath]): The path to the CSV file. Defaults to None.
         full (bool): If True, the table will be dropped and recreated with data from CSV file. Defaults to None.
+        existing_tables (Optional[Set[str]]): Names of the tables already existing in the database.
+            Defaults to None, then names are requested from the database.
 
-    """
-    try:
-        metadata.reflect(bind=engine)
+    Note:
+        The catalog data is inserted by one 'executemany' query per table.
 
-        if full or db_table.__tablename__ not in metadata.tables:
-            db_table.create_table(drop_first=full, forced_drop=full)
-            db_table.insert_table(from_csv=pathlike)
+    """
+    if existing_tables is None:
+        existing_tables = set(sa.inspect(get_engine()).get_table_names())
 
-    except sqlalchemy.exc.NoSuchTableError:
-        db_table.create_table()
+    if full or db_table.__tablename__ not in existing_tables:
+        db_table.create_table(drop_first=full, forced_drop=full)
         db_table.insert_table(from_csv=pathlike)
@@ -20,11 +20,12 @@ import sqlalchemy as sa
 import sqlalchemy.exc
 from sqlalchemy.orm import declared_attr
 from sqlalchemy.inspection import inspect
+import numpy as np
 import pandas as pd
 from matplotlib import figure
 
 from shortcircuitcalc.tools import (
-    Base, engine, session_scope, config_manager
+    Base, get_engine, session_scope, config_manager
 )
 
 
@@ -95,19 +96,25 @@ class BaseMixin:
         elif drop_first:
             cls.drop_table(cls.__tablename__)
         try:
-            Base.metadata.tables[cls.__tablename__].create(engine, checkfirst=True)
+            Base.metadata.tables[cls.__tablename__].create(get_engine(), checkfirst=True)
             logger.warning(f"Table '{cls.__tablename__}' has been created.")
         except sa.exc.OperationalError as err:
             logger.warning(f"{type(err)}: Table '{cls.__tablename__}' already exists!")
 
     @classmethod
-    def read_table(cls, filtrate: ty.Optional[str] = None, limit: ty.Optional[int] = None) -> pd.DataFrame:
+    def read_table(cls,
+                   filtrate: ty.Optional[str] = None,
+                   limit: ty.Optional[int] = None,
+                   session: ty.Optional[sa.orm.Session] = None
+                   ) -> pd.DataFrame:
         """
         The method reads the table.
 
         Args:
             filtrate (Optional[str]): Defaults to None. Accepts the filtering condition.
             limit (Optional[int]): Default shows all results, otherwise shows the specified number of results.
+            session (Optional[sa.orm.Session]): Defaults to None. Accepts the opened session
+                                                for reading several tables in one session.
 
         Filtrate query sample:
 
@@ -123,26 +130,29 @@ class BaseMixin:
             pd.DataFrame: Object with query results
 
         """
-        with session_scope() as session:
-            chosen_cols = cls.get_non_keys(as_str=False, allow_foreign=True)
+        if session is None:
+            with session_scope() as session:
+                return cls.read_table(filtrate, limit, session)
 
-            if filtrate is None:
-                query = session.query(
-                    *chosen_cols
-                ).order_by(
-                    *chosen_cols
-                )
+        chosen_cols = cls.get_non_keys(as_str=False, allow_foreign=True)
 
-            else:
-                query = session.query(
-                    *chosen_cols
-                ).filter(
-                    sa.text(filtrate)
-                ).order_by(
-                    *chosen_cols
-                )
+        if filtrate is None:
+            query = session.query(
+                *chosen_cols
+            ).order_by(
+                *chosen_cols
+            )
 
-        df = pd.read_sql(query.statement, session.bind, dtype=object)[:limit]
+        else:
+            query = session.query(
+                *chosen_cols
+            ).filter(
+                sa.text(filtrate)
+            ).order_by(
+                *chosen_cols
+            )
+
+        df = pd.read_sql(query.statement, session.connection(), dtype=object)[:limit]
         df.insert(0, 'id', pd.Series(range(1, len(df) + 1)))
         return df
 
@@ -352,24 +362,30 @@ class BaseMixin:
             if confirm == cls.__tablename__:
 
                 if not forced:
-                    Base.metadata.tables[cls.__tablename__].drop(engine)
+                    Base.metadata.tables[cls.__tablename__].drop(get_engine())
                     logger.warning(f"Table '{cls.__tablename__}' has been deleted.")
 
                 else:
 
+                    # The checks are set per pooled connection, so they are turned back on even if dropping fails
+
                     # MySQL dialect
                     if config_manager('DB_EXISTING_CONNECTION') == 'MySQL':
                         with session_scope(False) as session:
                             session.execute(sa.text(f'SET FOREIGN_KEY_CHECKS = 0;'))
-                            session.execute(sa.text(f'DROP TABLE {cls.__tablename__};'))
-                            session.execute(sa.text(f'SET FOREIGN_KEY_CHECKS = 1'))
+                            try:
+                                session.execute(sa.text(f'DROP TABLE {cls.__tablename__};'))
+                            finally:
+                                session.execute(sa.text(f'SET FOREIGN_KEY_CHECKS = 1'))
 
                     # SQLite dialect
                     if config_manager('DB_EXISTING_CONNECTION') == 'SQLite':
                         with session_scope(False) as session:
                             session.execute(sa.text(f'PRAGMA FOREIGN_KEYS = OFF;'))
-                            session.execute(sa.text(f'DROP TABLE {cls.__tablename__};'))
-                            session.execute(sa.text(f'PRAGMA FOREIGN_KEYS = ON'))
+                            try:
+                                session.execute(sa.text(f'DROP TABLE {cls.__tablename__};'))
+                            finally:
+                                session.execute(sa.text(f'PRAGMA FOREIGN_KEYS = ON'))
 
                     logger.warning(f"Table '{cls.__tablename__}' has been forced deleted.")
             else:
@@ -405,7 +421,7 @@ class BaseMixin:
             logger.warning(f"Id order for table '{cls.__tablename__}' has been reset!")
 
         # SQLite dialect
-        if config_manager('DB_EXISTING_CONNECTION') == 'SQLite' and JoinedMixin not in cls.__mro__:
+        if config_manager('DB_EXISTING_CONNECTION') == 'SQLite' and not issubclass(cls, JoinedMixin):
             logger.error(
                 f"In 'SQLite' DB resetting the parent table's ('{cls.__tablename__}') "
                 'primary key is not available due to future relationship breakdowns '
@@ -477,12 +493,12 @@ class BaseMixin:
         if not on_side:
             foreign_keys = tuple(
                 key['constrained_columns'][0] for key
-                in inspect(engine).get_foreign_keys(cls.__tablename__)
+                in inspect(get_engine()).get_foreign_keys(cls.__tablename__)
             )
 
         else:
             for table in Base.metadata.tables:
-                for key in inspect(engine).get_foreign_keys(table):
+                for key in inspect(get_engine()).get_foreign_keys(table):
                     if key['referred_table'] == cls.__tablename__ \
                             and key['referred_columns'][0] == cls.get_primary_key():
                         foreign_keys = key['constrained_columns'][0]
@@ -631,12 +647,16 @@ class JoinedMixin:
 
     """
     @classmethod
-    def read_joined_table(cls: BT) -> pd.DataFrame:
+    def read_joined_table(cls: BT, session: ty.Optional[sa.orm.Session] = None) -> pd.DataFrame:
         """
         The method returns joined table as pandas DataFrame.
 
         Method returns joined table as pandas DataFrame with generated id columns.
 
+        Args:
+            session (Optional[sa.orm.Session]): Defaults to None. Accepts the opened session
+                                                for reading several tables in one session.
+
         Returns:
             pd.DataFrame: Joined table as pandas DataFrame.
 
@@ -645,28 +665,17 @@ class JoinedMixin:
             tables and the object of their association with additional information.
 
         """
-        joined_tables_non_keys = tuple(
-            map(lambda x: x.get_non_keys(as_str=False)[0], cls.SUBTABLES)
-        )
-
-        chosen_cols = (
-            *joined_tables_non_keys, *cls.get_non_keys(as_str=False)
-        )
-
-        join_stmt = cls.__get_join_stmt()
+        if session is None:
+            with session_scope() as session:
+                return cls.read_joined_table(session)
 
-        with session_scope() as session:
-            query = session.query(
-                *chosen_cols
-            ).select_from(
-                join_stmt
-            ).order_by(
-                *joined_tables_non_keys
-            )
+        stmt = cls.__get_joined_select()
+        # Only numeric columns keep 'Decimal' objects, others get native dtypes
+        decimal_cols = {col.name: object for col in stmt.selected_columns if isinstance(col.type, sa.Numeric)}
 
-            df = pd.read_sql(query.statement, session.bind, dtype=object)
-            df.insert(0, 'id', pd.Series(range(1, len(df) + 1)))
-            return df
+        df = pd.read_sql(stmt, session.connection(), dtype=decimal_cols)
+        df.insert(0, 'id', np.arange(1, len(df) + 1, dtype=np.int32))
+        return df
 
     @classmethod
     def insert_joined_table(cls: BT, data: ty.List[dict]) -> None:
@@ -733,9 +742,9 @@ class JoinedMixin:
                             if 'Duplicate entry' in err.orig.__str__():
                                 pass
 
-                        attrs[table.get_foreign_keys(on_side=True)] = session.query(table).filter(
+                        attrs[table.get_foreign_keys(on_side=True)] = session.query(table.id).filter(
                             getattr(table, col_name) == row[col_name]
-                        ).first().id
+                        ).scalar()
 
                 if hasattr(__temp_insert, 'unique'):
                     result = session.connection().execute(sa.insert(
@@ -1018,10 +1027,42 @@ class JoinedMixin:
                 session.execute(sa.text(f'DELETE FROM {cls.__tablename__};'))
                 session.execute(sa.text(f"UPDATE SQLITE_SEQUENCE SET seq = 0 WHERE name = '{cls.__tablename__}';"))
 
-            df.to_sql(f'{cls.__tablename__}', engine, if_exists='append', index=False)
+            df.to_sql(f'{cls.__tablename__}', get_engine(), if_exists='append', index=False)
 
             logger.warning(f"Id order for joined table '{cls.__tablename__}' has been reset!")
 
+    @classmethod
+    def __get_joined_select(cls: BT) -> sa.sql.Select:
+        """
+        The method returns select statement for joined table.
+
+        The statement is built only once for each joined table class and cached
+        in the class memory, so further calls reuse it without inspecting tables
+        columns and rebuilding join again.
+
+        Returns:
+            sa.sql.Select: Select statement for joined table.
+
+        """
+        if '_joined_select' not in cls.__dict__:
+            joined_tables_non_keys = tuple(
+                map(lambda x: x.get_non_keys(as_str=False)[0], cls.SUBTABLES)
+            )
+
+            chosen_cols = (
+                *joined_tables_non_keys, *cls.get_non_keys(as_str=False)
+            )
+
+            cls._joined_select = sa.select(
+                *chosen_cols
+            ).select_from(
+                cls.__get_join_stmt()
+            ).order_by(
+                *joined_tables_non_keys
+            )
+
+        return cls._joined_select
+
     @classmethod
     def __get_join_stmt(cls: BT) -> sa.sql.Join:
         """
@@ -44,6 +44,7 @@ Dataclasses for CRUD operations:
 
 from decimal import Decimal
 from dataclasses import dataclass, field
+from functools import partial
 
 import sqlalchemy as sa
 import sqlalchemy.orm
@@ -67,6 +68,24 @@ __all__ = (
 )
 
 
+# Models columns are placed after the 'id' column (sort_order=0)
+_column = partial(sa.orm.mapped_column, sort_order=10)
+
+
+def _cascade_fk(target: sa.orm.InstrumentedAttribute) -> sa.ForeignKey:
+    """
+    Returns the foreign key to the source table column with cascade deleting and updating.
+
+    Args:
+        target (sa.orm.InstrumentedAttribute): The source table column.
+
+    Returns:
+        sa.ForeignKey: The foreign key object.
+
+    """
+    return sa.ForeignKey(target, ondelete='CASCADE', onupdate='CASCADE')
+
+
 ##########################
 #       Main models      #
 ##########################
@@ -77,12 +96,12 @@ class PowerNominal(BaseMixin, Base):
     The class describes a table of transformer power nominals.
 
     """
-    power = sa.orm.mapped_column(
-        sa.Integer, nullable=False, unique=True, sort_order=10
+    power = _column(
+        sa.Integer, nullable=False, unique=True
     )
 
     # relationships
-    transformers = sa.orm.relationship('Transformer', back_populates='power_nominals')
+    transformers = sa.orm.relationship('Transformer', back_populates='power_nominals', lazy='raise')
 
 
 class VoltageNominal(BaseMixin, Base):
@@ -90,12 +109,12 @@ class VoltageNominal(BaseMixin, Base):
     The class describes a table of transformer voltage nominals.
 
     """
-    voltage = sa.orm.mapped_column(
-        sa.Numeric(6, 3), nullable=False, unique=True, sort_order=10
+    voltage = _column(
+        sa.Numeric(6, 3), nullable=False, unique=True
     )
 
     # relationships
-    transformers = sa.orm.relationship('Transformer', back_populates='voltage_nominals')
+    transformers = sa.orm.relationship('Transformer', back_populates='voltage_nominals', lazy='raise')
 
 
 class Scheme(BaseMixin, Base):
@@ -103,12 +122,12 @@ class Scheme(BaseMixin, Base):
     The class describes a table of transformer vector group schemes.
 
     """
-    vector_group = sa.orm.mapped_column(
-        sa.String(10), nullable=False, unique=True, sort_order=10
+    vector_group = _column(
+        sa.String(10), nullable=False, unique=True
     )
 
     # relationships
-    transformers = sa.orm.relationship('Transformer', back_populates='schemes')
+    transformers = sa.orm.relationship('Transformer', back_populates='schemes', lazy='raise')
 
 
 class Transformer(JoinedMixin, BaseMixin, Base):
@@ -121,41 +140,38 @@ class Transformer(JoinedMixin, BaseMixin, Base):
     """
     SUBTABLES = PowerNominal, VoltageNominal, Scheme
 
-    power_id = sa.orm.mapped_column(
-        sa.Integer, sa.ForeignKey(
-            PowerNominal.id, ondelete='CASCADE', onupdate='CASCADE'), sort_order=10
+    power_id = _column(
+        sa.Integer, _cascade_fk(PowerNominal.id)
     )
-    voltage_id = sa.orm.mapped_column(
-        sa.Integer, sa.ForeignKey(
-            VoltageNominal.id, ondelete='CASCADE', onupdate='CASCADE'), sort_order=10
+    voltage_id = _column(
+        sa.Integer, _cascade_fk(VoltageNominal.id)
     )
-    vector_group_id = sa.orm.mapped_column(
-        sa.Integer, sa.ForeignKey(
-            Scheme.id, ondelete='CASCADE', onupdate='CASCADE'), sort_order=10
+    vector_group_id = _column(
+        sa.Integer, _cascade_fk(Scheme.id)
     )
-    power_short_circuit = sa.orm.mapped_column(
-        sa.Numeric(6, 3), nullable=False, sort_order=10
+    power_short_circuit = _column(
+        sa.Numeric(6, 3), nullable=False
     )
-    voltage_short_circuit = sa.orm.mapped_column(
-        sa.Numeric(6, 3), nullable=False, sort_order=10
+    voltage_short_circuit = _column(
+        sa.Numeric(6, 3), nullable=False
     )
-    resistance_r1 = sa.orm.mapped_column(
-        sa.Numeric(8, 5), nullable=False, sort_order=10
+    resistance_r1 = _column(
+        sa.Numeric(8, 5), nullable=False
     )
-    reactance_x1 = sa.orm.mapped_column(
-        sa.Numeric(8, 5), nullable=False, sort_order=10
+    reactance_x1 = _column(
+        sa.Numeric(8, 5), nullable=False
     )
-    resistance_r0 = sa.orm.mapped_column(
-        sa.Numeric(8, 5), nullable=False, sort_order=10
+    resistance_r0 = _column(
+        sa.Numeric(8, 5), nullable=False
     )
-    reactance_x0 = sa.orm.mapped_column(
-        sa.Numeric(8, 5), nullable=False, sort_order=10
+    reactance_x0 = _column(
+        sa.Numeric(8, 5), nullable=False
     )
 
     # relationships
-    power_nominals = sa.orm.relationship('PowerNominal', back_populates='transformers')
-    voltage_nominals = sa.orm.relationship('VoltageNominal', back_populates='transformers')
-    schemes = sa.orm.relationship('Scheme', back_populates='transformers')
+    power_nominals = sa.orm.relationship('PowerNominal', back_populates='transformers', lazy='selectin')
+    voltage_nominals = sa.orm.relationship('VoltageNominal', back_populates='transformers', lazy='selectin')
+    schemes = sa.orm.relationship('Scheme', back_populates='transformers', lazy='selectin')
 
 
 ##############################
@@ -166,12 +182,12 @@ class Mark(BaseMixin, Base):
     The class describes a table of cable marking types.
 
     """
-    mark_name = sa.orm.mapped_column(
-        sa.String(20), nullable=False, unique=True, sort_order=10
+    mark_name = _column(
+        sa.String(20), nullable=False, unique=True
     )
 
     # relationships
-    cables = sa.orm.relationship('Cable', back_populates='marks')
+    cables = sa.orm.relationship('Cable', back_populates='marks', lazy='raise')
 
 
 class Amount(BaseMixin, Base):
@@ -179,12 +195,12 @@ class Amount(BaseMixin, Base):
     The class describes a table of the number of conductive cores of cables.
 
     """
-    multicore_amount = sa.orm.mapped_column(
-        sa.Integer, nullable=False, unique=True, sort_order=10
+    multicore_amount = _column(
+        sa.Integer, nullable=False, unique=True
     )
 
     # relationships
-    cables = sa.orm.relationship('Cable', back_populates='amounts')
+    cables = sa.orm.relationship('Cable', back_populates='amounts', lazy='raise')
 
 
 class RangeVal(BaseMixin, Base):
@@ -192,12 +208,12 @@ class RangeVal(BaseMixin, Base):
     The class describes a table of cable ranges.
 
     """
-    cable_range = sa.orm.mapped_column(
-        sa.Numeric(4, 1), nullable=False, unique=True, sort_order=10
+    cable_range = _column(
+        sa.Numeric(4, 1), nullable=False, unique=True
     )
 
     # relationships
-    cables = sa.orm.relationship('Cable', back_populates='ranges')
+    cables = sa.orm.relationship('Cable', back_populates='ranges', lazy='raise')
 
 
 class Cable(JoinedMixin, BaseMixin, Base):
@@ -210,38 +226,35 @@ class Cable(JoinedMixin, BaseMixin, Base):
     """
     SUBTABLES = Mark, Amount, RangeVal
 
-    mark_name_id = sa.orm.mapped_column(
-        sa.Integer, sa.ForeignKey(
-            Mark.id, ondelete='CASCADE', onupdate='CASCADE'), sort_order=10
+    mark_name_id = _column(
+        sa.Integer, _cascade_fk(Mark.id)
     )
-    multicore_amount_id = sa.orm.mapped_column(
-        sa.Integer, sa.ForeignKey(
-            Amount.id, ondelete='CASCADE', onupdate='CASCADE'), sort_order=10
+    multicore_amount_id = _column(
+        sa.Integer, _cascade_fk(Amount.id)
     )
-    cable_range_id = sa.orm.mapped_column(
-        sa.Integer, sa.ForeignKey(
-            RangeVal.id, ondelete='CASCADE', onupdate='CASCADE'), sort_order=10
+    cable_range_id = _column(
+        sa.Integer, _cascade_fk(RangeVal.id)
     )
-    continuous_current = sa.orm.mapped_column(
-        sa.Numeric(5, 2), nullable=False, sort_order=10
+    continuous_current = _column(
+        sa.Numeric(5, 2), nullable=False
     )
-    resistance_r1 = sa.orm.mapped_column(
-        sa.Numeric(8, 5), nullable=False, sort_order=10
+    resistance_r1 = _column(
+        sa.Numeric(8, 5), nullable=False
     )
-    reactance_x1 = sa.orm.mapped_column(
-        sa.Numeric(8, 5), nullable=False, sort_order=10
+    reactance_x1 = _column(
+        sa.Numeric(8, 5), nullable=False
     )
-    resistance_r0 = sa.orm.mapped_column(
-        sa.Numeric(8, 5), nullable=False, sort_order=10
+    resistance_r0 = _column(
+        sa.Numeric(8, 5), nullable=False
     )
-    reactance_x0 = sa.orm.mapped_column(
-        sa.Numeric(8, 5), nullable=False, sort_order=10
+    reactance_x0 = _column(
+        sa.Numeric(8, 5), nullable=False
     )
 
     # relationships
-    marks = sa.orm.relationship('Mark', back_populates='cables')
-    amounts = sa.orm.relationship('Amount', back_populates='cables')
-    ranges = sa.orm.relationship('RangeVal', back_populates='cables')
+    marks = sa.orm.relationship('Mark', back_populates='cables', lazy='selectin')
+    amounts = sa.orm.relationship('Amount', back_populates='cables', lazy='selectin')
+    ranges = sa.orm.relationship('RangeVal', back_populates='cables', lazy='selectin')
 
 
 ############################################
@@ -254,12 +267,12 @@ class Device(BaseMixin, Base):
     Describes a table of switching devices: automatic current breaker, switches, etc.
 
     """
-    device_type = sa.orm.mapped_column(
-        sa.String(25), nullable=False, unique=True, sort_order=10
+    device_type = _column(
+        sa.String(25), nullable=False, unique=True
     )
 
     # relationships
-    current_breakers = sa.orm.relationship('CurrentBreaker', back_populates='devices')
+    current_breakers = sa.orm.relationship('CurrentBreaker', back_populates='devices', lazy='raise')
 
 
 class CurrentNominal(BaseMixin, Base):
@@ -267,12 +280,12 @@ class CurrentNominal(BaseMixin, Base):
     The class describes a table of the switching devices current nominals.
 
     """
-    current_value = sa.orm.mapped_column(
-        sa.Integer, nullable=False, unique=True, sort_order=10
+    current_value = _column(
+        sa.Integer, nullable=False, unique=True
     )
 
     # relationships
-    current_breakers = sa.orm.relationship('CurrentBreaker', back_populates='current_nominals')
+    current_breakers = sa.orm.relationship('CurrentBreaker', back_populates='current_nominals', lazy='raise')
 
 
 class CurrentBreaker(JoinedMixin, BaseMixin, Base):
@@ -284,30 +297,28 @@ class CurrentBreaker(JoinedMixin, BaseMixin, Base):
     """
     SUBTABLES = Device, CurrentNominal
 
-    device_type_id = sa.orm.mapped_column(
-        sa.Integer, sa.ForeignKey(
-            Device.id, ondelete='CASCADE', onupdate='CASCADE'
-        ), sort_order=10)
-    current_value_id = sa.orm.mapped_column(
-        sa.Integer, sa.ForeignKey(
-            CurrentNominal.id, ondelete='CASCADE', onupdate='CASCADE'
-        ), sort_order=10)
-    resistance_r1 = sa.orm.mapped_column(
-        sa.Numeric(8, 5), nullable=False, sort_order=10
+    device_type_id = _column(
+        sa.Integer, _cascade_fk(Device.id)
     )
-    reactance_x1 = sa.orm.mapped_column(
-        sa.Numeric(8, 5), nullable=True, default=0, sort_order=10
+    current_value_id = _column(
+        sa.Integer, _cascade_fk(CurrentNominal.id)
     )
-    resistance_r0 = sa.orm.mapped_column(
-        sa.Numeric(8, 5), nullable=True, default=0, sort_order=10
+    resistance_r1 = _column(
+        sa.Numeric(8, 5), nullable=False
     )
-    reactance_x0 = sa.orm.mapped_column(
-        sa.Numeric(8, 5), nullable=True, default=0, sort_order=10
+    reactance_x1 = _column(
+        sa.Numeric(8, 5), nullable=True, default=0
+    )
+    resistance_r0 = _column(
+        sa.Numeric(8, 5), nullable=True, default=0
+    )
+    reactance_x0 = _column(
+        sa.Numeric(8, 5), nullable=True, default=0
     )
 
     # relationships
-    devices = sa.orm.relationship('Device', back_populates='current_breakers')
-    current_nominals = sa.orm.relationship('CurrentNominal', back_populates='current_breakers')
+    devices = sa.orm.relationship('Device', back_populates='current_breakers', lazy='selectin')
+    current_nominals = sa.orm.relationship('CurrentNominal', back_populates='current_breakers', lazy='selectin')
 
 
 class OtherContact(BaseMixin, Base):
@@ -315,23 +326,27 @@ class OtherContact(BaseMixin, Base):
     The class describes a table of the others resistances.
 
     """
-    contact_type = sa.orm.mapped_column(
-        sa.String(25), nullable=False, unique=True, sort_order=10
+    contact_type = _column(
+        sa.String(25), nullable=False, unique=True
     )
-    resistance_r1 = sa.orm.mapped_column(
-        sa.Numeric(8, 5), nullable=False, sort_order=10
+    resistance_r1 = _column(
+        sa.Numeric(8, 5), nullable=False
     )
-    reactance_x1 = sa.orm.mapped_column(
-        sa.Numeric(8, 5), nullable=True, default=0, sort_order=10
+    reactance_x1 = _column(
+        sa.Numeric(8, 5), nullable=True, default=0
     )
-    resistance_r0 = sa.orm.mapped_column(
-        sa.Numeric(8, 5), nullable=True, default=0, sort_order=10
+    resistance_r0 = _column(
+        sa.Numeric(8, 5), nullable=True, default=0
     )
-    reactance_x0 = sa.orm.mapped_column(
-        sa.Numeric(8, 5), nullable=True, default=0, sort_order=10
+    reactance_x0 = _column(
+        sa.Numeric(8, 5), nullable=True, default=0
     )
 
 
+# Configure all mappers once at import, not lazily on the first query in a GUI thread
+sa.orm.configure_mappers()
+
+
 ###################################
 # Dataclasses for CRUD operations #
 ###################################
@@ -348,6 +363,11 @@ class InsertTrans:
     (default value is 0).
 
     """
+    __slots__ = (
+        '_power', '_voltage', '_vector_group', '_power_short_circuit', '_voltage_short_circuit', '_resistance_r1',
+        '_reactance_x1', '_resistance_r0', '_reactance_x0'
+    )
+
     power: int = field(default=Validator(log_info=True))
     voltage: Decimal = field(default=Validator(log_info=True))
     vector_group: str = field(default=Validator(log_info=True))
@@ -370,6 +390,8 @@ class UpdateTransOldSource:
     contain at least one not empty field as 'power', 'voltage' or 'vector_group'.
 
     """
+    __slots__ = ('_power', '_voltage', '_vector_group')
+
     power: int = field(default=Validator())
     voltage: Decimal = field(default=Validator())
     vector_group: str = field(default=Validator())
@@ -385,6 +407,8 @@ class UpdateTransNewSource:
     contain at least one not empty field as 'power', 'voltage' or 'vector_group'.
 
     """
+    __slots__ = ('_power', '_voltage', '_vector_group')
+
     power: int = field(default=Validator())
     voltage: Decimal = field(default=Validator())
     vector_group: str = field(default=Validator())
@@ -402,6 +426,11 @@ class UpdateTransRow:
     or 'reactance_x0'.
 
     """
+    __slots__ = (
+        '_power_short_circuit', '_voltage_short_circuit', '_resistance_r1', '_reactance_x1', '_resistance_r0',
+        '_reactance_x0'
+    )
+
     power_short_circuit: Decimal = field(default=Validator())
     voltage_short_circuit: Decimal = field(default=Validator())
     resistance_r1: Decimal = field(default=Validator())
@@ -420,6 +449,8 @@ class DeleteTrans:
     field as 'power', 'voltage' or 'vector_group'.
 
     """
+    __slots__ = ('_power', '_voltage', '_vector_group')
+
     power: int = field(default=Validator())
     voltage: Decimal = field(default=Validator())
     vector_group: str = field(default=Validator())
@@ -439,6 +470,11 @@ class InsertCable:
     are optional (default value is 0).
 
     """
+    __slots__ = (
+        '_mark_name', '_multicore_amount', '_cable_range', '_continuous_current', '_resistance_r1', '_reactance_x1',
+        '_resistance_r0', '_reactance_x0'
+    )
+
     mark_name: str = field(default=Validator(log_info=True))
     multicore_amount: int = field(default=Validator(log_info=True))
     cable_range: Decimal = field(default=Validator(log_info=True))
@@ -461,6 +497,8 @@ class UpdateCableOldSource:
     or 'cable_range'.
 
     """
+    __slots__ = ('_mark_name', '_multicore_amount', '_cable_range')
+
     mark_name: str = field(default=Validator())
     multicore_amount: int = field(default=Validator())
     cable_range: Decimal = field(default=Validator())
@@ -477,6 +515,8 @@ class UpdateCableNewSource:
     or 'cable_range'.
 
     """
+    __slots__ = ('_mark_name', '_multicore_amount', '_cable_range')
+
     mark_name: str = field(default=Validator())
     multicore_amount: int = field(default=Validator())
     cable_range: Decimal = field(default=Validator())
@@ -493,6 +533,8 @@ class UpdateCableRow:
     'reactance_x1', 'resistance_r0' or 'reactance_x0'.
 
     """
+    __slots__ = ('_continuous_current', '_resistance_r1', '_reactance_x1', '_resistance_r0', '_reactance_x0')
+
     continuous_current: Decimal = field(default=Validator())
     resistance_r1: Decimal = field(default=Validator())
     reactance_x1: Decimal = field(default=Validator())
@@ -510,6 +552,8 @@ class DeleteCable:
     empty field as 'mark_name', 'multicore_amount' or 'cable_range'.
 
     """
+    __slots__ = ('_mark_name', '_multicore_amount', '_cable_range')
+
     mark_name: str = field(default=Validator())
     multicore_amount: int = field(default=Validator())
     cable_range: Decimal = field(default=Validator())
@@ -529,6 +573,8 @@ class InsertContact:
     (default value is 0).
 
     """
+    __slots__ = ('_device_type', '_current_value', '_resistance_r1', '_reactance_x1', '_resistance_r0', '_reactance_x0')
+
     device_type: str = field(default=Validator(log_info=True))
     current_value: int = field(default=Validator(log_info=True))
 
@@ -548,6 +594,8 @@ class UpdateContactOldSource:
     contain at least one not empty field as 'device_type' or 'current_value'.
 
     """
+    __slots__ = ('_device_type', '_current_value')
+
     device_type: str = field(default=Validator())
     current_value: int = field(default=Validator())
 
@@ -562,6 +610,8 @@ class UpdateContactNewSource:
     contain at least one not empty field as 'device_type' or 'current_value'.
 
     """
+    __slots__ = ('_device_type', '_current_value')
+
     device_type: str = field(default=Validator())
     current_value: int = field(default=Validator())
 
@@ -577,6 +627,8 @@ class UpdateContactRow:
     'resistance_r0' or 'reactance_x0'.
 
     """
+    __slots__ = ('_resistance_r1', '_reactance_x1', '_resistance_r0', '_reactance_x0')
+
     resistance_r1: Decimal = field(default=Validator())
     reactance_x1: Decimal = field(default=Validator())
     resistance_r0: Decimal = field(default=Validator())
@@ -593,6 +645,8 @@ class DeleteContact:
     field as 'device_type' or 'current_value'.
 
     """
+    __slots__ = ('_device_type', '_current_value')
+
     device_type: str = field(default=Validator())
     current_value: int = field(default=Validator())
 
@@ -610,6 +664,8 @@ class InsertResist:
     'contact_type' field. Other fields are optional (default value is 0).
 
     """
+    __slots__ = ('_contact_type', '_resistance_r1', '_reactance_x1', '_resistance_r0', '_reactance_x0')
+
     contact_type: str = field(default=Validator(log_info=True))
 
     resistance_r1: Decimal = field(default=Validator(default=0))
@@ -628,6 +684,8 @@ class UpdateResistOldSource:
     contain not empty 'contact_type' field.
 
     """
+    __slots__ = ('_contact_type',)
+
     contact_type: str = field(default=Validator())
 
 
@@ -641,6 +699,8 @@ class UpdateResistNewSource:
     contain not empty 'contact_type' field.
 
     """
+    __slots__ = ('_contact_type',)
+
     contact_type: str = field(default=Validator())
 
 
@@ -654,6 +714,8 @@ class UpdateResistRow:
     contain not empty 'contact_type' field.
 
     """
+    __slots__ = ('_resistance_r1', '_reactance_x1', '_resistance_r0', '_reactance_x0')
+
     resistance_r1: Decimal = field(default=Validator())
     reactance_x1: Decimal = field(default=Validator())
     resistance_r0: Decimal = field(default=Validator())
@@ -670,4 +732,6 @@ class DeleteResist:
     contain not empty 'contact_type' field.
 
     """
+    __slots__ = ('_contact_type',)
+
     contact_type: str = field(default=Validator())
@@ -6,6 +6,9 @@ Modules:
     - figures: The module contains classes for drawing matplotlib figures in the GUI PyQt5.
     - windows: The module contains GUI windows templates, using PyQt5 and Matplotlib.
       Classes are based on ui files, developed by QtDesigner and customized.
+    - ui_main_window, ui_db_browser, ui_confirm: The modules are compiled from ui files by pyuic5,
+      after editing ui file the module should be compiled again, for example:
+      'pyuic5 --import-from=shortcircuitcalc.gui --resource-suffix= -o ui_confirm.py confirm.ui'.
 
 """
 
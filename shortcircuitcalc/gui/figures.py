@@ -15,22 +15,21 @@ Classes:
 
 from __future__ import annotations
 import typing as ty
-from io import BytesIO
 from collections import namedtuple
-from functools import singledispatchmethod
+from decimal import Decimal
+from functools import lru_cache
 
 import logging
+import threading
 import numpy as np
 import pandas as pd
-from matplotlib import figure, axes, gridspec, image
+import sqlalchemy as sa
+from matplotlib import figure, axes, gridspec, image, transforms
 from matplotlib.widgets import CheckButtons
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
-import cairosvg
-from PIL import Image
 
 from shortcircuitcalc.tools import (
-    ChainsSystem, ElemChain,
-    config_manager
+    ChainsSystem,
+    config_manager, session_scope
 )
 from shortcircuitcalc.database import (
     PowerNominal, VoltageNominal, Scheme,
@@ -39,6 +38,7 @@ from shortcircuitcalc.database import (
     OtherContact,
 
     BaseElement, T, Q, QF, QS, W, R, Line, Arc,
+    BT
 )
 from shortcircuitcalc.config import GRAPHS_DIR, GUI_DIR
 
@@ -61,6 +61,15 @@ class ResultsFigure:
 
     """
     LOGS_NAME = 'Results presentation'
+    # Vertical positions of the cell labels by their count
+    __LABELS_POSITIONS = {1: (0.25,), 2: (0.375, 0.125), 3: (0.375, 0.25, 0.125)}
+    # Tables of every cell have one row, so their colours are shared
+    __RESISTANCE_LABELS = ('r1', 'x1', 'r0', 'x0')
+    __RESISTANCE_COL_COLOURS = ('#9999FF',) * len(__RESISTANCE_LABELS)
+    __RESISTANCE_CELL_COLOURS = (('#CCCCFF',) * len(__RESISTANCE_LABELS),)
+    __SHORT_CIRCUIT_LABELS = ('I_k(3)', 'I_k(2)', 'I_k(1)')
+    __SHORT_CIRCUIT_COL_COLOURS = ('#FFCC99',) * len(__SHORT_CIRCUIT_LABELS)
+    __SHORT_CIRCUIT_CELL_COLOURS = (('#FFE5CC',) * len(__SHORT_CIRCUIT_LABELS),)
 
     def __init__(self, schem: ChainsSystem) -> None:
         self.schem = schem
@@ -69,29 +78,61 @@ class ResultsFigure:
         self.ncols = len(self.schem)
 
         self.fig = figure.Figure(figsize=(self.ncols * 5, self.nrows * 1))
-        self.fig.canvas = FigureCanvasQTAgg(self.fig)
-
-        self.ax = self.fig.canvas.figure.subplots(self.nrows, self.ncols, squeeze=False)
+        self.ax = self.fig.subplots(
+            self.nrows, self.ncols, squeeze=False,
+            gridspec_kw=dict(wspace=0.01, hspace=0, left=0.01, right=0.99, bottom=0.01, top=0.99)
+        )
 
         self.checks = dict()
+        self.__backgrounds = dict()
+        self.fig.canvas.mpl_connect('draw_event', lambda event: self.__backgrounds.clear())
 
-        self.fig.subplots_adjust(wspace=0.01, hspace=0, left=0.01, right=0.99, bottom=0.01, top=0.99)
+        self.rax = self.__check_axes()
         self.__draw_figure()
         self.__off_axis()
-        self.fig.subplots_adjust(wspace=0.01, hspace=0, left=0.01, right=0.99, bottom=0.01, top=0.99)
 
         logger.info('Results system successfully created %s' % self.schem)
 
+    def __check_axes(self) -> np.ndarray:
+        """
+        Service method, that creates the check buttons axes of all cells at once.
+
+        Each check button axes covers the lower half of the element graph,
+        which takes the left fifth of the cell.
+
+        Returns:
+            np.ndarray: check buttons axes in the same layout as the cells axes.
+
+        """
+        rax = np.empty_like(self.ax, dtype=object)
+        for idx, row in enumerate(self.schem):
+            for col in range(len(row)):
+                position = transforms.TransformedBbox(
+                    transforms.Bbox.from_bounds(0, 0, 0.2, 1),
+                    self.ax[col, idx].transAxes - self.fig.transSubfigure
+                )
+                rax[col, idx] = self.fig.add_axes(
+                    [position.x0, position.y0, position.width / 2, position.height / 2], frameon=False
+                )
+                rax[col, idx].axis('off')
+        return rax
+
     def __draw_figure(self) -> None:
         """
         Draw all elements in the figure.
 
         """
         for idx, row in enumerate(self.schem):
-            for col in range(len(row)):
-                self.__draw_cells(idx, row, col)
+            currents = row.cumulative_currents_short_circuit()
+            if isinstance(row.obj, ty.Mapping):
+                keys, values = tuple(row.obj.keys()), tuple(row.obj.values())
+            else:
+                keys, values = (None,) * len(row), tuple(row.obj)
+            for col, (key, elem) in enumerate(zip(keys, values)):
+                self.__draw_cells(idx, col, key, elem, currents[col])
 
-    def __draw_cells(self, idx: int, row: ElemChain, col: int) -> None:
+    def __draw_cells(self, idx: int, col: int, key: ty.Optional[str], elem: BaseElem,
+                     currents: ty.Tuple[Decimal, Decimal, Decimal]) -> None:
         """
         Contain one cell configuration.
 
@@ -99,8 +140,11 @@ class ResultsFigure:
 
         Args:
             idx (int): index of row in the figure.
-            row (ElemChain): row of the figure.
             col (int): index of column in the figure.
+            key (Optional[str]): project name of the element if the row is a mapping.
+            elem (BaseElem): element of the cell.
+            currents (Tuple[Decimal, Decimal, Decimal]): three-phase, two-phase and one-phase
+                short circuit currents at the end of the element.
 
         Draw:
             - element label and project name if exists,
@@ -109,175 +153,59 @@ class ResultsFigure:
             - element short circuit current values.
 
         """
-        iter_values = None
-        map_keys = None
-        map_values = None
-
-        if isinstance(row.obj, ty.Mapping):
-            map_keys = tuple(row.obj.keys())
-            map_values = tuple(row.obj.values())
-        else:
-            iter_values = row
-
-        h_align = 'center'
-        v_align = 'center'
-        f_size = 9
-        f_weight = 'bold'
-
         axx = self.ax[col, idx].inset_axes([0, 0, 0.2, 1], anchor='SW')
         axx.axis('off')
 
-        rax = self.fig.add_axes([axx.get_position().x0, axx.get_position().y0,
-                                 axx.get_position().width / 2, axx.get_position().height / 2],
-                                frameon=False)
-        rax.axis('off')
+        rax = self.rax[col, idx]
 
-        if isinstance(row.obj, ty.Mapping):
-            if isinstance(map_values[col], (T, W)):
-                self.ax[col][idx].text(
-                    0.3, 0.375, map_keys[col],
-                    ha=h_align, va=v_align, fontsize=f_size, weight=f_weight
-                )
-                self.ax[col][idx].text(
-                    0.3, 0.25, ' '.join(str(map_values[col]).split()[:2]),
-                    ha=h_align, va=v_align, fontsize=f_size, weight=f_weight
-                )
-                self.ax[col][idx].text(
-                    0.3, 0.125, str(map_values[col]).split()[-1],
-                    ha=h_align, va=v_align, fontsize=f_size, weight=f_weight
-                )
-            else:
-                self.ax[col][idx].text(
-                    0.3, 0.375, map_keys[col],
-                    ha=h_align, va=v_align, fontsize=f_size, weight=f_weight
-                )
-                self.ax[col][idx].text(
-                    0.3, 0.125, str(map_values[col]),
-                    ha=h_align, va=v_align, fontsize=f_size, weight=f_weight
-                )
+        labels = [] if key is None else [key]
+        if isinstance(elem, (T, W)):
+            labels.extend((' '.join(str(elem).split()[:2]), str(elem).split()[-1]))
         else:
-            if isinstance(iter_values[col], (T, W)):
-                self.ax[col][idx].text(
-                    0.3, 0.375, ' '.join(str(iter_values[col]).split()[:2]),
-                    ha=h_align, va=v_align, fontsize=f_size, weight=f_weight
-                )
-                self.ax[col][idx].text(
-                    0.3, 0.125, str(iter_values[col]).split()[-1],
-                    ha=h_align, va=v_align, fontsize=f_size, weight=f_weight
-                )
-            else:
-                self.ax[col][idx].text(
-                    0.3, 0.25, str(iter_values[col]),
-                    ha=h_align, va=v_align, fontsize=f_size, weight=f_weight
-                )
-
-        def __get_resistance_df(vals: ty.Sequence) -> pd.DataFrame:
-            """
-            Service method, that returns resistance dataframe.
-
-            Args:
-                vals (ty.Sequence): The chain of elements.
-
-            Returns:
-                pd.DataFrame: resistance dataframe.
+            labels.append(str(elem))
 
-            """
-            return pd.DataFrame.from_dict({
-                'r1': [vals[col].resistance_r1],
-                'x1': [vals[col].reactance_x1],
-                'r0': [vals[col].resistance_r0],
-                'x0': [vals[col].reactance_x0]
-            })
+        for label, y_pos in zip(labels, self.__LABELS_POSITIONS[len(labels)]):
+            self.ax[col][idx].text(
+                0.3, y_pos, label,
+                ha='center', va='center', fontsize=9, weight='bold'
+            )
 
-        if isinstance(row.obj, ty.Mapping):
-            resistance_df = __get_resistance_df(map_values)
-        else:
-            resistance_df = __get_resistance_df(iter_values)
+        resistance_rows = [[elem.resistance_r1, elem.reactance_x1, elem.resistance_r0, elem.reactance_x0]]
 
         resistance_table = self.ax[col][idx].table(  # noqa
-            cellText=resistance_df.values, colLabels=resistance_df.columns,
+            cellText=resistance_rows, colLabels=self.__RESISTANCE_LABELS,
             loc='center', cellLoc='center', bbox=[0.2, 0.5, 0.8, 0.5],
-            colColours=('#9999FF',) * len(resistance_df.columns),
-            cellColours=(('#CCCCFF',) * len(resistance_df.columns),) * len(resistance_df.index))
-
-        background = self.fig.canvas.copy_from_bbox(self.ax[col][idx].bbox)
-
-        def __get_images(vals: ty.Sequence) -> ty.List[Image.Image]:
-            """
-            Service method, that returns images list with one/three phases element.
-
-            Args:
-                vals (Sequence): The chain of elements.
-
-            Returns:
-                List[Image.Image]: images list with one/three phases element graphs.
-
-            """
-            return [
-                Image.open(BytesIO(
-                    cairosvg.svg2png(url=str(
-                        _Visualizer(vals[col], config_manager('SYSTEM_PHASES'))
-                    )))
-                ),
-                Image.open(BytesIO(
-                    cairosvg.svg2png(url=str(
-                        _Visualizer(vals[col], config_manager('SYSTEM_PHASES')).create_invert
-                    )))
-                )
-            ]
+            colColours=self.__RESISTANCE_COL_COLOURS,
+            cellColours=self.__RESISTANCE_CELL_COLOURS)
 
-        if isinstance(row.obj, ty.Mapping):
-            images = __get_images(map_values)
-        else:
-            images = __get_images(iter_values)
-
-        axx.imshow(images[0])
-
-        def __get_short_circuit_df(vals: ty.Sequence) -> ty.List[pd.DataFrame]:
-            """
-            Service method, that returns short circuit table with one/three phases element calculations.
-
-            Args:
-                vals (Sequence): The chain of elements.
-
-            Returns:
-                List[pd.DataFrame]: short circuit table with one/three phases element calculations.
-
-            """
-            return [
-                pd.DataFrame.from_dict({
-                    'I_k(3)': [ElemChain(vals[:col + 1]).three_phase_current_short_circuit],
-                    'I_k(2)': [ElemChain(vals[:col + 1]).two_phase_current_short_circuit],
-                    'I_k(1)': [ElemChain(vals[:col + 1]).one_phase_current_short_circuit]
-                }),
-                pd.DataFrame.from_dict({
-                    'I_k(3)': ['-----'],
-                    'I_k(2)': ['-----'],
-                    'I_k(1)': [ElemChain(vals[:col + 1]).one_phase_current_short_circuit]
-                })
-            ]
-
-        if isinstance(row.obj, ty.Mapping):
-            short_circuit_df = __get_short_circuit_df(map_values)
-        else:
-            short_circuit_df = __get_short_circuit_df(iter_values)
+        # Only the shown graph is rasterized here, the inverted one
+        # is rasterized at the first click of the check button
+        phases = config_manager('SYSTEM_PHASES')
+        graphs = [_graph_path(elem, phases), _graph_path(elem, 1 if phases == 3 else 3)]
+
+        graph_image = axx.imshow(_rasterize(graphs[0]))
+
+        short_circuit_rows = [
+            [[currents[0], currents[1], currents[2]]],
+            [['-----', '-----', currents[2]]]
+        ]
 
         short_circuit_table = [
             self.__redraw_table(
-                self.ax, col, idx, short_circuit_df,
-                config_manager('SYSTEM_PHASES') != 3
+                self.ax, col, idx, short_circuit_rows,
+                phases != 3
             )
         ]
 
         check = CheckButtons(
-            rax, ['3ph'], [config_manager('SYSTEM_PHASES') == 3], label_props={'color': 'red'}
+            rax, ['3ph'], [phases == 3], label_props={'color': 'red'}
         )
         check.on_clicked(lambda label, i=col, j=idx: self.__callback(label, i, j))
         Button = namedtuple(
-            'Button', ('check', 'ax', 'rax', 'images', 'sc_df', 'sc_table', 'back')
+            'Button', ('check', 'ax', 'rax', 'img', 'graphs', 'sc_rows', 'sc_table')
         )
         self.checks[col, idx] = Button(
-            check, self.ax[col, idx], rax, images, short_circuit_df, short_circuit_table, background
+            check, self.ax[col, idx], rax, graph_image, graphs, short_circuit_rows, short_circuit_table
         )
 
     def __callback(self, label, i, j) -> None:  # noqa
@@ -296,27 +224,56 @@ class ResultsFigure:
 
         """
         # Replace graph
-        temp_axx = [c for c in self.checks[i, j].ax.get_children() if isinstance(c, axes.Axes)][0]
-        temp_img = self.checks[i, j].images.pop()
-        self.checks[i, j].images.insert(0, temp_img)
-        temp_axx.images[0].set_data(temp_img)
+        temp_graph = self.checks[i, j].graphs.pop()
+        self.checks[i, j].graphs.insert(0, temp_graph)
+        self.checks[i, j].img.set_data(_rasterize(temp_graph))
 
         # Replace table view
-        ax_objects = self.checks[i, j].ax.get_children()
-        ax_objects[ax_objects.index(self.checks[i, j].sc_table[0])].remove()
-        self.checks[i, j].sc_table.clear()
+        self.checks[i, j].sc_table.pop().remove()
         new_table = self.__redraw_table(
-            self.ax, i, j, self.checks[i, j].sc_df, not self.checks[i, j].check.get_status()[0]
+            self.ax, i, j, self.checks[i, j].sc_rows, not self.checks[i, j].check.get_status()[0]
         )
-        ax_objects.append(new_table)
         self.checks[i, j].sc_table.append(new_table)
 
-        # Blitting / fast refreshing fig
-        self.fig.canvas.restore_region(self.checks[i, j].back)
-        self.fig.draw_artist(self.checks[i, j].ax)
+        # Blitting / fast refreshing fig, only the toggled artists are drawn over the cell background
+        self.__restore_background(i, j)
+        self.fig.draw_artist(self.checks[i, j].img)
+        self.fig.draw_artist(new_table)
         self.fig.draw_artist(self.checks[i, j].rax)
         self.fig.canvas.blit(self.checks[i, j].ax.bbox)
-        self.fig.canvas.flush_events()
+
+    def __restore_background(self, i: int, j: int) -> None:
+        """
+        Service method, that restores the cell background before blitting.
+
+        The cell background is painted with the figure patch clipped to the cell and
+        the static cell artists at the first click and stored, next clicks only restore
+        the stored region. The graph image and the short circuit table are hidden
+        while storing, because they are toggled and drawn over the region.
+        Stored regions are dropped on every full drawing of the figure,
+        because the canvas could be resized.
+
+        Args:
+            i (int): The column index.
+            j (int): The row index.
+
+        """
+        if (i, j) in self.__backgrounds:
+            self.fig.canvas.restore_region(self.__backgrounds[i, j])
+        else:
+            bbox = self.checks[i, j].ax.bbox
+            self.fig.patch.set_clip_box(bbox)
+            self.fig.draw_artist(self.fig.patch)
+            self.fig.patch.set_clip_box(None)
+
+            toggled = (self.checks[i, j].img, *self.checks[i, j].sc_table)
+            for artist in toggled:
+                artist.set_visible(False)
+            self.fig.draw_artist(self.checks[i, j].ax)
+            for artist in toggled:
+                artist.set_visible(True)
+
+            self.__backgrounds[i, j] = self.fig.canvas.copy_from_bbox(bbox)
 
     def __off_axis(self) -> None:
         """
@@ -328,7 +285,7 @@ class ResultsFigure:
                 self.ax[col][idx].axis('off')
 
     @staticmethod
-    def __redraw_table(axe: axes, h_pos: int, v_pos: int, df: ty.List[pd.DataFrame],
+    def __redraw_table(axe: axes, h_pos: int, v_pos: int, rows: ty.List[ty.List[ty.List[ty.Any]]],
                        switch_bool: bool) -> axes.Axes:
         """
         Service method, that redraws table.
@@ -337,7 +294,7 @@ class ResultsFigure:
             axe (Axes): The table axes.
             h_pos (int): The horizontal position.
             v_pos (int): The vertical position.
-            df (List[pd.DataFrame]): The table dataframes.
+            rows (List[List[List[Any]]]): The three-phase and one-phase table rows.
             switch_bool (bool): The switch boolean.
 
         Returns:
@@ -345,44 +302,106 @@ class ResultsFigure:
 
         """
         return axe[h_pos][v_pos].table(
-            cellText=df[switch_bool].values, colLabels=df[switch_bool].columns,
+            cellText=rows[switch_bool], colLabels=ResultsFigure.__SHORT_CIRCUIT_LABELS,
             loc='center', cellLoc='center', bbox=[0.4, 0, 0.6, 0.5],
-            colColours=('#FFCC99',) * len(df[switch_bool].columns),
-            cellColours=(('#FFE5CC',) * len(df[switch_bool].columns),) * len(df[switch_bool].index))
+            colColours=ResultsFigure.__SHORT_CIRCUIT_COL_COLOURS,
+            cellColours=ResultsFigure.__SHORT_CIRCUIT_CELL_COLOURS)
 
 
 class CatalogFigure:
     """
     The class for drawing catalog figure in the GUI.
 
+    Public methods:
+        - invalidate_cache: The method removes the cached source tables.
+
+    Note:
+        Source tables are read from the database only at the first drawing
+        and after invalidating, because the catalog changes only by editing.
+        Figures are drawn in worker threads, so tables read before the last
+        invalidating are not cached.
+
     """
     LOGS_NAME = 'Catalog presentation'
+    __tables_cache: ty.Dict[BT, pd.DataFrame] = {}
+    __cache_generation = 0
+    __cache_lock = threading.Lock()
 
     def __init__(self) -> None:
+        with CatalogFigure.__cache_lock:
+            self.__generation = CatalogFigure.__cache_generation
+
         self.fig = figure.Figure()
         self.grid = gridspec.GridSpec(nrows=1, ncols=9)
         self.table_transparency = 0.7
         self.background_image = image.imread(GUI_DIR / 'resources' / 'images' / 'info_catalog_back.jpg')
         self.dataframes = []
 
-        self.__transformers_dataframe()
-        self.__cables_dataframe()
-        self.__devices_dataframe()
-        self.__contacts_dataframe()
+        # All catalog tables are read in one database session
+        with session_scope() as session:
+            self.__transformers_dataframe(session)
+            self.__cables_dataframe(session)
+            self.__devices_dataframe(session)
+            self.__contacts_dataframe(session)
         self.__figure_options()
         self.__set_background()
 
-    def __transformers_dataframe(self) -> None:
+    @classmethod
+    def invalidate_cache(cls, *tables: BT) -> None:
+        """
+        The method removes the cached source tables.
+
+        Args:
+            *tables (BT): The changed tables, if not specified, all tables are removed.
+
+        """
+        with cls.__cache_lock:
+            cls.__cache_generation += 1
+            if not tables:
+                cls.__tables_cache.clear()
+            for table in tables:
+                cls.__tables_cache.pop(table, None)
+
+    def __read_table(self, table: BT, session: sa.orm.Session) -> pd.DataFrame:
+        """
+        Service method, returns the cached source table or reads it from the database.
+
+        The read table is cached only if the cache was not invalidated
+        since the figure drawing started.
+
+        Args:
+            table (BT): The source table.
+            session (sa.orm.Session): The opened database session.
+
+        Returns:
+            pd.DataFrame: The source table dataframe.
+
+        """
+        with CatalogFigure.__cache_lock:
+            if table in CatalogFigure.__tables_cache:
+                return CatalogFigure.__tables_cache[table]
+
+        dataframe = table.read_table(session=session)
+
+        with CatalogFigure.__cache_lock:
+            if self.__generation == CatalogFigure.__cache_generation:
+                CatalogFigure.__tables_cache[table] = dataframe
+        return dataframe
+
+    def __transformers_dataframe(self, session: sa.orm.Session) -> None:
         """
         The method draws transformers dataframe in catalog.
 
+        Args:
+            session (sa.orm.Session): The opened database session.
+
         """
-        power_col = PowerNominal.read_table().loc[:, 'power']
-        voltage_col = VoltageNominal.read_table().loc[:, 'voltage']
-        vector_group_col = Scheme.read_table().loc[:, 'vector_group']
+        power_col = self.__read_table(PowerNominal, session).loc[:, 'power']
+        voltage_col = self.__read_table(VoltageNominal, session).loc[:, 'voltage']
+        vector_group_col = self.__read_table(Scheme, session).loc[:, 'vector_group']
         transformers_df = pd.concat(
             (power_col, voltage_col, vector_group_col), axis=1
-        ).replace(np.nan, '---')
+        ).fillna('---')
 
         self.__set_dataframe(
             title='Transformers',
@@ -392,15 +411,18 @@ class CatalogFigure:
             cell_color='#CCCCFF'
         )
 
-    def __cables_dataframe(self) -> None:
+    def __cables_dataframe(self, session: sa.orm.Session) -> None:
         """
         The method draws cables / wires dataframe in catalog.
 
+        Args:
+            session (sa.orm.Session): The opened database session.
+
         """
-        mark_col = Mark.read_table().loc[:, 'mark_name']
-        multicore_amount_col = Amount.read_table().loc[:, 'multicore_amount']
-        range_col = RangeVal.read_table().loc[:, 'cable_range']
-        cables_df = pd.concat((mark_col, multicore_amount_col, range_col), axis=1).replace(np.nan, '---')
+        mark_col = self.__read_table(Mark, session).loc[:, 'mark_name']
+        multicore_amount_col = self.__read_table(Amount, session).loc[:, 'multicore_amount']
+        range_col = self.__read_table(RangeVal, session).loc[:, 'cable_range']
+        cables_df = pd.concat((mark_col, multicore_amount_col, range_col), axis=1).fillna('---')
 
         self.__set_dataframe(
             title='Cables / wires',
@@ -410,16 +432,19 @@ class CatalogFigure:
             cell_color='#FFCCCC'
         )
 
-    def __devices_dataframe(self) -> None:
+    def __devices_dataframe(self, session: sa.orm.Session) -> None:
         """
         The method draws devices dataframe in catalog.
 
+        Args:
+            session (sa.orm.Session): The opened database session.
+
         """
-        device_col = Device.read_table().loc[:, 'device_type']
-        current_nominal_col = CurrentNominal.read_table().loc[:, 'current_value']
+        device_col = self.__read_table(Device, session).loc[:, 'device_type']
+        current_nominal_col = self.__read_table(CurrentNominal, session).loc[:, 'current_value']
         current_breakers_df = pd.concat(
             (device_col, current_nominal_col), axis=1
-        ).replace(np.nan, '---')
+        ).fillna('---')
 
         self.__set_dataframe(
             title='Circuit breaker devices',
@@ -429,12 +454,15 @@ class CatalogFigure:
             cell_color='#FFE5CC'
         )
 
-    def __contacts_dataframe(self) -> None:
+    def __contacts_dataframe(self, session: sa.orm.Session) -> None:
         """
         The method draws contacts dataframe in catalog.
 
+        Args:
+            session (sa.orm.Session): The opened database session.
+
         """
-        other_contacts_df = pd.DataFrame(OtherContact.read_table().loc[:, 'contact_type'])
+        other_contacts_df = pd.DataFrame(self.__read_table(OtherContact, session).loc[:, 'contact_type'])
 
         self.__set_dataframe(
             title='Other contacts',
@@ -471,8 +499,9 @@ class CatalogFigure:
 
         table.auto_set_column_width(col=list(range(len(df.columns))))
 
-        for cell in table._cells:  # noqa
-            table._cells[cell].set_alpha(self.table_transparency) # noqa
+        transparency = self.table_transparency
+        for cell in table.get_celld().values():
+            cell.set_alpha(transparency)
 
         self.dataframes.append(df)
 
@@ -501,112 +530,98 @@ class CatalogFigure:
         background_ax.imshow(self.background_image, aspect='auto')
 
 
-class _Visualizer:
-    # noinspection PyUnresolvedReferences
+@lru_cache(maxsize=64)
+def _rasterize(svg_path: str) -> np.ndarray:
     """
-    Service class returns an object path for drawing an element in the GUI.
+    Service function, returns the rasterized element graph.
 
-    Attributes:
-        element (BaseElem): element of electrical system.
-        phases_default (int): default count of phases.
+    Each graph is rendered by CairoSVG only once per process.
 
-    Public methods:
-        - create_invert: Create an inverted object path for drawing an element in the GUI.
+    Args:
+        svg_path (str): The path of the element graph svg file.
 
-    """
-    __PHASES_LIST = (1, 3)
+    Returns:
+        np.ndarray: The read-only RGBA image array.
 
-    def __init__(self, element: BaseElem, phases_default: int) -> None:
-        self._element = element
-        self._phases_default = phases_default
-        self._graphs = {
+    Note:
+        CairoSVG is imported at the first rendering, it loads the native
+        Cairo library and isn't needed until a results figure is drawn.
 
-            (T, 3, 'У/Ун-0'): GRAPHS_DIR / 'T_star_three.svg',
-            (T, 1, 'У/Ун-0'): GRAPHS_DIR / 'T_star_one.svg',
-            (T, 3, 'Д/Ун-11'): GRAPHS_DIR / 'T_triangle_three.svg',
-            (T, 1, 'Д/Ун-11'): GRAPHS_DIR / 'T_triangle_one.svg',
+    """
+    from cairosvg.parser import Tree
+    from cairosvg.surface import PNGSurface
 
-            (Q, 3): GRAPHS_DIR / 'Q_three.svg',
-            (Q, 1): GRAPHS_DIR / 'Q_one.svg',
-            (QF, 3): GRAPHS_DIR / 'QF_three.svg',
-            (QF, 1): GRAPHS_DIR / 'QF_one.svg',
-            (QS, 3): GRAPHS_DIR / 'QS_three.svg',
-            (QS, 1): GRAPHS_DIR / 'QS_one.svg',
+    surface = PNGSurface(Tree(url=svg_path), None, 96)
+    surface.cairo.flush()
+    width, height, stride = surface.cairo.get_width(), surface.cairo.get_height(), surface.cairo.get_stride()
 
-            (W, 3): GRAPHS_DIR / 'W_three.svg',
-            (W, 1): GRAPHS_DIR / 'W_one.svg',
+    # Cairo image data is native-endian premultiplied ARGB32, without PNG encoding / decoding
+    pixels = np.frombuffer(surface.cairo.get_data(), dtype=np.uint32).reshape(height, stride // 4)[:, :width]
+    alpha = (pixels >> 24) & 0xFF
+    channels = np.stack(((pixels >> 16) & 0xFF, (pixels >> 8) & 0xFF, pixels & 0xFF), axis=-1)
 
-            (R, 3): GRAPHS_DIR / 'R_three.svg',
-            (R, 1): GRAPHS_DIR / 'R_one.svg',
-            (Line, 3): GRAPHS_DIR / 'Line_three.svg',
-            (Line, 1): GRAPHS_DIR / 'Line_one.svg',
-            (Arc, 3): GRAPHS_DIR / 'Arc_three.svg',
-            (Arc, 1): GRAPHS_DIR / 'Arc_one.svg',
+    # Unpremultiply like the cairo PNG writer
+    safe_alpha = np.maximum(alpha, 1)[..., np.newaxis]
+    channels = np.where(alpha[..., np.newaxis] > 0, (channels * 255 + safe_alpha // 2) // safe_alpha, 0)
 
-        }
+    img_array = np.dstack((channels, alpha)).astype(np.uint8)
+    surface.finish()
+    img_array.setflags(write=False)
+    return img_array
 
-    @singledispatchmethod
-    def _display_element(self, element: BaseElem) -> None:
-        """
-        The method return the graph path for drawing an element in the GUI.
 
-        Args:
-            element (BaseElem): element of electrical system.
-
-        Raises:
-            NotImplementedError: if unknown type of element.
+_GRAPHS = {
 
-        """
-        logger.error(f'Unknown type of element: {type(element)}')
-        raise NotImplementedError
+    (T, 3, 'У/Ун-0'): str(GRAPHS_DIR / 'T_star_three.svg'),
+    (T, 1, 'У/Ун-0'): str(GRAPHS_DIR / 'T_star_one.svg'),
+    (T, 3, 'Д/Ун-11'): str(GRAPHS_DIR / 'T_triangle_three.svg'),
+    (T, 1, 'Д/Ун-11'): str(GRAPHS_DIR / 'T_triangle_one.svg'),
 
-    @_display_element.register(T)
-    def _(self, element: BaseElem) -> str:
-        """
-        The method return the graph path for drawing an element in the GUI.
+    (Q, 3): str(GRAPHS_DIR / 'Q_three.svg'),
+    (Q, 1): str(GRAPHS_DIR / 'Q_one.svg'),
+    (QF, 3): str(GRAPHS_DIR / 'QF_three.svg'),
+    (QF, 1): str(GRAPHS_DIR / 'QF_one.svg'),
+    (QS, 3): str(GRAPHS_DIR / 'QS_three.svg'),
+    (QS, 1): str(GRAPHS_DIR / 'QS_one.svg'),
 
-        The method return the graph path for drawing an element in the GUI
-        if element has type transformer (T).
+    (W, 3): str(GRAPHS_DIR / 'W_three.svg'),
+    (W, 1): str(GRAPHS_DIR / 'W_one.svg'),
 
-        Args:
-            element (BaseElem): element of electrical system with type T.
+    (R, 3): str(GRAPHS_DIR / 'R_three.svg'),
+    (R, 1): str(GRAPHS_DIR / 'R_one.svg'),
+    (Line, 3): str(GRAPHS_DIR / 'Line_three.svg'),
+    (Line, 1): str(GRAPHS_DIR / 'Line_one.svg'),
+    (Arc, 3): str(GRAPHS_DIR / 'Arc_three.svg'),
+    (Arc, 1): str(GRAPHS_DIR / 'Arc_one.svg'),
 
-        Returns:
-            str: graph path for drawing a T element in the GUI.
+}
 
-        """
-        return self._graphs[element.__class__, self._phases_default, self._element.vector_group]
 
-    @_display_element.register(Q)
-    @_display_element.register(W)
-    @_display_element.register(R)
-    def _(self, element: BaseElem) -> str:
-        """
-        The method return the graph path for drawing an element in the GUI.
-
-        The method return the graph path for drawing an element in the GUI if element
-        has one type of: contacts (Q), cables/wires (W) or other resistances (R).
+def _graph_path(element: BaseElem, phases: int) -> str:
+    """
+    Service function, returns the graph path for drawing an element in the GUI.
 
-        Args:
-            element (BaseElem): element of electrical system with type Q, W or R.
+    Transformers (T) are looked up by their vector group as well, contacts (Q),
+    cables/wires (W) and other resistances (R) only by type and count of phases.
 
-        Returns:
-            str: graph path for drawing a Q, W or R element in the GUI.
+    Args:
+        element (BaseElem): element of electrical system.
+        phases (int): count of phases.
 
-        """
-        return self._graphs[element.__class__, self._phases_default]
+    Returns:
+        str: graph path for drawing an element in the GUI.
 
-    @property
-    def create_invert(self) -> _Visualizer:
-        """
-        Create an inverted object path for drawing an element in the GUI.
+    Raises:
+        NotImplementedError: if unknown type of element.
 
-        """
-        if self._phases_default == _Visualizer.__PHASES_LIST[1]:
-            __phases = _Visualizer.__PHASES_LIST[0]
-        else:
-            __phases = _Visualizer.__PHASES_LIST[1]
-        return _Visualizer(self._element, __phases)
-
-    def __repr__(self):
-        return f'{self._display_element(self._element)}'
+    """
+    if isinstance(element, T):
+        key = type(element), phases, element.vector_group
+    else:
+        key = type(element), phases
+
+    try:
+        return _GRAPHS[key]
+    except KeyError:
+        logger.error(f'Unknown type of element: {type(element)}')
+        raise NotImplementedError
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'confirm.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_ConfirmWindow(object):
+    def setupUi(self, ConfirmWindow):
+        ConfirmWindow.setObjectName("ConfirmWindow")
+        ConfirmWindow.resize(400, 200)
+        ConfirmWindow.setMinimumSize(QtCore.QSize(400, 200))
+        ConfirmWindow.setMaximumSize(QtCore.QSize(400, 200))
+        ConfirmWindow.setStyleSheet("QDialog[objectName=\"ConfirmWindow\"] {\n"
+"    background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 rgba(255, 169, 0, 217), stop:1 rgba(255, 255, 255, 255));\n"
+"}")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(ConfirmWindow)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem)
+        self.textLabel = QtWidgets.QLabel(ConfirmWindow)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.textLabel.sizePolicy().hasHeightForWidth())
+        self.textLabel.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.textLabel.setFont(font)
+        self.textLabel.setStyleSheet("background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 20px;\n"
+"padding-right: 20 px;\n"
+"border-radius: 5px;")
+        self.textLabel.setObjectName("textLabel")
+        self.verticalLayout.addWidget(self.textLabel, 0, QtCore.Qt.AlignHCenter)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem1)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setContentsMargins(30, -1, 30, 20)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.yesButton = QtWidgets.QPushButton(ConfirmWindow)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.yesButton.setFont(font)
+        self.yesButton.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 30px;\n"
+"padding-right: 30 px;\n"
+"border-radius: 5px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 30px;\n"
+"padding-right: 30 px;\n"
+"border-radius: 5px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 30px;\n"
+"padding-right: 30 px;\n"
+"border-radius: 5px;\n"
+"}")
+        self.yesButton.setObjectName("yesButton")
+        self.horizontalLayout.addWidget(self.yesButton)
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem2)
+        self.noButton = QtWidgets.QPushButton(ConfirmWindow)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.noButton.setFont(font)
+        self.noButton.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 30px;\n"
+"padding-right: 30 px;\n"
+"border-radius: 5px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 30px;\n"
+"padding-right: 30 px;\n"
+"border-radius: 5px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 30px;\n"
+"padding-right: 30 px;\n"
+"border-radius: 5px;\n"
+"}")
+        self.noButton.setObjectName("noButton")
+        self.horizontalLayout.addWidget(self.noButton)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.verticalLayout_2.addLayout(self.verticalLayout)
+
+        self.retranslateUi(ConfirmWindow)
+        self.yesButton.clicked.connect(ConfirmWindow.accept) # type: ignore
+        self.noButton.clicked.connect(ConfirmWindow.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(ConfirmWindow)
+
+    def retranslateUi(self, ConfirmWindow):
+        _translate = QtCore.QCoreApplication.translate
+        ConfirmWindow.setWindowTitle(_translate("ConfirmWindow", "Confirmation"))
+        self.textLabel.setText(_translate("ConfirmWindow", "ARE YOU SURE?"))
+        self.yesButton.setText(_translate("ConfirmWindow", "YES"))
+        self.noButton.setText(_translate("ConfirmWindow", "NO"))
@@ -0,0 +1,2540 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'db_browser.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        Form.setObjectName("Form")
+        Form.resize(1024, 768)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(Form.sizePolicy().hasHeightForWidth())
+        Form.setSizePolicy(sizePolicy)
+        Form.setStyleSheet("QWidget[objectName=\"Form\"] {\n"
+"    background-color: qlineargradient(spread:pad, x1:0, y1:1, x2:0, y2:0, stop:0 rgba(255, 169, 0, 217), stop:1 rgba(255, 255, 255, 255));\n"
+"}")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(Form)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.centralWidget = QtWidgets.QWidget(Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.centralWidget.sizePolicy().hasHeightForWidth())
+        self.centralWidget.setSizePolicy(sizePolicy)
+        self.centralWidget.setObjectName("centralWidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralWidget)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.titleWidget = QtWidgets.QWidget(self.centralWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.titleWidget.sizePolicy().hasHeightForWidth())
+        self.titleWidget.setSizePolicy(sizePolicy)
+        self.titleWidget.setMinimumSize(QtCore.QSize(0, 60))
+        self.titleWidget.setObjectName("titleWidget")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.titleWidget)
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.iconLabel = QtWidgets.QLabel(self.titleWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.iconLabel.sizePolicy().hasHeightForWidth())
+        self.iconLabel.setSizePolicy(sizePolicy)
+        self.iconLabel.setMinimumSize(QtCore.QSize(120, 60))
+        self.iconLabel.setText("")
+        self.iconLabel.setObjectName("iconLabel")
+        self.horizontalLayout.addWidget(self.iconLabel)
+        self.manageButton = QtWidgets.QPushButton(self.titleWidget)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.manageButton.setFont(font)
+        self.manageButton.setStyleSheet("QPushButton {\n"
+"background-color: rgba(255, 169, 0, 217);\n"
+"color: rgb(0, 0, 0);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/icons/resources/icons/db_manage.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.manageButton.setIcon(icon)
+        self.manageButton.setIconSize(QtCore.QSize(24, 24))
+        self.manageButton.setCheckable(True)
+        self.manageButton.setObjectName("manageButton")
+        self.horizontalLayout.addWidget(self.manageButton)
+        spacerItem = QtWidgets.QSpacerItem(628, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem)
+        self.installButton = QtWidgets.QPushButton(self.titleWidget)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.installButton.setFont(font)
+        self.installButton.setStyleSheet("QPushButton {\n"
+"background-color: rgba(255, 169, 0, 217);\n"
+"color: rgb(0, 0, 0);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(":/icons/resources/icons/db_install.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.installButton.setIcon(icon1)
+        self.installButton.setIconSize(QtCore.QSize(24, 24))
+        self.installButton.setObjectName("installButton")
+        self.horizontalLayout.addWidget(self.installButton)
+        self.verticalLayout.addWidget(self.titleWidget)
+        self.viewerWidget = QtWidgets.QTabWidget(self.centralWidget)
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        font.setWeight(75)
+        self.viewerWidget.setFont(font)
+        self.viewerWidget.setStyleSheet("QTabBar {\n"
+"qproperty-drawBase: 0;\n"
+"}\n"
+"\n"
+"QTabBar::tab {\n"
+"/*background-color: rgba(153, 153, 153, 0.8);*/\n"
+"background-color: rgba(255, 169, 0, 217);\n"
+"color: rgb(0, 0, 0);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-top-left-radius: 10px;\n"
+"border-top-right-radius: 10px\n"
+"}\n"
+"\n"
+"QTabBar::tab:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-top-left-radius: 10px;\n"
+"border-top-right-radius: 10px;\n"
+"}\n"
+"\n"
+"QTabBar::tab:selected { \n"
+"background-color: rgba(255, 255, 255);\n"
+"color: rgb(0, 0, 0);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-top-left-radius: 10px;\n"
+"border-top-right-radius: 10px;\n"
+"margin-bottom: -1px; \n"
+"}\n"
+"\n"
+"/*\n"
+"QTabWidget::pane {\n"
+"   border: 1px solid lightgray;\n"
+"  top:-1px;\n"
+"  background: rgb(245, 245, 245); \n"
+"}\n"
+"*/")
+        self.viewerWidget.setIconSize(QtCore.QSize(24, 24))
+        self.viewerWidget.setDocumentMode(True)
+        self.viewerWidget.setObjectName("viewerWidget")
+        self.transformersTab = QtWidgets.QWidget()
+        self.transformersTab.setObjectName("transformersTab")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.transformersTab)
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.transformersView = CustomGraphicView(self.transformersTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.transformersView.sizePolicy().hasHeightForWidth())
+        self.transformersView.setSizePolicy(sizePolicy)
+        self.transformersView.setObjectName("transformersView")
+        self.verticalLayout_3.addWidget(self.transformersView)
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap(":/icons/resources/icons/transformers.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.viewerWidget.addTab(self.transformersTab, icon2, "")
+        self.cablesTab = QtWidgets.QWidget()
+        self.cablesTab.setObjectName("cablesTab")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.cablesTab)
+        self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.cablesView = CustomGraphicView(self.cablesTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cablesView.sizePolicy().hasHeightForWidth())
+        self.cablesView.setSizePolicy(sizePolicy)
+        self.cablesView.setObjectName("cablesView")
+        self.verticalLayout_4.addWidget(self.cablesView)
+        icon3 = QtGui.QIcon()
+        icon3.addPixmap(QtGui.QPixmap(":/icons/resources/icons/cables.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.viewerWidget.addTab(self.cablesTab, icon3, "")
+        self.contactsTab = QtWidgets.QWidget()
+        self.contactsTab.setObjectName("contactsTab")
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout(self.contactsTab)
+        self.verticalLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.contactsView = CustomGraphicView(self.contactsTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.contactsView.sizePolicy().hasHeightForWidth())
+        self.contactsView.setSizePolicy(sizePolicy)
+        self.contactsView.setObjectName("contactsView")
+        self.verticalLayout_5.addWidget(self.contactsView)
+        icon4 = QtGui.QIcon()
+        icon4.addPixmap(QtGui.QPixmap(":/icons/resources/icons/switchers.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.viewerWidget.addTab(self.contactsTab, icon4, "")
+        self.resistancesTab = QtWidgets.QWidget()
+        self.resistancesTab.setObjectName("resistancesTab")
+        self.verticalLayout_6 = QtWidgets.QVBoxLayout(self.resistancesTab)
+        self.verticalLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_6.setObjectName("verticalLayout_6")
+        self.resistancesView = CustomGraphicView(self.resistancesTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.resistancesView.sizePolicy().hasHeightForWidth())
+        self.resistancesView.setSizePolicy(sizePolicy)
+        self.resistancesView.setObjectName("resistancesView")
+        self.verticalLayout_6.addWidget(self.resistancesView)
+        icon5 = QtGui.QIcon()
+        icon5.addPixmap(QtGui.QPixmap(":/icons/resources/icons/other_resistances.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.viewerWidget.addTab(self.resistancesTab, icon5, "")
+        self.verticalLayout.addWidget(self.viewerWidget)
+        self.verticalLayout_2.addWidget(self.centralWidget)
+        self.crudWidget = QtWidgets.QWidget(Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.crudWidget.sizePolicy().hasHeightForWidth())
+        self.crudWidget.setSizePolicy(sizePolicy)
+        self.crudWidget.setObjectName("crudWidget")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout(self.crudWidget)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.optionsWidget = QtWidgets.QTabWidget(self.crudWidget)
+        self.optionsWidget.setEnabled(True)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.optionsWidget.sizePolicy().hasHeightForWidth())
+        self.optionsWidget.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        font.setWeight(75)
+        self.optionsWidget.setFont(font)
+        self.optionsWidget.setStyleSheet("QTabWidget::pane {\n"
+"background: transparent;\n"
+"border: 3px solid rgba(153, 153, 153);\n"
+"top: -3px;\n"
+"right: -3px;\n"
+"bottom: -3px;\n"
+"}\n"
+"\n"
+"QTabBar {\n"
+"qproperty-drawBase: 0;\n"
+"}\n"
+"\n"
+"QTabBar::tab {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding: 5px;\n"
+"border-top-left-radius: 10px;\n"
+"border-bottom-left-radius: 10px\n"
+"}\n"
+"\n"
+"QTabBar::tab:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding: 5px;\n"
+"border-top-left-radius: 10px;\n"
+"border-bottom-left-radius: 10px\n"
+"}\n"
+"\n"
+"QTabBar::tab:selected { \n"
+"background-color: rgba(255, 255, 255);\n"
+"color: rgb(0, 0, 0);\n"
+"padding: 5px;\n"
+"border-top-left-radius: 10px;\n"
+"border-bottom-left-radius: 10px;\n"
+"margin-right: -1px; \n"
+"}")
+        self.optionsWidget.setTabPosition(QtWidgets.QTabWidget.West)
+        self.optionsWidget.setObjectName("optionsWidget")
+        self.insertTab = QtWidgets.QWidget()
+        self.insertTab.setObjectName("insertTab")
+        self.verticalLayout_10 = QtWidgets.QVBoxLayout(self.insertTab)
+        self.verticalLayout_10.setContentsMargins(-1, -1, -1, 9)
+        self.verticalLayout_10.setObjectName("verticalLayout_10")
+        self.insertWidget = QtWidgets.QStackedWidget(self.insertTab)
+        self.insertWidget.setObjectName("insertWidget")
+        self.insertTransPage = QtWidgets.QWidget()
+        self.insertTransPage.setObjectName("insertTransPage")
+        self.gridLayout = QtWidgets.QGridLayout(self.insertTransPage)
+        self.gridLayout.setContentsMargins(-1, -1, -1, 25)
+        self.gridLayout.setHorizontalSpacing(20)
+        self.gridLayout.setObjectName("gridLayout")
+        self.insertTransTitle = QtWidgets.QLabel(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertTransTitle.setFont(font)
+        self.insertTransTitle.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.insertTransTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransTitle.setObjectName("insertTransTitle")
+        self.gridLayout.addWidget(self.insertTransTitle, 0, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.insertTransTitle2 = QtWidgets.QLabel(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertTransTitle2.setFont(font)
+        self.insertTransTitle2.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.insertTransTitle2.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransTitle2.setObjectName("insertTransTitle2")
+        self.gridLayout.addWidget(self.insertTransTitle2, 0, 3, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.insertTransLabel7 = QtWidgets.QLabel(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertTransLabel7.setFont(font)
+        self.insertTransLabel7.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransLabel7.setObjectName("insertTransLabel7")
+        self.gridLayout.addWidget(self.insertTransLabel7, 4, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertTransEdit7 = QtWidgets.QLineEdit(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertTransEdit7.setFont(font)
+        self.insertTransEdit7.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertTransEdit7.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransEdit7.setObjectName("insertTransEdit7")
+        self.gridLayout.addWidget(self.insertTransEdit7, 4, 3, 1, 1)
+        self.insertTransLabel8 = QtWidgets.QLabel(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertTransLabel8.setFont(font)
+        self.insertTransLabel8.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransLabel8.setObjectName("insertTransLabel8")
+        self.gridLayout.addWidget(self.insertTransLabel8, 5, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertTransEdit4 = QtWidgets.QLineEdit(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertTransEdit4.setFont(font)
+        self.insertTransEdit4.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertTransEdit4.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransEdit4.setObjectName("insertTransEdit4")
+        self.gridLayout.addWidget(self.insertTransEdit4, 1, 3, 1, 1)
+        self.insertTransLabel6 = QtWidgets.QLabel(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertTransLabel6.setFont(font)
+        self.insertTransLabel6.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransLabel6.setObjectName("insertTransLabel6")
+        self.gridLayout.addWidget(self.insertTransLabel6, 3, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertTransEdit8 = QtWidgets.QLineEdit(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertTransEdit8.setFont(font)
+        self.insertTransEdit8.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertTransEdit8.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransEdit8.setObjectName("insertTransEdit8")
+        self.gridLayout.addWidget(self.insertTransEdit8, 5, 3, 1, 1)
+        self.insertTransLabel5 = QtWidgets.QLabel(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertTransLabel5.setFont(font)
+        self.insertTransLabel5.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransLabel5.setObjectName("insertTransLabel5")
+        self.gridLayout.addWidget(self.insertTransLabel5, 2, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertTransEdit5 = QtWidgets.QLineEdit(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertTransEdit5.setFont(font)
+        self.insertTransEdit5.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertTransEdit5.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransEdit5.setObjectName("insertTransEdit5")
+        self.gridLayout.addWidget(self.insertTransEdit5, 2, 3, 1, 1)
+        self.insertTransLabel4 = QtWidgets.QLabel(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertTransLabel4.setFont(font)
+        self.insertTransLabel4.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransLabel4.setObjectName("insertTransLabel4")
+        self.gridLayout.addWidget(self.insertTransLabel4, 1, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertTransEdit6 = QtWidgets.QLineEdit(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertTransEdit6.setFont(font)
+        self.insertTransEdit6.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertTransEdit6.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransEdit6.setObjectName("insertTransEdit6")
+        self.gridLayout.addWidget(self.insertTransEdit6, 3, 3, 1, 1)
+        self.insertTransEdit9 = QtWidgets.QLineEdit(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertTransEdit9.setFont(font)
+        self.insertTransEdit9.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertTransEdit9.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransEdit9.setObjectName("insertTransEdit9")
+        self.gridLayout.addWidget(self.insertTransEdit9, 6, 3, 1, 1)
+        self.insertTransLabel9 = QtWidgets.QLabel(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertTransLabel9.setFont(font)
+        self.insertTransLabel9.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransLabel9.setObjectName("insertTransLabel9")
+        self.gridLayout.addWidget(self.insertTransLabel9, 6, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertTransEdit = QtWidgets.QLineEdit(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertTransEdit.setFont(font)
+        self.insertTransEdit.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertTransEdit.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransEdit.setObjectName("insertTransEdit")
+        self.gridLayout.addWidget(self.insertTransEdit, 1, 1, 1, 1)
+        self.insertTransEdit2 = QtWidgets.QLineEdit(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertTransEdit2.setFont(font)
+        self.insertTransEdit2.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertTransEdit2.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransEdit2.setObjectName("insertTransEdit2")
+        self.gridLayout.addWidget(self.insertTransEdit2, 2, 1, 1, 1)
+        self.insertTransEdit3 = QtWidgets.QLineEdit(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertTransEdit3.setFont(font)
+        self.insertTransEdit3.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertTransEdit3.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransEdit3.setObjectName("insertTransEdit3")
+        self.gridLayout.addWidget(self.insertTransEdit3, 3, 1, 1, 1)
+        self.insertTransLabel = QtWidgets.QLabel(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertTransLabel.setFont(font)
+        self.insertTransLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransLabel.setObjectName("insertTransLabel")
+        self.gridLayout.addWidget(self.insertTransLabel, 1, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.insertTransLabel2 = QtWidgets.QLabel(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertTransLabel2.setFont(font)
+        self.insertTransLabel2.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransLabel2.setObjectName("insertTransLabel2")
+        self.gridLayout.addWidget(self.insertTransLabel2, 2, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.insertTransLabel3 = QtWidgets.QLabel(self.insertTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertTransLabel3.setFont(font)
+        self.insertTransLabel3.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertTransLabel3.setObjectName("insertTransLabel3")
+        self.gridLayout.addWidget(self.insertTransLabel3, 3, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.insertWidget.addWidget(self.insertTransPage)
+        self.insertCablePage = QtWidgets.QWidget()
+        self.insertCablePage.setObjectName("insertCablePage")
+        self.gridLayout_2 = QtWidgets.QGridLayout(self.insertCablePage)
+        self.gridLayout_2.setContentsMargins(-1, -1, 9, 45)
+        self.gridLayout_2.setHorizontalSpacing(20)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.insertCableLabel4 = QtWidgets.QLabel(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertCableLabel4.setFont(font)
+        self.insertCableLabel4.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableLabel4.setObjectName("insertCableLabel4")
+        self.gridLayout_2.addWidget(self.insertCableLabel4, 1, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertCableEdit2 = QtWidgets.QLineEdit(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertCableEdit2.setFont(font)
+        self.insertCableEdit2.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertCableEdit2.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableEdit2.setObjectName("insertCableEdit2")
+        self.gridLayout_2.addWidget(self.insertCableEdit2, 2, 1, 1, 1)
+        self.insertCableEdit3 = QtWidgets.QLineEdit(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertCableEdit3.setFont(font)
+        self.insertCableEdit3.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertCableEdit3.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableEdit3.setObjectName("insertCableEdit3")
+        self.gridLayout_2.addWidget(self.insertCableEdit3, 3, 1, 1, 1)
+        self.insertCableLabel5 = QtWidgets.QLabel(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertCableLabel5.setFont(font)
+        self.insertCableLabel5.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableLabel5.setObjectName("insertCableLabel5")
+        self.gridLayout_2.addWidget(self.insertCableLabel5, 2, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertCableEdit5 = QtWidgets.QLineEdit(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertCableEdit5.setFont(font)
+        self.insertCableEdit5.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertCableEdit5.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableEdit5.setObjectName("insertCableEdit5")
+        self.gridLayout_2.addWidget(self.insertCableEdit5, 2, 3, 1, 1)
+        self.insertCableEdit4 = QtWidgets.QLineEdit(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertCableEdit4.setFont(font)
+        self.insertCableEdit4.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertCableEdit4.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableEdit4.setObjectName("insertCableEdit4")
+        self.gridLayout_2.addWidget(self.insertCableEdit4, 1, 3, 1, 1)
+        self.insertCableLabel3 = QtWidgets.QLabel(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertCableLabel3.setFont(font)
+        self.insertCableLabel3.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableLabel3.setObjectName("insertCableLabel3")
+        self.gridLayout_2.addWidget(self.insertCableLabel3, 3, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.insertCableLabel = QtWidgets.QLabel(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertCableLabel.setFont(font)
+        self.insertCableLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableLabel.setObjectName("insertCableLabel")
+        self.gridLayout_2.addWidget(self.insertCableLabel, 1, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.insertCableLabel2 = QtWidgets.QLabel(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertCableLabel2.setFont(font)
+        self.insertCableLabel2.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableLabel2.setObjectName("insertCableLabel2")
+        self.gridLayout_2.addWidget(self.insertCableLabel2, 2, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.insertCableLabel6 = QtWidgets.QLabel(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertCableLabel6.setFont(font)
+        self.insertCableLabel6.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableLabel6.setObjectName("insertCableLabel6")
+        self.gridLayout_2.addWidget(self.insertCableLabel6, 3, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertCableLabel7 = QtWidgets.QLabel(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertCableLabel7.setFont(font)
+        self.insertCableLabel7.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableLabel7.setObjectName("insertCableLabel7")
+        self.gridLayout_2.addWidget(self.insertCableLabel7, 4, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertCableEdit6 = QtWidgets.QLineEdit(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertCableEdit6.setFont(font)
+        self.insertCableEdit6.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertCableEdit6.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableEdit6.setObjectName("insertCableEdit6")
+        self.gridLayout_2.addWidget(self.insertCableEdit6, 3, 3, 1, 1)
+        self.insertCableEdit7 = QtWidgets.QLineEdit(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertCableEdit7.setFont(font)
+        self.insertCableEdit7.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertCableEdit7.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableEdit7.setObjectName("insertCableEdit7")
+        self.gridLayout_2.addWidget(self.insertCableEdit7, 4, 3, 1, 1)
+        self.insertCableLabel8 = QtWidgets.QLabel(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertCableLabel8.setFont(font)
+        self.insertCableLabel8.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableLabel8.setObjectName("insertCableLabel8")
+        self.gridLayout_2.addWidget(self.insertCableLabel8, 5, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertCableEdit8 = QtWidgets.QLineEdit(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertCableEdit8.setFont(font)
+        self.insertCableEdit8.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertCableEdit8.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableEdit8.setObjectName("insertCableEdit8")
+        self.gridLayout_2.addWidget(self.insertCableEdit8, 5, 3, 1, 1)
+        self.insertCableTitle2 = QtWidgets.QLabel(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertCableTitle2.setFont(font)
+        self.insertCableTitle2.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.insertCableTitle2.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableTitle2.setObjectName("insertCableTitle2")
+        self.gridLayout_2.addWidget(self.insertCableTitle2, 0, 3, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.insertCableTitle = QtWidgets.QLabel(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertCableTitle.setFont(font)
+        self.insertCableTitle.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.insertCableTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableTitle.setObjectName("insertCableTitle")
+        self.gridLayout_2.addWidget(self.insertCableTitle, 0, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.insertCableEdit = QtWidgets.QLineEdit(self.insertCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertCableEdit.setFont(font)
+        self.insertCableEdit.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertCableEdit.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertCableEdit.setObjectName("insertCableEdit")
+        self.gridLayout_2.addWidget(self.insertCableEdit, 1, 1, 1, 1)
+        self.insertWidget.addWidget(self.insertCablePage)
+        self.insertContactPage = QtWidgets.QWidget()
+        self.insertContactPage.setObjectName("insertContactPage")
+        self.gridLayout_3 = QtWidgets.QGridLayout(self.insertContactPage)
+        self.gridLayout_3.setContentsMargins(-1, -1, -1, 55)
+        self.gridLayout_3.setHorizontalSpacing(20)
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        self.insertContactTitle = QtWidgets.QLabel(self.insertContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertContactTitle.setFont(font)
+        self.insertContactTitle.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.insertContactTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertContactTitle.setObjectName("insertContactTitle")
+        self.gridLayout_3.addWidget(self.insertContactTitle, 0, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.insertContactTitle2 = QtWidgets.QLabel(self.insertContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertContactTitle2.setFont(font)
+        self.insertContactTitle2.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.insertContactTitle2.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertContactTitle2.setObjectName("insertContactTitle2")
+        self.gridLayout_3.addWidget(self.insertContactTitle2, 0, 3, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.insertContactLabel = QtWidgets.QLabel(self.insertContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertContactLabel.setFont(font)
+        self.insertContactLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertContactLabel.setObjectName("insertContactLabel")
+        self.gridLayout_3.addWidget(self.insertContactLabel, 1, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.insertContactEdit = QtWidgets.QLineEdit(self.insertContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertContactEdit.setFont(font)
+        self.insertContactEdit.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertContactEdit.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertContactEdit.setObjectName("insertContactEdit")
+        self.gridLayout_3.addWidget(self.insertContactEdit, 1, 1, 1, 1)
+        self.insertContactLabel3 = QtWidgets.QLabel(self.insertContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertContactLabel3.setFont(font)
+        self.insertContactLabel3.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertContactLabel3.setObjectName("insertContactLabel3")
+        self.gridLayout_3.addWidget(self.insertContactLabel3, 1, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertContactEdit3 = QtWidgets.QLineEdit(self.insertContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertContactEdit3.setFont(font)
+        self.insertContactEdit3.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertContactEdit3.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertContactEdit3.setObjectName("insertContactEdit3")
+        self.gridLayout_3.addWidget(self.insertContactEdit3, 1, 3, 1, 1)
+        self.insertContactLabel2 = QtWidgets.QLabel(self.insertContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertContactLabel2.setFont(font)
+        self.insertContactLabel2.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertContactLabel2.setObjectName("insertContactLabel2")
+        self.gridLayout_3.addWidget(self.insertContactLabel2, 2, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.insertContactEdit2 = QtWidgets.QLineEdit(self.insertContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertContactEdit2.setFont(font)
+        self.insertContactEdit2.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertContactEdit2.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertContactEdit2.setObjectName("insertContactEdit2")
+        self.gridLayout_3.addWidget(self.insertContactEdit2, 2, 1, 1, 1)
+        self.insertContactLabel4 = QtWidgets.QLabel(self.insertContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertContactLabel4.setFont(font)
+        self.insertContactLabel4.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertContactLabel4.setObjectName("insertContactLabel4")
+        self.gridLayout_3.addWidget(self.insertContactLabel4, 2, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertContactEdit4 = QtWidgets.QLineEdit(self.insertContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertContactEdit4.setFont(font)
+        self.insertContactEdit4.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertContactEdit4.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertContactEdit4.setObjectName("insertContactEdit4")
+        self.gridLayout_3.addWidget(self.insertContactEdit4, 2, 3, 1, 1)
+        self.insertContactLabel5 = QtWidgets.QLabel(self.insertContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertContactLabel5.setFont(font)
+        self.insertContactLabel5.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertContactLabel5.setObjectName("insertContactLabel5")
+        self.gridLayout_3.addWidget(self.insertContactLabel5, 3, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertContactEdit5 = QtWidgets.QLineEdit(self.insertContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertContactEdit5.setFont(font)
+        self.insertContactEdit5.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertContactEdit5.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertContactEdit5.setObjectName("insertContactEdit5")
+        self.gridLayout_3.addWidget(self.insertContactEdit5, 3, 3, 1, 1)
+        self.insertContactLabel6 = QtWidgets.QLabel(self.insertContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertContactLabel6.setFont(font)
+        self.insertContactLabel6.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertContactLabel6.setObjectName("insertContactLabel6")
+        self.gridLayout_3.addWidget(self.insertContactLabel6, 4, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertContactEdit6 = QtWidgets.QLineEdit(self.insertContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertContactEdit6.setFont(font)
+        self.insertContactEdit6.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertContactEdit6.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertContactEdit6.setObjectName("insertContactEdit6")
+        self.gridLayout_3.addWidget(self.insertContactEdit6, 4, 3, 1, 1)
+        self.insertWidget.addWidget(self.insertContactPage)
+        self.insertResistPage = QtWidgets.QWidget()
+        self.insertResistPage.setObjectName("insertResistPage")
+        self.gridLayout_4 = QtWidgets.QGridLayout(self.insertResistPage)
+        self.gridLayout_4.setContentsMargins(-1, -1, -1, 55)
+        self.gridLayout_4.setHorizontalSpacing(20)
+        self.gridLayout_4.setObjectName("gridLayout_4")
+        self.insertResistTitle = QtWidgets.QLabel(self.insertResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertResistTitle.setFont(font)
+        self.insertResistTitle.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.insertResistTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertResistTitle.setObjectName("insertResistTitle")
+        self.gridLayout_4.addWidget(self.insertResistTitle, 0, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.insertResistTitle2 = QtWidgets.QLabel(self.insertResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertResistTitle2.setFont(font)
+        self.insertResistTitle2.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.insertResistTitle2.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertResistTitle2.setObjectName("insertResistTitle2")
+        self.gridLayout_4.addWidget(self.insertResistTitle2, 0, 3, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.insertResistLabel = QtWidgets.QLabel(self.insertResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertResistLabel.setFont(font)
+        self.insertResistLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertResistLabel.setObjectName("insertResistLabel")
+        self.gridLayout_4.addWidget(self.insertResistLabel, 1, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.insertResistEdit = QtWidgets.QLineEdit(self.insertResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.insertResistEdit.setFont(font)
+        self.insertResistEdit.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertResistEdit.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertResistEdit.setObjectName("insertResistEdit")
+        self.gridLayout_4.addWidget(self.insertResistEdit, 1, 1, 1, 1)
+        self.insertResistLabel2 = QtWidgets.QLabel(self.insertResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertResistLabel2.setFont(font)
+        self.insertResistLabel2.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertResistLabel2.setObjectName("insertResistLabel2")
+        self.gridLayout_4.addWidget(self.insertResistLabel2, 1, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertResistEdit2 = QtWidgets.QLineEdit(self.insertResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertResistEdit2.setFont(font)
+        self.insertResistEdit2.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertResistEdit2.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertResistEdit2.setObjectName("insertResistEdit2")
+        self.gridLayout_4.addWidget(self.insertResistEdit2, 1, 3, 1, 1)
+        self.insertResistLabel3 = QtWidgets.QLabel(self.insertResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertResistLabel3.setFont(font)
+        self.insertResistLabel3.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertResistLabel3.setObjectName("insertResistLabel3")
+        self.gridLayout_4.addWidget(self.insertResistLabel3, 2, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertResistEdit3 = QtWidgets.QLineEdit(self.insertResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertResistEdit3.setFont(font)
+        self.insertResistEdit3.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertResistEdit3.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertResistEdit3.setObjectName("insertResistEdit3")
+        self.gridLayout_4.addWidget(self.insertResistEdit3, 2, 3, 1, 1)
+        self.insertResistLabel4 = QtWidgets.QLabel(self.insertResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertResistLabel4.setFont(font)
+        self.insertResistLabel4.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertResistLabel4.setObjectName("insertResistLabel4")
+        self.gridLayout_4.addWidget(self.insertResistLabel4, 3, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertResistEdit4 = QtWidgets.QLineEdit(self.insertResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertResistEdit4.setFont(font)
+        self.insertResistEdit4.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertResistEdit4.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertResistEdit4.setObjectName("insertResistEdit4")
+        self.gridLayout_4.addWidget(self.insertResistEdit4, 3, 3, 1, 1)
+        self.insertResistLabel5 = QtWidgets.QLabel(self.insertResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertResistLabel5.setFont(font)
+        self.insertResistLabel5.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertResistLabel5.setObjectName("insertResistLabel5")
+        self.gridLayout_4.addWidget(self.insertResistLabel5, 4, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.insertResistEdit5 = QtWidgets.QLineEdit(self.insertResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.insertResistEdit5.setFont(font)
+        self.insertResistEdit5.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.insertResistEdit5.setAlignment(QtCore.Qt.AlignCenter)
+        self.insertResistEdit5.setObjectName("insertResistEdit5")
+        self.gridLayout_4.addWidget(self.insertResistEdit5, 4, 3, 1, 1)
+        self.insertWidget.addWidget(self.insertResistPage)
+        self.verticalLayout_10.addWidget(self.insertWidget)
+        self.optionsWidget.addTab(self.insertTab, "")
+        self.updateTab = QtWidgets.QWidget()
+        self.updateTab.setObjectName("updateTab")
+        self.verticalLayout_11 = QtWidgets.QVBoxLayout(self.updateTab)
+        self.verticalLayout_11.setObjectName("verticalLayout_11")
+        self.updateWidget = QtWidgets.QStackedWidget(self.updateTab)
+        self.updateWidget.setObjectName("updateWidget")
+        self.updateTransPage = QtWidgets.QWidget()
+        self.updateTransPage.setObjectName("updateTransPage")
+        self.gridLayout_5 = QtWidgets.QGridLayout(self.updateTransPage)
+        self.gridLayout_5.setContentsMargins(-1, -1, -1, 9)
+        self.gridLayout_5.setHorizontalSpacing(20)
+        self.gridLayout_5.setObjectName("gridLayout_5")
+        self.updateTransTitle = QtWidgets.QLabel(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateTransTitle.setFont(font)
+        self.updateTransTitle.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.updateTransTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransTitle.setObjectName("updateTransTitle")
+        self.gridLayout_5.addWidget(self.updateTransTitle, 0, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.updateTransTitle3 = QtWidgets.QLabel(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateTransTitle3.setFont(font)
+        self.updateTransTitle3.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.updateTransTitle3.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransTitle3.setObjectName("updateTransTitle3")
+        self.gridLayout_5.addWidget(self.updateTransTitle3, 0, 3, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.updateTransLabel = QtWidgets.QLabel(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateTransLabel.setFont(font)
+        self.updateTransLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransLabel.setObjectName("updateTransLabel")
+        self.gridLayout_5.addWidget(self.updateTransLabel, 1, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateTransEdit = QtWidgets.QLineEdit(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateTransEdit.setFont(font)
+        self.updateTransEdit.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateTransEdit.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransEdit.setObjectName("updateTransEdit")
+        self.gridLayout_5.addWidget(self.updateTransEdit, 1, 1, 1, 1)
+        self.updateTransLabel7 = QtWidgets.QLabel(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateTransLabel7.setFont(font)
+        self.updateTransLabel7.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransLabel7.setObjectName("updateTransLabel7")
+        self.gridLayout_5.addWidget(self.updateTransLabel7, 1, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateTransEdit7 = QtWidgets.QLineEdit(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateTransEdit7.setFont(font)
+        self.updateTransEdit7.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateTransEdit7.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransEdit7.setObjectName("updateTransEdit7")
+        self.gridLayout_5.addWidget(self.updateTransEdit7, 1, 3, 1, 1)
+        self.updateTransLabel2 = QtWidgets.QLabel(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateTransLabel2.setFont(font)
+        self.updateTransLabel2.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransLabel2.setObjectName("updateTransLabel2")
+        self.gridLayout_5.addWidget(self.updateTransLabel2, 2, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateTransEdit2 = QtWidgets.QLineEdit(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateTransEdit2.setFont(font)
+        self.updateTransEdit2.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateTransEdit2.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransEdit2.setObjectName("updateTransEdit2")
+        self.gridLayout_5.addWidget(self.updateTransEdit2, 2, 1, 1, 1)
+        self.updateTransLabel8 = QtWidgets.QLabel(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateTransLabel8.setFont(font)
+        self.updateTransLabel8.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransLabel8.setObjectName("updateTransLabel8")
+        self.gridLayout_5.addWidget(self.updateTransLabel8, 2, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateTransEdit8 = QtWidgets.QLineEdit(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateTransEdit8.setFont(font)
+        self.updateTransEdit8.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateTransEdit8.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransEdit8.setObjectName("updateTransEdit8")
+        self.gridLayout_5.addWidget(self.updateTransEdit8, 2, 3, 1, 1)
+        self.updateTransLabel3 = QtWidgets.QLabel(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateTransLabel3.setFont(font)
+        self.updateTransLabel3.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransLabel3.setObjectName("updateTransLabel3")
+        self.gridLayout_5.addWidget(self.updateTransLabel3, 3, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateTransEdit3 = QtWidgets.QLineEdit(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateTransEdit3.setFont(font)
+        self.updateTransEdit3.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateTransEdit3.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransEdit3.setObjectName("updateTransEdit3")
+        self.gridLayout_5.addWidget(self.updateTransEdit3, 3, 1, 1, 1)
+        self.updateTransLabel9 = QtWidgets.QLabel(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateTransLabel9.setFont(font)
+        self.updateTransLabel9.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransLabel9.setObjectName("updateTransLabel9")
+        self.gridLayout_5.addWidget(self.updateTransLabel9, 3, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateTransEdit9 = QtWidgets.QLineEdit(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateTransEdit9.setFont(font)
+        self.updateTransEdit9.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateTransEdit9.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransEdit9.setObjectName("updateTransEdit9")
+        self.gridLayout_5.addWidget(self.updateTransEdit9, 3, 3, 1, 1)
+        self.updateTransTitle2 = QtWidgets.QLabel(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateTransTitle2.setFont(font)
+        self.updateTransTitle2.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.updateTransTitle2.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransTitle2.setObjectName("updateTransTitle2")
+        self.gridLayout_5.addWidget(self.updateTransTitle2, 4, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.updateTransLabel10 = QtWidgets.QLabel(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateTransLabel10.setFont(font)
+        self.updateTransLabel10.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransLabel10.setObjectName("updateTransLabel10")
+        self.gridLayout_5.addWidget(self.updateTransLabel10, 4, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateTransEdit10 = QtWidgets.QLineEdit(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateTransEdit10.setFont(font)
+        self.updateTransEdit10.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateTransEdit10.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransEdit10.setObjectName("updateTransEdit10")
+        self.gridLayout_5.addWidget(self.updateTransEdit10, 4, 3, 1, 1)
+        self.updateTransLabel4 = QtWidgets.QLabel(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateTransLabel4.setFont(font)
+        self.updateTransLabel4.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransLabel4.setObjectName("updateTransLabel4")
+        self.gridLayout_5.addWidget(self.updateTransLabel4, 5, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateTransEdit4 = QtWidgets.QLineEdit(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateTransEdit4.setFont(font)
+        self.updateTransEdit4.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateTransEdit4.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransEdit4.setObjectName("updateTransEdit4")
+        self.gridLayout_5.addWidget(self.updateTransEdit4, 5, 1, 1, 1)
+        self.updateTransLabel11 = QtWidgets.QLabel(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateTransLabel11.setFont(font)
+        self.updateTransLabel11.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransLabel11.setObjectName("updateTransLabel11")
+        self.gridLayout_5.addWidget(self.updateTransLabel11, 5, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateTransEdit11 = QtWidgets.QLineEdit(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateTransEdit11.setFont(font)
+        self.updateTransEdit11.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateTransEdit11.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransEdit11.setObjectName("updateTransEdit11")
+        self.gridLayout_5.addWidget(self.updateTransEdit11, 5, 3, 1, 1)
+        self.updateTransLabel5 = QtWidgets.QLabel(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateTransLabel5.setFont(font)
+        self.updateTransLabel5.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransLabel5.setObjectName("updateTransLabel5")
+        self.gridLayout_5.addWidget(self.updateTransLabel5, 6, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateTransEdit5 = QtWidgets.QLineEdit(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateTransEdit5.setFont(font)
+        self.updateTransEdit5.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateTransEdit5.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransEdit5.setObjectName("updateTransEdit5")
+        self.gridLayout_5.addWidget(self.updateTransEdit5, 6, 1, 1, 1)
+        self.updateTransLabel12 = QtWidgets.QLabel(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateTransLabel12.setFont(font)
+        self.updateTransLabel12.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransLabel12.setObjectName("updateTransLabel12")
+        self.gridLayout_5.addWidget(self.updateTransLabel12, 6, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateTransEdit12 = QtWidgets.QLineEdit(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateTransEdit12.setFont(font)
+        self.updateTransEdit12.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateTransEdit12.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransEdit12.setObjectName("updateTransEdit12")
+        self.gridLayout_5.addWidget(self.updateTransEdit12, 6, 3, 1, 1)
+        self.updateTransLabel6 = QtWidgets.QLabel(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateTransLabel6.setFont(font)
+        self.updateTransLabel6.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransLabel6.setObjectName("updateTransLabel6")
+        self.gridLayout_5.addWidget(self.updateTransLabel6, 7, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateTransEdit6 = QtWidgets.QLineEdit(self.updateTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateTransEdit6.setFont(font)
+        self.updateTransEdit6.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateTransEdit6.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateTransEdit6.setObjectName("updateTransEdit6")
+        self.gridLayout_5.addWidget(self.updateTransEdit6, 7, 1, 1, 1)
+        self.updateWidget.addWidget(self.updateTransPage)
+        self.updateCablePage = QtWidgets.QWidget()
+        self.updateCablePage.setObjectName("updateCablePage")
+        self.gridLayout_6 = QtWidgets.QGridLayout(self.updateCablePage)
+        self.gridLayout_6.setHorizontalSpacing(20)
+        self.gridLayout_6.setObjectName("gridLayout_6")
+        self.updateCableTitle = QtWidgets.QLabel(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateCableTitle.setFont(font)
+        self.updateCableTitle.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.updateCableTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableTitle.setObjectName("updateCableTitle")
+        self.gridLayout_6.addWidget(self.updateCableTitle, 0, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.updateCableTitle3 = QtWidgets.QLabel(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateCableTitle3.setFont(font)
+        self.updateCableTitle3.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.updateCableTitle3.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableTitle3.setObjectName("updateCableTitle3")
+        self.gridLayout_6.addWidget(self.updateCableTitle3, 0, 3, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.updateCableLabel = QtWidgets.QLabel(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateCableLabel.setFont(font)
+        self.updateCableLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableLabel.setObjectName("updateCableLabel")
+        self.gridLayout_6.addWidget(self.updateCableLabel, 1, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateCableEdit = QtWidgets.QLineEdit(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateCableEdit.setFont(font)
+        self.updateCableEdit.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateCableEdit.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableEdit.setObjectName("updateCableEdit")
+        self.gridLayout_6.addWidget(self.updateCableEdit, 1, 1, 1, 1)
+        self.updateCableLabel7 = QtWidgets.QLabel(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateCableLabel7.setFont(font)
+        self.updateCableLabel7.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableLabel7.setObjectName("updateCableLabel7")
+        self.gridLayout_6.addWidget(self.updateCableLabel7, 1, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateCableEdit7 = QtWidgets.QLineEdit(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateCableEdit7.setFont(font)
+        self.updateCableEdit7.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateCableEdit7.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableEdit7.setObjectName("updateCableEdit7")
+        self.gridLayout_6.addWidget(self.updateCableEdit7, 1, 3, 1, 1)
+        self.updateCableLabel2 = QtWidgets.QLabel(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateCableLabel2.setFont(font)
+        self.updateCableLabel2.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableLabel2.setObjectName("updateCableLabel2")
+        self.gridLayout_6.addWidget(self.updateCableLabel2, 2, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateCableEdit2 = QtWidgets.QLineEdit(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateCableEdit2.setFont(font)
+        self.updateCableEdit2.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateCableEdit2.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableEdit2.setObjectName("updateCableEdit2")
+        self.gridLayout_6.addWidget(self.updateCableEdit2, 2, 1, 1, 1)
+        self.updateCableLabel8 = QtWidgets.QLabel(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateCableLabel8.setFont(font)
+        self.updateCableLabel8.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableLabel8.setObjectName("updateCableLabel8")
+        self.gridLayout_6.addWidget(self.updateCableLabel8, 2, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateCableEdit8 = QtWidgets.QLineEdit(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateCableEdit8.setFont(font)
+        self.updateCableEdit8.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateCableEdit8.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableEdit8.setObjectName("updateCableEdit8")
+        self.gridLayout_6.addWidget(self.updateCableEdit8, 2, 3, 1, 1)
+        self.updateCableLabel3 = QtWidgets.QLabel(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateCableLabel3.setFont(font)
+        self.updateCableLabel3.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableLabel3.setObjectName("updateCableLabel3")
+        self.gridLayout_6.addWidget(self.updateCableLabel3, 3, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateCableEdit3 = QtWidgets.QLineEdit(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateCableEdit3.setFont(font)
+        self.updateCableEdit3.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateCableEdit3.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableEdit3.setObjectName("updateCableEdit3")
+        self.gridLayout_6.addWidget(self.updateCableEdit3, 3, 1, 1, 1)
+        self.updateCableLabel9 = QtWidgets.QLabel(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateCableLabel9.setFont(font)
+        self.updateCableLabel9.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableLabel9.setObjectName("updateCableLabel9")
+        self.gridLayout_6.addWidget(self.updateCableLabel9, 3, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateCableEdit9 = QtWidgets.QLineEdit(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateCableEdit9.setFont(font)
+        self.updateCableEdit9.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateCableEdit9.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableEdit9.setObjectName("updateCableEdit9")
+        self.gridLayout_6.addWidget(self.updateCableEdit9, 3, 3, 1, 1)
+        self.updateCableTitle2 = QtWidgets.QLabel(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateCableTitle2.setFont(font)
+        self.updateCableTitle2.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.updateCableTitle2.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableTitle2.setObjectName("updateCableTitle2")
+        self.gridLayout_6.addWidget(self.updateCableTitle2, 4, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.updateCableLabel10 = QtWidgets.QLabel(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateCableLabel10.setFont(font)
+        self.updateCableLabel10.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableLabel10.setObjectName("updateCableLabel10")
+        self.gridLayout_6.addWidget(self.updateCableLabel10, 4, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateCableEdit10 = QtWidgets.QLineEdit(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateCableEdit10.setFont(font)
+        self.updateCableEdit10.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateCableEdit10.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableEdit10.setObjectName("updateCableEdit10")
+        self.gridLayout_6.addWidget(self.updateCableEdit10, 4, 3, 1, 1)
+        self.updateCableLabel4 = QtWidgets.QLabel(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateCableLabel4.setFont(font)
+        self.updateCableLabel4.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableLabel4.setObjectName("updateCableLabel4")
+        self.gridLayout_6.addWidget(self.updateCableLabel4, 5, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateCableEdit4 = QtWidgets.QLineEdit(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateCableEdit4.setFont(font)
+        self.updateCableEdit4.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateCableEdit4.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableEdit4.setObjectName("updateCableEdit4")
+        self.gridLayout_6.addWidget(self.updateCableEdit4, 5, 1, 1, 1)
+        self.updateCableLabel11 = QtWidgets.QLabel(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateCableLabel11.setFont(font)
+        self.updateCableLabel11.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableLabel11.setObjectName("updateCableLabel11")
+        self.gridLayout_6.addWidget(self.updateCableLabel11, 5, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateCableEdit11 = QtWidgets.QLineEdit(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateCableEdit11.setFont(font)
+        self.updateCableEdit11.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateCableEdit11.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableEdit11.setObjectName("updateCableEdit11")
+        self.gridLayout_6.addWidget(self.updateCableEdit11, 5, 3, 1, 1)
+        self.updateCableLabel5 = QtWidgets.QLabel(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateCableLabel5.setFont(font)
+        self.updateCableLabel5.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableLabel5.setObjectName("updateCableLabel5")
+        self.gridLayout_6.addWidget(self.updateCableLabel5, 6, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateCableEdit5 = QtWidgets.QLineEdit(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateCableEdit5.setFont(font)
+        self.updateCableEdit5.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateCableEdit5.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableEdit5.setObjectName("updateCableEdit5")
+        self.gridLayout_6.addWidget(self.updateCableEdit5, 6, 1, 1, 1)
+        self.updateCableLabel6 = QtWidgets.QLabel(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateCableLabel6.setFont(font)
+        self.updateCableLabel6.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableLabel6.setObjectName("updateCableLabel6")
+        self.gridLayout_6.addWidget(self.updateCableLabel6, 7, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateCableEdit6 = QtWidgets.QLineEdit(self.updateCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateCableEdit6.setFont(font)
+        self.updateCableEdit6.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateCableEdit6.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateCableEdit6.setObjectName("updateCableEdit6")
+        self.gridLayout_6.addWidget(self.updateCableEdit6, 7, 1, 1, 1)
+        self.updateWidget.addWidget(self.updateCablePage)
+        self.updateContactPage = QtWidgets.QWidget()
+        self.updateContactPage.setObjectName("updateContactPage")
+        self.gridLayout_7 = QtWidgets.QGridLayout(self.updateContactPage)
+        self.gridLayout_7.setContentsMargins(-1, -1, -1, 60)
+        self.gridLayout_7.setHorizontalSpacing(20)
+        self.gridLayout_7.setObjectName("gridLayout_7")
+        self.updateContactTitle3 = QtWidgets.QLabel(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateContactTitle3.setFont(font)
+        self.updateContactTitle3.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.updateContactTitle3.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactTitle3.setObjectName("updateContactTitle3")
+        self.gridLayout_7.addWidget(self.updateContactTitle3, 0, 3, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.updateContactTitle2 = QtWidgets.QLabel(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateContactTitle2.setFont(font)
+        self.updateContactTitle2.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.updateContactTitle2.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactTitle2.setObjectName("updateContactTitle2")
+        self.gridLayout_7.addWidget(self.updateContactTitle2, 3, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.updateContactEdit7 = QtWidgets.QLineEdit(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateContactEdit7.setFont(font)
+        self.updateContactEdit7.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateContactEdit7.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactEdit7.setObjectName("updateContactEdit7")
+        self.gridLayout_7.addWidget(self.updateContactEdit7, 3, 3, 1, 1)
+        self.updateContactLabel7 = QtWidgets.QLabel(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateContactLabel7.setFont(font)
+        self.updateContactLabel7.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactLabel7.setObjectName("updateContactLabel7")
+        self.gridLayout_7.addWidget(self.updateContactLabel7, 3, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateContactLabel4 = QtWidgets.QLabel(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateContactLabel4.setFont(font)
+        self.updateContactLabel4.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactLabel4.setObjectName("updateContactLabel4")
+        self.gridLayout_7.addWidget(self.updateContactLabel4, 5, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateContactEdit5 = QtWidgets.QLineEdit(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateContactEdit5.setFont(font)
+        self.updateContactEdit5.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateContactEdit5.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactEdit5.setObjectName("updateContactEdit5")
+        self.gridLayout_7.addWidget(self.updateContactEdit5, 1, 3, 1, 1)
+        self.updateContactEdit = QtWidgets.QLineEdit(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateContactEdit.setFont(font)
+        self.updateContactEdit.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateContactEdit.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactEdit.setObjectName("updateContactEdit")
+        self.gridLayout_7.addWidget(self.updateContactEdit, 1, 1, 1, 1)
+        self.updateContactEdit4 = QtWidgets.QLineEdit(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateContactEdit4.setFont(font)
+        self.updateContactEdit4.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateContactEdit4.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactEdit4.setObjectName("updateContactEdit4")
+        self.gridLayout_7.addWidget(self.updateContactEdit4, 5, 1, 1, 1)
+        self.updateContactEdit8 = QtWidgets.QLineEdit(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateContactEdit8.setFont(font)
+        self.updateContactEdit8.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateContactEdit8.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactEdit8.setObjectName("updateContactEdit8")
+        self.gridLayout_7.addWidget(self.updateContactEdit8, 4, 3, 1, 1)
+        self.updateContactLabel6 = QtWidgets.QLabel(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateContactLabel6.setFont(font)
+        self.updateContactLabel6.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactLabel6.setObjectName("updateContactLabel6")
+        self.gridLayout_7.addWidget(self.updateContactLabel6, 2, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateContactLabel2 = QtWidgets.QLabel(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateContactLabel2.setFont(font)
+        self.updateContactLabel2.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactLabel2.setObjectName("updateContactLabel2")
+        self.gridLayout_7.addWidget(self.updateContactLabel2, 2, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateContactEdit2 = QtWidgets.QLineEdit(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateContactEdit2.setFont(font)
+        self.updateContactEdit2.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateContactEdit2.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactEdit2.setObjectName("updateContactEdit2")
+        self.gridLayout_7.addWidget(self.updateContactEdit2, 2, 1, 1, 1)
+        self.updateContactLabel5 = QtWidgets.QLabel(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateContactLabel5.setFont(font)
+        self.updateContactLabel5.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactLabel5.setObjectName("updateContactLabel5")
+        self.gridLayout_7.addWidget(self.updateContactLabel5, 1, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateContactLabel8 = QtWidgets.QLabel(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateContactLabel8.setFont(font)
+        self.updateContactLabel8.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactLabel8.setObjectName("updateContactLabel8")
+        self.gridLayout_7.addWidget(self.updateContactLabel8, 4, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateContactEdit3 = QtWidgets.QLineEdit(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateContactEdit3.setFont(font)
+        self.updateContactEdit3.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateContactEdit3.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactEdit3.setObjectName("updateContactEdit3")
+        self.gridLayout_7.addWidget(self.updateContactEdit3, 4, 1, 1, 1)
+        self.updateContactLabel = QtWidgets.QLabel(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateContactLabel.setFont(font)
+        self.updateContactLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactLabel.setObjectName("updateContactLabel")
+        self.gridLayout_7.addWidget(self.updateContactLabel, 1, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateContactEdit6 = QtWidgets.QLineEdit(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateContactEdit6.setFont(font)
+        self.updateContactEdit6.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateContactEdit6.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactEdit6.setObjectName("updateContactEdit6")
+        self.gridLayout_7.addWidget(self.updateContactEdit6, 2, 3, 1, 1)
+        self.updateContactLabel3 = QtWidgets.QLabel(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateContactLabel3.setFont(font)
+        self.updateContactLabel3.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactLabel3.setObjectName("updateContactLabel3")
+        self.gridLayout_7.addWidget(self.updateContactLabel3, 4, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateContactTitle = QtWidgets.QLabel(self.updateContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateContactTitle.setFont(font)
+        self.updateContactTitle.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.updateContactTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateContactTitle.setObjectName("updateContactTitle")
+        self.gridLayout_7.addWidget(self.updateContactTitle, 0, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.updateWidget.addWidget(self.updateContactPage)
+        self.updateResistPage = QtWidgets.QWidget()
+        self.updateResistPage.setObjectName("updateResistPage")
+        self.gridLayout_8 = QtWidgets.QGridLayout(self.updateResistPage)
+        self.gridLayout_8.setContentsMargins(-1, -1, -1, 90)
+        self.gridLayout_8.setHorizontalSpacing(20)
+        self.gridLayout_8.setObjectName("gridLayout_8")
+        self.updateResistTitle = QtWidgets.QLabel(self.updateResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateResistTitle.setFont(font)
+        self.updateResistTitle.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.updateResistTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateResistTitle.setObjectName("updateResistTitle")
+        self.gridLayout_8.addWidget(self.updateResistTitle, 0, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.updateResistTitle3 = QtWidgets.QLabel(self.updateResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateResistTitle3.setFont(font)
+        self.updateResistTitle3.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.updateResistTitle3.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateResistTitle3.setObjectName("updateResistTitle3")
+        self.gridLayout_8.addWidget(self.updateResistTitle3, 0, 3, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.updateResistLabel = QtWidgets.QLabel(self.updateResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateResistLabel.setFont(font)
+        self.updateResistLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateResistLabel.setObjectName("updateResistLabel")
+        self.gridLayout_8.addWidget(self.updateResistLabel, 1, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateResistEdit = QtWidgets.QLineEdit(self.updateResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateResistEdit.setFont(font)
+        self.updateResistEdit.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateResistEdit.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateResistEdit.setObjectName("updateResistEdit")
+        self.gridLayout_8.addWidget(self.updateResistEdit, 1, 1, 1, 1)
+        self.updateResistLabel3 = QtWidgets.QLabel(self.updateResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateResistLabel3.setFont(font)
+        self.updateResistLabel3.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateResistLabel3.setObjectName("updateResistLabel3")
+        self.gridLayout_8.addWidget(self.updateResistLabel3, 1, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateResistEdit3 = QtWidgets.QLineEdit(self.updateResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateResistEdit3.setFont(font)
+        self.updateResistEdit3.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateResistEdit3.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateResistEdit3.setObjectName("updateResistEdit3")
+        self.gridLayout_8.addWidget(self.updateResistEdit3, 1, 3, 1, 1)
+        self.updateResistTitle2 = QtWidgets.QLabel(self.updateResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateResistTitle2.setFont(font)
+        self.updateResistTitle2.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.updateResistTitle2.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateResistTitle2.setObjectName("updateResistTitle2")
+        self.gridLayout_8.addWidget(self.updateResistTitle2, 2, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.updateResistLabel4 = QtWidgets.QLabel(self.updateResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateResistLabel4.setFont(font)
+        self.updateResistLabel4.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateResistLabel4.setObjectName("updateResistLabel4")
+        self.gridLayout_8.addWidget(self.updateResistLabel4, 2, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateResistEdit4 = QtWidgets.QLineEdit(self.updateResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateResistEdit4.setFont(font)
+        self.updateResistEdit4.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateResistEdit4.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateResistEdit4.setObjectName("updateResistEdit4")
+        self.gridLayout_8.addWidget(self.updateResistEdit4, 2, 3, 1, 1)
+        self.updateResistLabel2 = QtWidgets.QLabel(self.updateResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateResistLabel2.setFont(font)
+        self.updateResistLabel2.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateResistLabel2.setObjectName("updateResistLabel2")
+        self.gridLayout_8.addWidget(self.updateResistLabel2, 3, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.updateResistEdit2 = QtWidgets.QLineEdit(self.updateResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateResistEdit2.setFont(font)
+        self.updateResistEdit2.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateResistEdit2.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateResistEdit2.setObjectName("updateResistEdit2")
+        self.gridLayout_8.addWidget(self.updateResistEdit2, 3, 1, 1, 1)
+        self.updateResistLabel5 = QtWidgets.QLabel(self.updateResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateResistLabel5.setFont(font)
+        self.updateResistLabel5.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateResistLabel5.setObjectName("updateResistLabel5")
+        self.gridLayout_8.addWidget(self.updateResistLabel5, 3, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateResistEdit5 = QtWidgets.QLineEdit(self.updateResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateResistEdit5.setFont(font)
+        self.updateResistEdit5.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateResistEdit5.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateResistEdit5.setObjectName("updateResistEdit5")
+        self.gridLayout_8.addWidget(self.updateResistEdit5, 3, 3, 1, 1)
+        self.updateResistLabel6 = QtWidgets.QLabel(self.updateResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateResistLabel6.setFont(font)
+        self.updateResistLabel6.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateResistLabel6.setObjectName("updateResistLabel6")
+        self.gridLayout_8.addWidget(self.updateResistLabel6, 4, 2, 1, 1, QtCore.Qt.AlignRight)
+        self.updateResistEdit6 = QtWidgets.QLineEdit(self.updateResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.updateResistEdit6.setFont(font)
+        self.updateResistEdit6.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.updateResistEdit6.setAlignment(QtCore.Qt.AlignCenter)
+        self.updateResistEdit6.setObjectName("updateResistEdit6")
+        self.gridLayout_8.addWidget(self.updateResistEdit6, 4, 3, 1, 1)
+        self.updateWidget.addWidget(self.updateResistPage)
+        self.verticalLayout_11.addWidget(self.updateWidget)
+        self.optionsWidget.addTab(self.updateTab, "")
+        self.deleteTab = QtWidgets.QWidget()
+        self.deleteTab.setObjectName("deleteTab")
+        self.verticalLayout_12 = QtWidgets.QVBoxLayout(self.deleteTab)
+        self.verticalLayout_12.setObjectName("verticalLayout_12")
+        self.deleteWidget = QtWidgets.QStackedWidget(self.deleteTab)
+        self.deleteWidget.setObjectName("deleteWidget")
+        self.deleteTransPage = QtWidgets.QWidget()
+        self.deleteTransPage.setObjectName("deleteTransPage")
+        self.gridLayout_9 = QtWidgets.QGridLayout(self.deleteTransPage)
+        self.gridLayout_9.setContentsMargins(50, -1, 50, 79)
+        self.gridLayout_9.setHorizontalSpacing(20)
+        self.gridLayout_9.setVerticalSpacing(9)
+        self.gridLayout_9.setObjectName("gridLayout_9")
+        self.deleteTransTitle = QtWidgets.QLabel(self.deleteTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.deleteTransTitle.setFont(font)
+        self.deleteTransTitle.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.deleteTransTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteTransTitle.setObjectName("deleteTransTitle")
+        self.gridLayout_9.addWidget(self.deleteTransTitle, 0, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.deleteTransLabel = QtWidgets.QLabel(self.deleteTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.deleteTransLabel.setFont(font)
+        self.deleteTransLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteTransLabel.setObjectName("deleteTransLabel")
+        self.gridLayout_9.addWidget(self.deleteTransLabel, 1, 0, 1, 1)
+        self.deleteTransEdit = QtWidgets.QLineEdit(self.deleteTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.deleteTransEdit.setFont(font)
+        self.deleteTransEdit.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.deleteTransEdit.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteTransEdit.setObjectName("deleteTransEdit")
+        self.gridLayout_9.addWidget(self.deleteTransEdit, 1, 1, 1, 1)
+        self.deleteTransLabel2 = QtWidgets.QLabel(self.deleteTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.deleteTransLabel2.setFont(font)
+        self.deleteTransLabel2.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.deleteTransLabel2.setObjectName("deleteTransLabel2")
+        self.gridLayout_9.addWidget(self.deleteTransLabel2, 2, 0, 1, 1)
+        self.deleteTransEdit2 = QtWidgets.QLineEdit(self.deleteTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.deleteTransEdit2.setFont(font)
+        self.deleteTransEdit2.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.deleteTransEdit2.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteTransEdit2.setObjectName("deleteTransEdit2")
+        self.gridLayout_9.addWidget(self.deleteTransEdit2, 2, 1, 1, 1)
+        self.deleteTransLabel3 = QtWidgets.QLabel(self.deleteTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.deleteTransLabel3.setFont(font)
+        self.deleteTransLabel3.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteTransLabel3.setObjectName("deleteTransLabel3")
+        self.gridLayout_9.addWidget(self.deleteTransLabel3, 3, 0, 1, 1)
+        self.deleteTransEdit3 = QtWidgets.QLineEdit(self.deleteTransPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.deleteTransEdit3.setFont(font)
+        self.deleteTransEdit3.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.deleteTransEdit3.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteTransEdit3.setObjectName("deleteTransEdit3")
+        self.gridLayout_9.addWidget(self.deleteTransEdit3, 3, 1, 1, 1)
+        self.deleteWidget.addWidget(self.deleteTransPage)
+        self.deleteCablePage = QtWidgets.QWidget()
+        self.deleteCablePage.setObjectName("deleteCablePage")
+        self.gridLayout_10 = QtWidgets.QGridLayout(self.deleteCablePage)
+        self.gridLayout_10.setContentsMargins(50, -1, 50, 79)
+        self.gridLayout_10.setHorizontalSpacing(20)
+        self.gridLayout_10.setVerticalSpacing(9)
+        self.gridLayout_10.setObjectName("gridLayout_10")
+        self.deleteCableTitle = QtWidgets.QLabel(self.deleteCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.deleteCableTitle.setFont(font)
+        self.deleteCableTitle.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.deleteCableTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteCableTitle.setObjectName("deleteCableTitle")
+        self.gridLayout_10.addWidget(self.deleteCableTitle, 0, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.deleteCableLabel = QtWidgets.QLabel(self.deleteCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.deleteCableLabel.setFont(font)
+        self.deleteCableLabel.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.deleteCableLabel.setObjectName("deleteCableLabel")
+        self.gridLayout_10.addWidget(self.deleteCableLabel, 1, 0, 1, 1)
+        self.deleteCableEdit = QtWidgets.QLineEdit(self.deleteCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.deleteCableEdit.setFont(font)
+        self.deleteCableEdit.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.deleteCableEdit.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteCableEdit.setObjectName("deleteCableEdit")
+        self.gridLayout_10.addWidget(self.deleteCableEdit, 1, 1, 1, 1)
+        self.deleteCableLabel2 = QtWidgets.QLabel(self.deleteCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.deleteCableLabel2.setFont(font)
+        self.deleteCableLabel2.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.deleteCableLabel2.setObjectName("deleteCableLabel2")
+        self.gridLayout_10.addWidget(self.deleteCableLabel2, 2, 0, 1, 1)
+        self.deleteCableEdit2 = QtWidgets.QLineEdit(self.deleteCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.deleteCableEdit2.setFont(font)
+        self.deleteCableEdit2.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.deleteCableEdit2.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteCableEdit2.setObjectName("deleteCableEdit2")
+        self.gridLayout_10.addWidget(self.deleteCableEdit2, 2, 1, 1, 1)
+        self.deleteCableLabel3 = QtWidgets.QLabel(self.deleteCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.deleteCableLabel3.setFont(font)
+        self.deleteCableLabel3.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.deleteCableLabel3.setObjectName("deleteCableLabel3")
+        self.gridLayout_10.addWidget(self.deleteCableLabel3, 3, 0, 1, 1)
+        self.deleteCableEdit3 = QtWidgets.QLineEdit(self.deleteCablePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.deleteCableEdit3.setFont(font)
+        self.deleteCableEdit3.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.deleteCableEdit3.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteCableEdit3.setObjectName("deleteCableEdit3")
+        self.gridLayout_10.addWidget(self.deleteCableEdit3, 3, 1, 1, 1)
+        self.deleteWidget.addWidget(self.deleteCablePage)
+        self.deleteContactPage = QtWidgets.QWidget()
+        self.deleteContactPage.setObjectName("deleteContactPage")
+        self.gridLayout_11 = QtWidgets.QGridLayout(self.deleteContactPage)
+        self.gridLayout_11.setContentsMargins(50, -1, 50, 79)
+        self.gridLayout_11.setHorizontalSpacing(20)
+        self.gridLayout_11.setVerticalSpacing(9)
+        self.gridLayout_11.setObjectName("gridLayout_11")
+        self.deleteContactTitle = QtWidgets.QLabel(self.deleteContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.deleteContactTitle.setFont(font)
+        self.deleteContactTitle.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.deleteContactTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteContactTitle.setObjectName("deleteContactTitle")
+        self.gridLayout_11.addWidget(self.deleteContactTitle, 0, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.deleteContactLabel = QtWidgets.QLabel(self.deleteContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.deleteContactLabel.setFont(font)
+        self.deleteContactLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteContactLabel.setObjectName("deleteContactLabel")
+        self.gridLayout_11.addWidget(self.deleteContactLabel, 1, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.deleteContactEdit = QtWidgets.QLineEdit(self.deleteContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.deleteContactEdit.setFont(font)
+        self.deleteContactEdit.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.deleteContactEdit.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteContactEdit.setObjectName("deleteContactEdit")
+        self.gridLayout_11.addWidget(self.deleteContactEdit, 1, 1, 1, 1)
+        self.deleteContactLabel2 = QtWidgets.QLabel(self.deleteContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.deleteContactLabel2.setFont(font)
+        self.deleteContactLabel2.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteContactLabel2.setObjectName("deleteContactLabel2")
+        self.gridLayout_11.addWidget(self.deleteContactLabel2, 2, 0, 1, 1, QtCore.Qt.AlignRight)
+        self.deleteContactEdit2 = QtWidgets.QLineEdit(self.deleteContactPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.deleteContactEdit2.setFont(font)
+        self.deleteContactEdit2.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.deleteContactEdit2.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteContactEdit2.setObjectName("deleteContactEdit2")
+        self.gridLayout_11.addWidget(self.deleteContactEdit2, 2, 1, 1, 1)
+        self.deleteWidget.addWidget(self.deleteContactPage)
+        self.deleteResistPage = QtWidgets.QWidget()
+        self.deleteResistPage.setObjectName("deleteResistPage")
+        self.gridLayout_12 = QtWidgets.QGridLayout(self.deleteResistPage)
+        self.gridLayout_12.setContentsMargins(50, -1, 50, 106)
+        self.gridLayout_12.setHorizontalSpacing(20)
+        self.gridLayout_12.setVerticalSpacing(6)
+        self.gridLayout_12.setObjectName("gridLayout_12")
+        self.deleteResistTitle = QtWidgets.QLabel(self.deleteResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.deleteResistTitle.setFont(font)
+        self.deleteResistTitle.setStyleSheet("background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-right: 20px;\n"
+"padding-left: 20px;\n"
+"padding-top: 5px;\n"
+"padding-bottom: 5px;\n"
+"border-radius: 10px;\n"
+"")
+        self.deleteResistTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteResistTitle.setObjectName("deleteResistTitle")
+        self.gridLayout_12.addWidget(self.deleteResistTitle, 0, 1, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.deleteResistLabel = QtWidgets.QLabel(self.deleteResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.deleteResistLabel.setFont(font)
+        self.deleteResistLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteResistLabel.setObjectName("deleteResistLabel")
+        self.gridLayout_12.addWidget(self.deleteResistLabel, 1, 0, 1, 1)
+        self.deleteResistEdit = QtWidgets.QLineEdit(self.deleteResistPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.deleteResistEdit.setFont(font)
+        self.deleteResistEdit.setStyleSheet("background-color: rgba(225, 225, 225);\n"
+"border-radius: 5px;\n"
+"border: 1px solid black")
+        self.deleteResistEdit.setAlignment(QtCore.Qt.AlignCenter)
+        self.deleteResistEdit.setObjectName("deleteResistEdit")
+        self.gridLayout_12.addWidget(self.deleteResistEdit, 1, 1, 1, 1)
+        self.deleteWidget.addWidget(self.deleteResistPage)
+        self.verticalLayout_12.addWidget(self.deleteWidget)
+        self.optionsWidget.addTab(self.deleteTab, "")
+        self.horizontalLayout_3.addWidget(self.optionsWidget)
+        self.admitWidget = QtWidgets.QStackedWidget(self.crudWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.admitWidget.sizePolicy().hasHeightForWidth())
+        self.admitWidget.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.admitWidget.setFont(font)
+        self.admitWidget.setObjectName("admitWidget")
+        self.insertPage = QtWidgets.QWidget()
+        self.insertPage.setObjectName("insertPage")
+        self.verticalLayout_9 = QtWidgets.QVBoxLayout(self.insertPage)
+        self.verticalLayout_9.setObjectName("verticalLayout_9")
+        self.insertButton = QtWidgets.QPushButton(self.insertPage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.insertButton.setFont(font)
+        self.insertButton.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}")
+        icon6 = QtGui.QIcon()
+        icon6.addPixmap(QtGui.QPixmap(":/icons/resources/icons/db_insert.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.insertButton.setIcon(icon6)
+        self.insertButton.setIconSize(QtCore.QSize(24, 24))
+        self.insertButton.setObjectName("insertButton")
+        self.verticalLayout_9.addWidget(self.insertButton)
+        self.admitWidget.addWidget(self.insertPage)
+        self.updatePage = QtWidgets.QWidget()
+        self.updatePage.setObjectName("updatePage")
+        self.verticalLayout_8 = QtWidgets.QVBoxLayout(self.updatePage)
+        self.verticalLayout_8.setObjectName("verticalLayout_8")
+        self.updateButton = QtWidgets.QPushButton(self.updatePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.updateButton.setFont(font)
+        self.updateButton.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}")
+        icon7 = QtGui.QIcon()
+        icon7.addPixmap(QtGui.QPixmap(":/icons/resources/icons/db_update.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.updateButton.setIcon(icon7)
+        self.updateButton.setIconSize(QtCore.QSize(24, 24))
+        self.updateButton.setObjectName("updateButton")
+        self.verticalLayout_8.addWidget(self.updateButton)
+        self.admitWidget.addWidget(self.updatePage)
+        self.deletePage = QtWidgets.QWidget()
+        self.deletePage.setObjectName("deletePage")
+        self.verticalLayout_7 = QtWidgets.QVBoxLayout(self.deletePage)
+        self.verticalLayout_7.setObjectName("verticalLayout_7")
+        self.deleteLabel = QtWidgets.QLabel(self.deletePage)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.deleteLabel.setFont(font)
+        self.deleteLabel.setObjectName("deleteLabel")
+        self.verticalLayout_7.addWidget(self.deleteLabel, 0, QtCore.Qt.AlignHCenter)
+        self.rowButton = QtWidgets.QPushButton(self.deletePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.rowButton.setFont(font)
+        self.rowButton.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}")
+        icon8 = QtGui.QIcon()
+        icon8.addPixmap(QtGui.QPixmap(":/icons/resources/icons/db_delete_row.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.rowButton.setIcon(icon8)
+        self.rowButton.setIconSize(QtCore.QSize(24, 24))
+        self.rowButton.setObjectName("rowButton")
+        self.verticalLayout_7.addWidget(self.rowButton)
+        self.sourceButton = QtWidgets.QPushButton(self.deletePage)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.sourceButton.setFont(font)
+        self.sourceButton.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}")
+        icon9 = QtGui.QIcon()
+        icon9.addPixmap(QtGui.QPixmap(":/icons/resources/icons/db_delete_source.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.sourceButton.setIcon(icon9)
+        self.sourceButton.setIconSize(QtCore.QSize(24, 24))
+        self.sourceButton.setObjectName("sourceButton")
+        self.verticalLayout_7.addWidget(self.sourceButton)
+        self.admitWidget.addWidget(self.deletePage)
+        self.horizontalLayout_3.addWidget(self.admitWidget)
+        self.verticalLayout_2.addWidget(self.crudWidget)
+
+        self.retranslateUi(Form)
+        self.viewerWidget.setCurrentIndex(0)
+        self.optionsWidget.setCurrentIndex(0)
+        self.insertWidget.setCurrentIndex(0)
+        self.updateWidget.setCurrentIndex(0)
+        self.deleteWidget.setCurrentIndex(0)
+        self.admitWidget.setCurrentIndex(0)
+        self.optionsWidget.currentChanged['int'].connect(self.admitWidget.setCurrentIndex) # type: ignore
+        self.manageButton.toggled['bool'].connect(self.crudWidget.setHidden) # type: ignore
+        self.viewerWidget.currentChanged['int'].connect(self.insertWidget.setCurrentIndex) # type: ignore
+        self.viewerWidget.currentChanged['int'].connect(self.updateWidget.setCurrentIndex) # type: ignore
+        self.viewerWidget.currentChanged['int'].connect(self.deleteWidget.setCurrentIndex) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(Form)
+
+    def retranslateUi(self, Form):
+        _translate = QtCore.QCoreApplication.translate
+        Form.setWindowTitle(_translate("Form", "Form"))
+        self.manageButton.setText(_translate("Form", "MANAGE"))
+        self.installButton.setText(_translate("Form", "INSTALL"))
+        self.viewerWidget.setTabText(self.viewerWidget.indexOf(self.transformersTab), _translate("Form", "TRANSFORMERS"))
+        self.viewerWidget.setTabText(self.viewerWidget.indexOf(self.cablesTab), _translate("Form", "CABLES / WIRES"))
+        self.viewerWidget.setTabText(self.viewerWidget.indexOf(self.contactsTab), _translate("Form", "CONTACTS"))
+        self.viewerWidget.setTabText(self.viewerWidget.indexOf(self.resistancesTab), _translate("Form", "OTHER RESISTANCES"))
+        self.insertTransTitle.setText(_translate("Form", "KEYS"))
+        self.insertTransTitle2.setText(_translate("Form", "OPTIONS"))
+        self.insertTransLabel7.setText(_translate("Form", "x1, Ohm"))
+        self.insertTransLabel8.setText(_translate("Form", "r0, Ohm"))
+        self.insertTransLabel6.setText(_translate("Form", "r1, Ohm"))
+        self.insertTransLabel5.setText(_translate("Form", "Usc, %"))
+        self.insertTransLabel4.setText(_translate("Form", "Psc, kW"))
+        self.insertTransLabel9.setText(_translate("Form", "x0, Ohm"))
+        self.insertTransLabel.setText(_translate("Form", "Snom, kV*A"))
+        self.insertTransLabel2.setText(_translate("Form", "Unom, kV"))
+        self.insertTransLabel3.setText(_translate("Form", "Vector group"))
+        self.insertCableLabel4.setText(_translate("Form", "Ic, A"))
+        self.insertCableLabel5.setText(_translate("Form", "r1, Ohm"))
+        self.insertCableLabel3.setText(_translate("Form", "Range, mm^2"))
+        self.insertCableLabel.setText(_translate("Form", "Mark name"))
+        self.insertCableLabel2.setText(_translate("Form", "Multicore amount"))
+        self.insertCableLabel6.setText(_translate("Form", "x1, Ohm"))
+        self.insertCableLabel7.setText(_translate("Form", "r0, Ohm"))
+        self.insertCableLabel8.setText(_translate("Form", "x0, Ohm"))
+        self.insertCableTitle2.setText(_translate("Form", "OPTIONS"))
+        self.insertCableTitle.setText(_translate("Form", "KEYS"))
+        self.insertContactTitle.setText(_translate("Form", "KEYS"))
+        self.insertContactTitle2.setText(_translate("Form", "OPTIONS"))
+        self.insertContactLabel.setText(_translate("Form", "Device type"))
+        self.insertContactLabel3.setText(_translate("Form", "r1, Ohm"))
+        self.insertContactLabel2.setText(_translate("Form", "Inom, A"))
+        self.insertContactLabel4.setText(_translate("Form", "x1, Ohm"))
+        self.insertContactLabel5.setText(_translate("Form", "r0, Ohm"))
+        self.insertContactLabel6.setText(_translate("Form", "x0, Ohm"))
+        self.insertResistTitle.setText(_translate("Form", "KEYS"))
+        self.insertResistTitle2.setText(_translate("Form", "OPTIONS"))
+        self.insertResistLabel.setText(_translate("Form", "Contact type"))
+        self.insertResistLabel2.setText(_translate("Form", "r1, Ohm"))
+        self.insertResistLabel3.setText(_translate("Form", "x1, Ohm"))
+        self.insertResistLabel4.setText(_translate("Form", "r0, Ohm"))
+        self.insertResistLabel5.setText(_translate("Form", "x0, Ohm"))
+        self.optionsWidget.setTabText(self.optionsWidget.indexOf(self.insertTab), _translate("Form", "INSERT"))
+        self.updateTransTitle.setText(_translate("Form", "EXISTING KEYS"))
+        self.updateTransTitle3.setText(_translate("Form", "OPTIONS"))
+        self.updateTransLabel.setText(_translate("Form", "Snom, kV*A"))
+        self.updateTransLabel7.setText(_translate("Form", "Psc, kW"))
+        self.updateTransLabel2.setText(_translate("Form", "Unom, kV"))
+        self.updateTransLabel8.setText(_translate("Form", "Usc, %"))
+        self.updateTransLabel3.setText(_translate("Form", "Vector group"))
+        self.updateTransLabel9.setText(_translate("Form", "r1, Ohm"))
+        self.updateTransTitle2.setText(_translate("Form", "NEW KEYS"))
+        self.updateTransLabel10.setText(_translate("Form", "x1, Ohm"))
+        self.updateTransLabel4.setText(_translate("Form", "Snom, kV*A"))
+        self.updateTransLabel11.setText(_translate("Form", "r0, Ohm"))
+        self.updateTransLabel5.setText(_translate("Form", "Unom, kV"))
+        self.updateTransLabel12.setText(_translate("Form", "x0, Ohm"))
+        self.updateTransLabel6.setText(_translate("Form", "Vector group"))
+        self.updateCableTitle.setText(_translate("Form", "EXISTING KEYS"))
+        self.updateCableTitle3.setText(_translate("Form", "OPTIONS"))
+        self.updateCableLabel.setText(_translate("Form", "Mark name"))
+        self.updateCableLabel7.setText(_translate("Form", "Ic, A"))
+        self.updateCableLabel2.setText(_translate("Form", "Multicore amount"))
+        self.updateCableLabel8.setText(_translate("Form", "r1, Ohm"))
+        self.updateCableLabel3.setText(_translate("Form", "Range, mm^2"))
+        self.updateCableLabel9.setText(_translate("Form", "x1, Ohm"))
+        self.updateCableTitle2.setText(_translate("Form", "NEW KEYS"))
+        self.updateCableLabel10.setText(_translate("Form", "r0, Ohm"))
+        self.updateCableLabel4.setText(_translate("Form", "Mark name"))
+        self.updateCableLabel11.setText(_translate("Form", "x0, Ohm"))
+        self.updateCableLabel5.setText(_translate("Form", "Multicore amount"))
+        self.updateCableLabel6.setText(_translate("Form", "Range, mm^2"))
+        self.updateContactTitle3.setText(_translate("Form", "OPTIONS"))
+        self.updateContactTitle2.setText(_translate("Form", "NEW KEYS"))
+        self.updateContactLabel7.setText(_translate("Form", "r0, Ohm"))
+        self.updateContactLabel4.setText(_translate("Form", "Inom, A"))
+        self.updateContactLabel6.setText(_translate("Form", "x1, Ohm"))
+        self.updateContactLabel2.setText(_translate("Form", "Inom, A"))
+        self.updateContactLabel5.setText(_translate("Form", "r1, Ohm"))
+        self.updateContactLabel8.setText(_translate("Form", "x0, Ohm"))
+        self.updateContactLabel.setText(_translate("Form", "Device type"))
+        self.updateContactLabel3.setText(_translate("Form", "Device type"))
+        self.updateContactTitle.setText(_translate("Form", "EXISTING KEYS"))
+        self.updateResistTitle.setText(_translate("Form", "EXISTING KEYS"))
+        self.updateResistTitle3.setText(_translate("Form", "OPTIONS"))
+        self.updateResistLabel.setText(_translate("Form", "Contact type"))
+        self.updateResistLabel3.setText(_translate("Form", "r1, Ohm"))
+        self.updateResistTitle2.setText(_translate("Form", "NEW KEYS"))
+        self.updateResistLabel4.setText(_translate("Form", "x1, Ohm"))
+        self.updateResistLabel2.setText(_translate("Form", "Contact type"))
+        self.updateResistLabel5.setText(_translate("Form", "r0, Ohm"))
+        self.updateResistLabel6.setText(_translate("Form", "x0, Ohm"))
+        self.optionsWidget.setTabText(self.optionsWidget.indexOf(self.updateTab), _translate("Form", "UPDATE"))
+        self.deleteTransTitle.setText(_translate("Form", "KEYS"))
+        self.deleteTransLabel.setText(_translate("Form", "Snom, kV*A"))
+        self.deleteTransLabel2.setText(_translate("Form", "Unom, kV"))
+        self.deleteTransLabel3.setText(_translate("Form", "Vector group"))
+        self.deleteCableTitle.setText(_translate("Form", "KEYS"))
+        self.deleteCableLabel.setText(_translate("Form", "Mark name"))
+        self.deleteCableLabel2.setText(_translate("Form", "Multicore amount"))
+        self.deleteCableLabel3.setText(_translate("Form", "Range, mm^2"))
+        self.deleteContactTitle.setText(_translate("Form", "KEYS"))
+        self.deleteContactLabel.setText(_translate("Form", "Device type"))
+        self.deleteContactLabel2.setText(_translate("Form", "Inom, A"))
+        self.deleteResistTitle.setText(_translate("Form", "KEYS"))
+        self.deleteResistLabel.setText(_translate("Form", "Contact type"))
+        self.optionsWidget.setTabText(self.optionsWidget.indexOf(self.deleteTab), _translate("Form", "DELETE"))
+        self.insertButton.setText(_translate("Form", "INSERT"))
+        self.updateButton.setText(_translate("Form", "UPDATE"))
+        self.deleteLabel.setText(_translate("Form", "DELETE"))
+        self.rowButton.setText(_translate("Form", "ROW"))
+        self.sourceButton.setText(_translate("Form", "SOURCE"))
+from shortcircuitcalc.gui.windows import CustomGraphicView
+from shortcircuitcalc.gui import resources
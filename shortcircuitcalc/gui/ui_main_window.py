@@ -0,0 +1,1041 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'main_window.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.setEnabled(True)
+        MainWindow.resize(1024, 768)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
+        MainWindow.setSizePolicy(sizePolicy)
+        MainWindow.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
+        MainWindow.setAcceptDrops(False)
+        MainWindow.setStyleSheet("")
+        MainWindow.setAnimated(True)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setEnabled(True)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.centralwidget.sizePolicy().hasHeightForWidth())
+        self.centralwidget.setSizePolicy(sizePolicy)
+        self.centralwidget.setStyleSheet("QWidget[objectName=\"centralwidget\"] {\n"
+"    background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 rgba(255, 169, 0, 217), stop:1 rgba(255, 255, 255, 255));\n"
+"}")
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout_8 = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout_8.setContentsMargins(15, 9, 15, 15)
+        self.verticalLayout_8.setSpacing(6)
+        self.verticalLayout_8.setObjectName("verticalLayout_8")
+        self.splitter = QtWidgets.QSplitter(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.splitter.sizePolicy().hasHeightForWidth())
+        self.splitter.setSizePolicy(sizePolicy)
+        self.splitter.setOrientation(QtCore.Qt.Vertical)
+        self.splitter.setObjectName("splitter")
+        self.MainMenu = QtWidgets.QWidget(self.splitter)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.MainMenu.sizePolicy().hasHeightForWidth())
+        self.MainMenu.setSizePolicy(sizePolicy)
+        self.MainMenu.setObjectName("MainMenu")
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout(self.MainMenu)
+        self.horizontalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_4.setSpacing(0)
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.SidePanel = QtWidgets.QWidget(self.MainMenu)
+        self.SidePanel.setObjectName("SidePanel")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.SidePanel)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.inputButton = QtWidgets.QPushButton(self.SidePanel)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.inputButton.sizePolicy().hasHeightForWidth())
+        self.inputButton.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.inputButton.setFont(font)
+        self.inputButton.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}")
+        self.inputButton.setText("")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/icons/resources/icons/input.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.inputButton.setIcon(icon)
+        self.inputButton.setIconSize(QtCore.QSize(24, 24))
+        self.inputButton.setObjectName("inputButton")
+        self.verticalLayout.addWidget(self.inputButton)
+        self.resultButton = QtWidgets.QPushButton(self.SidePanel)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.resultButton.sizePolicy().hasHeightForWidth())
+        self.resultButton.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.resultButton.setFont(font)
+        self.resultButton.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}")
+        self.resultButton.setText("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(":/icons/resources/icons/result.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.resultButton.setIcon(icon1)
+        self.resultButton.setIconSize(QtCore.QSize(24, 24))
+        self.resultButton.setObjectName("resultButton")
+        self.verticalLayout.addWidget(self.resultButton)
+        self.catalogButton = QtWidgets.QPushButton(self.SidePanel)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.catalogButton.sizePolicy().hasHeightForWidth())
+        self.catalogButton.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.catalogButton.setFont(font)
+        self.catalogButton.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}")
+        self.catalogButton.setText("")
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap(":/icons/resources/icons/catalog.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.catalogButton.setIcon(icon2)
+        self.catalogButton.setIconSize(QtCore.QSize(24, 24))
+        self.catalogButton.setObjectName("catalogButton")
+        self.verticalLayout.addWidget(self.catalogButton)
+        self.logsButton = QtWidgets.QPushButton(self.SidePanel)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.logsButton.sizePolicy().hasHeightForWidth())
+        self.logsButton.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.logsButton.setFont(font)
+        self.logsButton.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}")
+        self.logsButton.setText("")
+        icon3 = QtGui.QIcon()
+        icon3.addPixmap(QtGui.QPixmap(":/icons/resources/icons/logs.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.logsButton.setIcon(icon3)
+        self.logsButton.setIconSize(QtCore.QSize(24, 24))
+        self.logsButton.setCheckable(True)
+        self.logsButton.setObjectName("logsButton")
+        self.verticalLayout.addWidget(self.logsButton)
+        self.settingsButton = QtWidgets.QPushButton(self.SidePanel)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.settingsButton.sizePolicy().hasHeightForWidth())
+        self.settingsButton.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.settingsButton.setFont(font)
+        self.settingsButton.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}")
+        self.settingsButton.setText("")
+        icon4 = QtGui.QIcon()
+        icon4.addPixmap(QtGui.QPixmap(":/icons/resources/icons/settings.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.settingsButton.setIcon(icon4)
+        self.settingsButton.setIconSize(QtCore.QSize(24, 24))
+        self.settingsButton.setObjectName("settingsButton")
+        self.verticalLayout.addWidget(self.settingsButton)
+        self.infoButton = QtWidgets.QPushButton(self.SidePanel)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.infoButton.sizePolicy().hasHeightForWidth())
+        self.infoButton.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.infoButton.setFont(font)
+        self.infoButton.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}")
+        self.infoButton.setText("")
+        icon5 = QtGui.QIcon()
+        icon5.addPixmap(QtGui.QPixmap(":/icons/resources/icons/info.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.infoButton.setIcon(icon5)
+        self.infoButton.setIconSize(QtCore.QSize(24, 24))
+        self.infoButton.setObjectName("infoButton")
+        self.verticalLayout.addWidget(self.infoButton)
+        spacerItem = QtWidgets.QSpacerItem(17, 374, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem)
+        self.horizontalLayout_4.addWidget(self.SidePanel)
+        self.SidePanelExt = QtWidgets.QWidget(self.MainMenu)
+        self.SidePanelExt.setObjectName("SidePanelExt")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.SidePanelExt)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.inputButtonExt = QtWidgets.QPushButton(self.SidePanelExt)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.inputButtonExt.sizePolicy().hasHeightForWidth())
+        self.inputButtonExt.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.inputButtonExt.setFont(font)
+        self.inputButtonExt.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.inputButtonExt.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}")
+        self.inputButtonExt.setIcon(icon)
+        self.inputButtonExt.setIconSize(QtCore.QSize(24, 24))
+        self.inputButtonExt.setObjectName("inputButtonExt")
+        self.verticalLayout_2.addWidget(self.inputButtonExt)
+        self.resultButtonExt = QtWidgets.QPushButton(self.SidePanelExt)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.resultButtonExt.sizePolicy().hasHeightForWidth())
+        self.resultButtonExt.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.resultButtonExt.setFont(font)
+        self.resultButtonExt.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}")
+        self.resultButtonExt.setIcon(icon1)
+        self.resultButtonExt.setIconSize(QtCore.QSize(24, 24))
+        self.resultButtonExt.setObjectName("resultButtonExt")
+        self.verticalLayout_2.addWidget(self.resultButtonExt)
+        self.catalogButtonExt = QtWidgets.QPushButton(self.SidePanelExt)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.catalogButtonExt.sizePolicy().hasHeightForWidth())
+        self.catalogButtonExt.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.catalogButtonExt.setFont(font)
+        self.catalogButtonExt.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}")
+        self.catalogButtonExt.setIcon(icon2)
+        self.catalogButtonExt.setIconSize(QtCore.QSize(24, 24))
+        self.catalogButtonExt.setObjectName("catalogButtonExt")
+        self.verticalLayout_2.addWidget(self.catalogButtonExt)
+        self.logsButtonExt = QtWidgets.QPushButton(self.SidePanelExt)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.logsButtonExt.sizePolicy().hasHeightForWidth())
+        self.logsButtonExt.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.logsButtonExt.setFont(font)
+        self.logsButtonExt.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}")
+        self.logsButtonExt.setIcon(icon3)
+        self.logsButtonExt.setIconSize(QtCore.QSize(24, 24))
+        self.logsButtonExt.setObjectName("logsButtonExt")
+        self.verticalLayout_2.addWidget(self.logsButtonExt)
+        self.settingsButtonExt = QtWidgets.QPushButton(self.SidePanelExt)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.settingsButtonExt.sizePolicy().hasHeightForWidth())
+        self.settingsButtonExt.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.settingsButtonExt.setFont(font)
+        self.settingsButtonExt.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}")
+        self.settingsButtonExt.setIcon(icon4)
+        self.settingsButtonExt.setIconSize(QtCore.QSize(24, 24))
+        self.settingsButtonExt.setObjectName("settingsButtonExt")
+        self.verticalLayout_2.addWidget(self.settingsButtonExt)
+        self.infoButtonExt = QtWidgets.QPushButton(self.SidePanelExt)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.infoButtonExt.sizePolicy().hasHeightForWidth())
+        self.infoButtonExt.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.infoButtonExt.setFont(font)
+        self.infoButtonExt.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}")
+        self.infoButtonExt.setIcon(icon5)
+        self.infoButtonExt.setIconSize(QtCore.QSize(24, 24))
+        self.infoButtonExt.setObjectName("infoButtonExt")
+        self.verticalLayout_2.addWidget(self.infoButtonExt)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 374, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem1)
+        self.horizontalLayout_4.addWidget(self.SidePanelExt)
+        self.MainWidget = QtWidgets.QWidget(self.MainMenu)
+        self.MainWidget.setObjectName("MainWidget")
+        self.verticalLayout_13 = QtWidgets.QVBoxLayout(self.MainWidget)
+        self.verticalLayout_13.setContentsMargins(9, -1, 0, 9)
+        self.verticalLayout_13.setObjectName("verticalLayout_13")
+        self.mainBar = QtWidgets.QWidget(self.MainWidget)
+        self.mainBar.setObjectName("mainBar")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.mainBar)
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.switchButton = QtWidgets.QPushButton(self.mainBar)
+        self.switchButton.setStyleSheet("QPushButton {\n"
+"background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 10px;\n"
+"}")
+        self.switchButton.setText("")
+        icon6 = QtGui.QIcon()
+        icon6.addPixmap(QtGui.QPixmap(":/icons/resources/icons/switch.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.switchButton.setIcon(icon6)
+        self.switchButton.setIconSize(QtCore.QSize(24, 24))
+        self.switchButton.setCheckable(True)
+        self.switchButton.setObjectName("switchButton")
+        self.horizontalLayout.addWidget(self.switchButton)
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem2)
+        self.dbmanagerButton = QtWidgets.QPushButton(self.mainBar)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.dbmanagerButton.setFont(font)
+        self.dbmanagerButton.setStyleSheet("QPushButton {\n"
+"background-color: rgba(255, 169, 0, 217);\n"
+"color: rgb(0, 0, 0);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"background-color: rgba(100, 100, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"background-color: rgba(153, 153, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"border-radius: 10px;\n"
+"}")
+        icon7 = QtGui.QIcon()
+        icon7.addPixmap(QtGui.QPixmap(":/icons/resources/icons/db_open_manager.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.dbmanagerButton.setIcon(icon7)
+        self.dbmanagerButton.setIconSize(QtCore.QSize(24, 24))
+        self.dbmanagerButton.setCheckable(True)
+        self.dbmanagerButton.setObjectName("dbmanagerButton")
+        self.horizontalLayout.addWidget(self.dbmanagerButton)
+        self.verticalLayout_13.addWidget(self.mainBar)
+        self.tabWidget = QtWidgets.QTabWidget(self.MainWidget)
+        self.tabWidget.setSizeIncrement(QtCore.QSize(1, 1))
+        self.tabWidget.setBaseSize(QtCore.QSize(0, 0))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.tabWidget.setFont(font)
+        self.tabWidget.setAcceptDrops(False)
+        self.tabWidget.setStyleSheet("")
+        self.tabWidget.setTabPosition(QtWidgets.QTabWidget.North)
+        self.tabWidget.setDocumentMode(True)
+        self.tabWidget.setObjectName("tabWidget")
+        self.inputTab = QtWidgets.QWidget()
+        self.inputTab.setEnabled(True)
+        self.inputTab.setSizeIncrement(QtCore.QSize(0, 0))
+        self.inputTab.setStyleSheet("QWidget[objectName=\"inputTab\"] {\n"
+"  background-image: url(:/images/resources/images/main_back.jpg);\n"
+"  background-repeat: no-repeat;\n"
+"  background-position: center;\n"
+"  background-size: cover;\n"
+"}")
+        self.inputTab.setObjectName("inputTab")
+        self.verticalLayout_16 = QtWidgets.QVBoxLayout(self.inputTab)
+        self.verticalLayout_16.setObjectName("verticalLayout_16")
+        self.consoleLabel = QtWidgets.QLabel(self.inputTab)
+        self.consoleLabel.setEnabled(True)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.consoleLabel.sizePolicy().hasHeightForWidth())
+        self.consoleLabel.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        font.setKerning(True)
+        self.consoleLabel.setFont(font)
+        self.consoleLabel.setStyleSheet("background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 20px;\n"
+"padding-right: 20 px;\n"
+"border-radius: 5px;")
+        self.consoleLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.consoleLabel.setObjectName("consoleLabel")
+        self.verticalLayout_16.addWidget(self.consoleLabel, 0, QtCore.Qt.AlignHCenter)
+        self.consoleInput = CustomPlainTextEdit(self.inputTab)
+        self.consoleInput.setEnabled(True)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.consoleInput.sizePolicy().hasHeightForWidth())
+        self.consoleInput.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.consoleInput.setFont(font)
+        self.consoleInput.setStyleSheet("QPlainTextEdit {\n"
+"background-color: rgba(153, 153, 153, 0.9);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 20px;\n"
+"}")
+        self.consoleInput.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
+        self.consoleInput.setObjectName("consoleInput")
+        self.verticalLayout_16.addWidget(self.consoleInput)
+        self.tabWidget.addTab(self.inputTab, "")
+        self.resultsTab = QtWidgets.QWidget()
+        self.resultsTab.setObjectName("resultsTab")
+        self.verticalLayout_11 = QtWidgets.QVBoxLayout(self.resultsTab)
+        self.verticalLayout_11.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_11.setSpacing(0)
+        self.verticalLayout_11.setObjectName("verticalLayout_11")
+        self.resultsView = CustomGraphicView(self.resultsTab)
+        self.resultsView.setObjectName("resultsView")
+        self.verticalLayout_11.addWidget(self.resultsView)
+        self.tabWidget.addTab(self.resultsTab, "")
+        self.catalogTab = QtWidgets.QWidget()
+        self.catalogTab.setObjectName("catalogTab")
+        self.verticalLayout_12 = QtWidgets.QVBoxLayout(self.catalogTab)
+        self.verticalLayout_12.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_12.setSpacing(0)
+        self.verticalLayout_12.setObjectName("verticalLayout_12")
+        self.catalogView = CustomGraphicView(self.catalogTab)
+        self.catalogView.setObjectName("catalogView")
+        self.verticalLayout_12.addWidget(self.catalogView)
+        self.tabWidget.addTab(self.catalogTab, "")
+        self.settingsTab = QtWidgets.QWidget()
+        self.settingsTab.setObjectName("settingsTab")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.settingsTab)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.widget = QtWidgets.QWidget(self.settingsTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.widget.sizePolicy().hasHeightForWidth())
+        self.widget.setSizePolicy(sizePolicy)
+        self.widget.setObjectName("widget")
+        self.formLayout = QtWidgets.QFormLayout(self.widget)
+        self.formLayout.setObjectName("formLayout")
+        self.settingsLabel = QtWidgets.QLabel(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setUnderline(False)
+        font.setWeight(75)
+        font.setStrikeOut(False)
+        font.setKerning(False)
+        self.settingsLabel.setFont(font)
+        self.settingsLabel.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.settingsLabel.setObjectName("settingsLabel")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.settingsLabel)
+        self.settingsBox = QtWidgets.QComboBox(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setUnderline(False)
+        font.setWeight(75)
+        font.setStrikeOut(False)
+        font.setKerning(False)
+        self.settingsBox.setFont(font)
+        self.settingsBox.setEditable(False)
+        self.settingsBox.setObjectName("settingsBox")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.settingsBox)
+        self.settingsLabel2 = QtWidgets.QLabel(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setUnderline(False)
+        font.setWeight(75)
+        font.setStrikeOut(False)
+        font.setKerning(False)
+        self.settingsLabel2.setFont(font)
+        self.settingsLabel2.setObjectName("settingsLabel2")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.settingsLabel2)
+        self.settingsBox2 = QtWidgets.QComboBox(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setUnderline(False)
+        font.setWeight(75)
+        font.setStrikeOut(False)
+        font.setKerning(False)
+        self.settingsBox2.setFont(font)
+        self.settingsBox2.setObjectName("settingsBox2")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.settingsBox2)
+        self.settingsLabel3 = QtWidgets.QLabel(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setUnderline(False)
+        font.setWeight(75)
+        font.setStrikeOut(False)
+        font.setKerning(False)
+        self.settingsLabel3.setFont(font)
+        self.settingsLabel3.setObjectName("settingsLabel3")
+        self.formLayout.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.settingsLabel3)
+        self.settingsBox3 = QtWidgets.QComboBox(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setUnderline(False)
+        font.setWeight(75)
+        font.setStrikeOut(False)
+        font.setKerning(False)
+        self.settingsBox3.setFont(font)
+        self.settingsBox3.setObjectName("settingsBox3")
+        self.formLayout.setWidget(3, QtWidgets.QFormLayout.FieldRole, self.settingsBox3)
+        self.settingsLabel4 = QtWidgets.QLabel(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setUnderline(False)
+        font.setWeight(75)
+        font.setStrikeOut(False)
+        font.setKerning(False)
+        self.settingsLabel4.setFont(font)
+        self.settingsLabel4.setObjectName("settingsLabel4")
+        self.formLayout.setWidget(4, QtWidgets.QFormLayout.LabelRole, self.settingsLabel4)
+        self.settingsBox4 = QtWidgets.QComboBox(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setUnderline(False)
+        font.setWeight(75)
+        font.setStrikeOut(False)
+        font.setKerning(False)
+        self.settingsBox4.setFont(font)
+        self.settingsBox4.setObjectName("settingsBox4")
+        self.formLayout.setWidget(4, QtWidgets.QFormLayout.FieldRole, self.settingsBox4)
+        self.settingsLabel5 = QtWidgets.QLabel(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setUnderline(False)
+        font.setWeight(75)
+        font.setStrikeOut(False)
+        font.setKerning(False)
+        self.settingsLabel5.setFont(font)
+        self.settingsLabel5.setObjectName("settingsLabel5")
+        self.formLayout.setWidget(6, QtWidgets.QFormLayout.LabelRole, self.settingsLabel5)
+        self.settingsBox5 = QtWidgets.QComboBox(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setUnderline(False)
+        font.setWeight(75)
+        font.setStrikeOut(False)
+        font.setKerning(False)
+        self.settingsBox5.setFont(font)
+        self.settingsBox5.setObjectName("settingsBox5")
+        self.formLayout.setWidget(6, QtWidgets.QFormLayout.FieldRole, self.settingsBox5)
+        self.settingsLabel6 = QtWidgets.QLabel(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setUnderline(False)
+        font.setWeight(75)
+        font.setStrikeOut(False)
+        font.setKerning(False)
+        self.settingsLabel6.setFont(font)
+        self.settingsLabel6.setObjectName("settingsLabel6")
+        self.formLayout.setWidget(7, QtWidgets.QFormLayout.LabelRole, self.settingsLabel6)
+        self.settingsBox6 = QtWidgets.QComboBox(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setUnderline(False)
+        font.setWeight(75)
+        font.setStrikeOut(False)
+        font.setKerning(False)
+        self.settingsBox6.setFont(font)
+        self.settingsBox6.setObjectName("settingsBox6")
+        self.formLayout.setWidget(7, QtWidgets.QFormLayout.FieldRole, self.settingsBox6)
+        self.settingsLabel7 = QtWidgets.QLabel(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setUnderline(False)
+        font.setWeight(75)
+        font.setStrikeOut(False)
+        font.setKerning(False)
+        self.settingsLabel7.setFont(font)
+        self.settingsLabel7.setObjectName("settingsLabel7")
+        self.formLayout.setWidget(8, QtWidgets.QFormLayout.LabelRole, self.settingsLabel7)
+        self.settingsBox7 = QtWidgets.QComboBox(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setUnderline(False)
+        font.setWeight(75)
+        font.setStrikeOut(False)
+        font.setKerning(False)
+        self.settingsBox7.setFont(font)
+        self.settingsBox7.setObjectName("settingsBox7")
+        self.formLayout.setWidget(8, QtWidgets.QFormLayout.FieldRole, self.settingsBox7)
+        self.settingsTitle2 = QtWidgets.QLabel(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setUnderline(True)
+        font.setWeight(75)
+        font.setStrikeOut(False)
+        font.setKerning(False)
+        self.settingsTitle2.setFont(font)
+        self.settingsTitle2.setAlignment(QtCore.Qt.AlignCenter)
+        self.settingsTitle2.setObjectName("settingsTitle2")
+        self.formLayout.setWidget(5, QtWidgets.QFormLayout.SpanningRole, self.settingsTitle2)
+        self.settingsTitle = QtWidgets.QLabel(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setUnderline(True)
+        font.setWeight(75)
+        font.setStrikeOut(False)
+        font.setKerning(False)
+        self.settingsTitle.setFont(font)
+        self.settingsTitle.setAlignment(QtCore.Qt.AlignCenter)
+        self.settingsTitle.setObjectName("settingsTitle")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.SpanningRole, self.settingsTitle)
+        self.verticalLayout_3.addWidget(self.widget)
+        self.infoSettingsLabel = QtWidgets.QLabel(self.settingsTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.infoSettingsLabel.sizePolicy().hasHeightForWidth())
+        self.infoSettingsLabel.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setItalic(True)
+        font.setWeight(75)
+        self.infoSettingsLabel.setFont(font)
+        self.infoSettingsLabel.setWordWrap(True)
+        self.infoSettingsLabel.setObjectName("infoSettingsLabel")
+        self.verticalLayout_3.addWidget(self.infoSettingsLabel)
+        self.tabWidget.addTab(self.settingsTab, "")
+        self.helpTab = QtWidgets.QWidget()
+        self.helpTab.setObjectName("helpTab")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.helpTab)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.helpLabel = QtWidgets.QLabel(self.helpTab)
+        self.helpLabel.setText("")
+        self.helpLabel.setObjectName("helpLabel")
+        self.verticalLayout_4.addWidget(self.helpLabel)
+        self.tabWidget.addTab(self.helpTab, "")
+        self.verticalLayout_13.addWidget(self.tabWidget)
+        self.horizontalLayout_4.addWidget(self.MainWidget)
+        self.Logs = QtWidgets.QWidget(self.splitter)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.Logs.sizePolicy().hasHeightForWidth())
+        self.Logs.setSizePolicy(sizePolicy)
+        self.Logs.setObjectName("Logs")
+        self.verticalLayout_10 = QtWidgets.QVBoxLayout(self.Logs)
+        self.verticalLayout_10.setContentsMargins(9, 9, 9, 9)
+        self.verticalLayout_10.setObjectName("verticalLayout_10")
+        self.logsLabel = QtWidgets.QLabel(self.Logs)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.logsLabel.sizePolicy().hasHeightForWidth())
+        self.logsLabel.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.logsLabel.setFont(font)
+        self.logsLabel.setStyleSheet("background-color: rgba(153, 153, 153, 0.8);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 20px;\n"
+"padding-right: 20 px;\n"
+"border-radius: 5px;")
+        self.logsLabel.setObjectName("logsLabel")
+        self.verticalLayout_10.addWidget(self.logsLabel, 0, QtCore.Qt.AlignHCenter)
+        self.logsOutput = CustomTextEditLogger(self.Logs)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.logsOutput.sizePolicy().hasHeightForWidth())
+        self.logsOutput.setSizePolicy(sizePolicy)
+        self.logsOutput.setMinimumSize(QtCore.QSize(0, 0))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.logsOutput.setFont(font)
+        self.logsOutput.setStyleSheet("QPlainTextEdit {\n"
+"background-color: rgba(153, 153, 153, 0.9);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10 px;\n"
+"border-radius: 20px\n"
+"}")
+        self.logsOutput.setObjectName("logsOutput")
+        self.verticalLayout_10.addWidget(self.logsOutput)
+        self.verticalLayout_8.addWidget(self.splitter)
+        MainWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(MainWindow)
+        self.tabWidget.setCurrentIndex(0)
+        self.inputButtonExt.clicked.connect(self.inputButton.animateClick) # type: ignore
+        self.infoButtonExt.clicked.connect(self.infoButton.animateClick) # type: ignore
+        self.logsButtonExt.clicked.connect(self.logsButton.animateClick) # type: ignore
+        self.catalogButtonExt.clicked.connect(self.catalogButton.animateClick) # type: ignore
+        self.resultButtonExt.clicked.connect(self.resultButton.animateClick) # type: ignore
+        self.logsButton.toggled['bool'].connect(self.Logs.setHidden) # type: ignore
+        self.settingsButtonExt.clicked.connect(self.settingsButton.animateClick) # type: ignore
+        self.switchButton.toggled['bool'].connect(self.SidePanel.setVisible) # type: ignore
+        self.switchButton.toggled['bool'].connect(self.SidePanelExt.setHidden) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+        MainWindow.setTabOrder(self.logsOutput, self.inputButton)
+        MainWindow.setTabOrder(self.inputButton, self.resultButton)
+        MainWindow.setTabOrder(self.resultButton, self.inputButtonExt)
+        MainWindow.setTabOrder(self.inputButtonExt, self.resultButtonExt)
+        MainWindow.setTabOrder(self.resultButtonExt, self.switchButton)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "ShortCircuitCalc by Belov"))
+        self.inputButtonExt.setText(_translate("MainWindow", "INPUT"))
+        self.resultButtonExt.setText(_translate("MainWindow", "RESULTS"))
+        self.catalogButtonExt.setText(_translate("MainWindow", "CATALOG"))
+        self.logsButtonExt.setText(_translate("MainWindow", "LOGS"))
+        self.settingsButtonExt.setText(_translate("MainWindow", "SETTINGS"))
+        self.infoButtonExt.setText(_translate("MainWindow", "INFO / HELP"))
+        self.dbmanagerButton.setText(_translate("MainWindow", "DB MANAGER"))
+        self.consoleLabel.setText(_translate("MainWindow", "CONSOLE"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.inputTab), _translate("MainWindow", "Input"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.resultsTab), _translate("MainWindow", "Result"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.catalogTab), _translate("MainWindow", "Catalog"))
+        self.settingsLabel.setText(_translate("MainWindow", "LOCAL NAME"))
+        self.settingsLabel2.setText(_translate("MainWindow", "CONNECTION"))
+        self.settingsLabel3.setText(_translate("MainWindow", "CLEAR INSTALL"))
+        self.settingsLabel4.setText(_translate("MainWindow", "ENGINE ECHO"))
+        self.settingsLabel5.setText(_translate("MainWindow", "SYSTEM PHASES"))
+        self.settingsLabel6.setText(_translate("MainWindow", "SYSTEM VOLTAGE IN KV"))
+        self.settingsLabel7.setText(_translate("MainWindow", "CALCULATIONS ACCURACY"))
+        self.settingsTitle2.setText(_translate("MainWindow", "CALCULATIONS SETTINGS"))
+        self.settingsTitle.setText(_translate("MainWindow", "DATABASE SETTINGS"))
+        self.infoSettingsLabel.setText(_translate("MainWindow", "*After change such fields as \'LOCAL NAME\', \'CONNECTION\', \'ENGINE ECHO\' should restart program!"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.settingsTab), _translate("MainWindow", "Settings"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.helpTab), _translate("MainWindow", "Help"))
+        self.logsLabel.setText(_translate("MainWindow", "LOGS"))
+from shortcircuitcalc.gui.windows import CustomGraphicView, CustomPlainTextEdit, CustomTextEditLogger
+from shortcircuitcalc.gui import resources
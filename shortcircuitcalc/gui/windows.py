@@ -4,22 +4,27 @@ The module contains GUI windows templates, using PyQt5 and Matplotlib.
 Classes are based on ui files, developed by QtDesigner and customized.
 
 Inner functionality:
+    - CustomFigureCanvas: The class initializes a Matplotlib canvas painting the Agg buffer without copying.
     - CustomGraphicView: The class initializes a window shows graphical objects.
     - CustomPlainTextEdit: The class initializes a custom text edit with a custom caret.
     - CustomTextEditLogger: The class initializes custom text edit object for logging interface in the GUI.
     - ConfirmWindow: The class initializes custom QDialog object.
     - WindowMixin: The class initializes the mixin for graphic window object.
 
-Custom threads:
-    - GraphicsDataThread: The class defines a thread for loading graphics data.
-    - TableDataThread: The class defines a thread for loading table data.
+Custom runnables:
+    - GraphicsDataSignals: The class defines signals of the graphics data runnable.
+    - GraphicsDataRunnable: The class defines a runnable for loading graphics data.
+    - TableDataSignals: The class defines signals of the table data runnable.
+    - TableDataRunnable: The class defines a runnable for loading table data.
+    - DatabaseInstallSignals: The class defines signals of the database installation runnable.
+    - DatabaseInstallRunnable: The class defines a runnable for installing the database.
 
 App main windows:
     - MainWindow: The class defines the main window of the program.
     - DatabaseBrowser: The class creates database browser window and allows to manage database.
 
 Other functionality:
-    - empty.
+    - _field_names: The function returns field names of the dataclass.
 
 """
 
@@ -30,7 +35,8 @@ import os
 from collections import namedtuple
 from decimal import Decimal
 import typing as ty
-from dataclasses import asdict
+from dataclasses import fields
+from functools import lru_cache
 
 import logging
 import matplotlib
@@ -38,11 +44,13 @@ from matplotlib.backends.backend_qt5agg import (
     FigureCanvasQTAgg as FigCanvas,
     NavigationToolbar2QT as NavToolbar,
 )
-from PyQt5 import QtWidgets, QtCore, QtGui, uic
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PyQt5 import QtWidgets, QtCore, QtGui
 
 # Need for correctly loading icons
 import shortcircuitcalc.gui.resources  # noqa
 from shortcircuitcalc.gui.figures import ResultsFigure, CatalogFigure
+from shortcircuitcalc.gui.ui_confirm import Ui_ConfirmWindow
 from shortcircuitcalc.database import (
     Transformer, Cable, CurrentBreaker, OtherContact,
 
@@ -51,15 +59,16 @@ from shortcircuitcalc.database import (
     InsertContact, UpdateContactOldSource, UpdateContactNewSource, UpdateContactRow, DeleteContact,
     InsertResist, UpdateResistOldSource, UpdateResistNewSource, UpdateResistRow, DeleteResist,
 
-    db_install, BT
+    db_install, BT, JoinedMixin
 )
 from shortcircuitcalc.tools import config_manager, logging_error, ChainsSystem
-from shortcircuitcalc.config import GUI_DIR
 
 
 __all__ = (
-    'CustomGraphicView', 'CustomPlainTextEdit', 'CustomTextEditLogger', 'ConfirmWindow', 'WindowMixin',
-    'GraphicsDataThread', 'TableDataThread',
+    'CustomFigureCanvas', 'CustomGraphicView', 'CustomPlainTextEdit', 'CustomTextEditLogger',
+    'ConfirmWindow', 'WindowMixin',
+    'GraphicsDataSignals', 'GraphicsDataRunnable', 'TableDataSignals', 'TableDataRunnable',
+    'DatabaseInstallSignals', 'DatabaseInstallRunnable',
     'MainWindow', 'DatabaseBrowser',
 )
 
@@ -72,11 +81,76 @@ logger = logging.getLogger(__name__)
 GraphicClass = ty.TypeVar('GraphicClass', bound=ty.Union[ResultsFigure, CatalogFigure])
 GraphicWindow = ty.TypeVar('GraphicWindow', bound=ty.Union[QtWidgets.QMainWindow, QtWidgets.QWidget])
 
+# Tools for CRUD operations of the database browser
+InsertTuple = namedtuple('InsertTuple', ('table', 'view', 'operation'))
+UpdateTuple = namedtuple('UpdateTuple', ('table', 'view', 'operation'))
+DeleteTuple = namedtuple('DeleteTuple', ('table', 'view', 'operation'))
+
 
 #######################
 # Inner functionality #
 #######################
 
+class CustomFigureCanvas(FigCanvas):
+    # noinspection PyUnresolvedReferences
+    """
+    The class initializes a Matplotlib canvas painting the Agg buffer without copying.
+
+    Attributes:
+        figure (matplotlib.figure.Figure, optional): The Matplotlib figure.
+
+    Handling events:
+        - paintEvent: The method handles paint event.
+
+    """
+
+    def __init__(self, figure: matplotlib.figure.Figure = None) -> None:
+        super(CustomFigureCanvas, self).__init__(figure)
+        self.__buffer = None
+        self.__image = None
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+        """
+        The method handles paint event.
+
+        The QImage wraps the whole Agg buffer and only the rects of the damaged region
+        are drawn from it, instead of copying the bounding rect of the buffer on every paint.
+
+        Args:
+            event (QtGui.QPaintEvent): The paint event object.
+
+        Note:
+            QImage doesn't own the wrapped memory, so the buffer and the image
+            are kept by the canvas until the next paint.
+
+        """
+        self._draw_idle()  # Only does something if a draw is pending
+
+        # Nothing to paint before the first draw of the figure
+        if not hasattr(self, 'renderer'):
+            return
+
+        painter = QtGui.QPainter(self)
+        try:
+            ratio = self.device_pixel_ratio
+
+            self.__buffer = self.buffer_rgba()
+            height, width = self.__buffer.shape[:2]
+            self.__image = QtGui.QImage(self.__buffer, width, height, QtGui.QImage.Format_RGBA8888)
+            self.__image.setDevicePixelRatio(ratio)
+
+            # Exposed region while panning is narrow strips, its bounding rect may be the whole canvas
+            for rect in event.region().rects():
+                source = QtCore.QRectF(rect.left() * ratio, rect.top() * ratio,
+                                       rect.width() * ratio, rect.height() * ratio)
+                painter.eraseRect(rect)
+                painter.drawImage(QtCore.QRectF(rect), self.__image, source)
+
+            self._draw_rect_callback(painter)
+        finally:
+            painter.end()
+
+
 class CustomGraphicView(QtWidgets.QGraphicsView):
     # noinspection PyUnresolvedReferences
     """
@@ -90,6 +164,7 @@ class CustomGraphicView(QtWidgets.QGraphicsView):
     Interface:
         - supports scrolling, zooming and panning working scene by handling events.
         - set_figure: The method sets the figure to the view scene.
+        - set_static_figure: The method sets the static figure to the view scene.
         - save_model: The method saves the current figure as an any graphical file.
         - save_fragment: The method saves the current visible area widget as an image.
 
@@ -110,10 +185,17 @@ class CustomGraphicView(QtWidgets.QGraphicsView):
         self._title = title
 
         self._figure = figure
-        self._canvas = FigCanvas(self._figure)
+        self._canvas = CustomFigureCanvas(self._figure)
         self._scene = QtWidgets.QGraphicsScene()
+        self._static_scene = None
+        self._static_key = None
 
         self._zoom = 0
+        self._wheel_delta = 0
+        self._wheel_timer = QtCore.QTimer(self)
+        self._wheel_timer.setSingleShot(True)
+        self._wheel_timer.setInterval(16)
+        self._wheel_timer.timeout.connect(self._apply_wheel_zoom)  # noqa
         self._mousePressed = False
         self._drag_pos = None
 
@@ -166,12 +248,24 @@ class CustomGraphicView(QtWidgets.QGraphicsView):
 
         Note:
             Sets start viewing position in top left corner scene.
+            The canvas and the scene are created once with the view,
+            the method only swaps the figure of the canvas.
 
         """
         self._figure = figure
-        self._canvas = FigCanvas(self._figure)
-        self._scene = QtWidgets.QGraphicsScene()
-        self._scene.addWidget(self._canvas)
+        self._static_key = None
+
+        # The canvas scales dpi of the figure by the screen pixel ratio from its original dpi,
+        # the ratio is dropped for the previous figure, so the same figure is never scaled twice
+        pixel_ratio = self._canvas.device_pixel_ratio
+        self._canvas._set_device_pixel_ratio(1)  # noqa
+        self._canvas.figure = self._figure
+        self._figure.set_canvas(self._canvas)
+        self._canvas._set_device_pixel_ratio(pixel_ratio)  # noqa
+        self._canvas.resize(*self._canvas.get_width_height())
+        self._canvas.draw_idle()
+
+        self._scene.setSceneRect(self._scene.itemsBoundingRect())
         self.setScene(self._scene)
 
         # Start viewing position
@@ -186,6 +280,74 @@ class CustomGraphicView(QtWidgets.QGraphicsView):
         if custom_zoom:
             self.zoom_initialize()
 
+    @staticmethod
+    def render_figure(figure: matplotlib.figure.Figure) -> QtGui.QImage:
+        """
+        The method renders the figure to an image.
+
+        The figure is drawn by a temporary Agg canvas without any Qt widgets,
+        so the method can be called from the loading threads.
+
+        Args:
+            figure (matplotlib.figure.Figure): The Matplotlib figure.
+
+        Returns:
+            QtGui.QImage: The rendered figure.
+
+        """
+        figure_canvas = figure.canvas
+        agg_canvas = FigureCanvasAgg(figure)
+        agg_canvas.draw()
+        width, height = agg_canvas.get_width_height(physical=True)
+        image = QtGui.QImage(agg_canvas.buffer_rgba(), width, height, QtGui.QImage.Format_RGBA8888).copy()
+        figure.set_canvas(figure_canvas)
+        return image
+
+    def set_static_figure(self,
+                          figure: matplotlib.figure.Figure,
+                          image: QtGui.QImage = None
+                          ) -> None:
+        """
+        The method sets the static figure to the view scene.
+
+        The figure is rendered once and placed to the scene as a pixmap,
+        so scrolling and zooming don't repaint the Matplotlib canvas.
+
+        Args:
+            figure (matplotlib.figure.Figure): The Matplotlib figure.
+            image (QtGui.QImage, optional): The figure already rendered by render_figure.
+
+        Note:
+            Use only for not interactive figures (tables, catalog).
+            The figure keeps a Qt canvas, which is needed for saving the model.
+            Static figures aren't changed after creating, so if the same figure
+            is set again with the same dpi and size, the shown pixmap is kept.
+
+        """
+        static_key = figure.dpi, tuple(figure.get_size_inches())
+
+        if figure is not self._figure or static_key != self._static_key:
+            self._figure = figure
+            # The canvas is kept by the figure itself for saving the model
+            FigCanvas(self._figure)
+            self._static_key = static_key
+            if image is None:
+                image = self.render_figure(self._figure)
+
+            static_scene = QtWidgets.QGraphicsScene()
+            static_scene.addPixmap(QtGui.QPixmap.fromImage(image))
+            self.setScene(static_scene)
+            self._static_scene = static_scene
+
+        # Start viewing position
+        self.horizontalScrollBar().setSliderPosition(1)
+        self.verticalScrollBar().setSliderPosition(1)
+
+        if self.objectName() not in (
+                'resultsView',
+        ):
+            self.setStyleSheet('QGraphicsView {background-color: transparent;}')
+
     def zoom_initialize(self) -> None:
         """
         The method sets custom zoom initialization for scene and figure.
@@ -201,13 +363,7 @@ class CustomGraphicView(QtWidgets.QGraphicsView):
 
         """
         try:
-            if self.parent() is None:
-                NavToolbar.save_figure(self._figure)
-            else:
-                viewers = self.parent().findChildren(QtWidgets.QGraphicsView)
-                for viewer in viewers:
-                    if viewer == self:
-                        NavToolbar.save_figure(viewer._figure)  # noqa
+            NavToolbar.save_figure(self._figure)
 
         except (AttributeError,):
             logger.error('Cannot save empty model.')
@@ -220,10 +376,8 @@ class CustomGraphicView(QtWidgets.QGraphicsView):
             Saves the current visible area as an image without the scrollbars.
 
         """
-        rect_region = QtCore.QRect(0, 0,
-                                   self.width() - self.verticalScrollBar().width(),
-                                   self.height() - self.horizontalScrollBar().height())
-        pixmap = self.grab(rect_region)
+        # Viewport widget doesn't include the scrollbars and the frame
+        pixmap = self.viewport().grab()
         fname = QtWidgets.QFileDialog.getSaveFileName(
             self, 'Save fragment as ...', 'image.png',
             'Portable Network Graphics (*.png);;'
@@ -284,38 +438,47 @@ class CustomGraphicView(QtWidgets.QGraphicsView):
         else:
             super(CustomGraphicView, self).mouseReleaseEvent(event)
 
-    def wheelEvent(self, event: QtCore.Qt.KeyboardModifier.ControlModifier) -> None:
+    def wheelEvent(self, event: QtGui.QWheelEvent) -> None:
         """
         The method handles the wheel event.
 
         Args:
-            event (QtCore.Qt.KeyboardModifier.ControlModifier): The wheel event.
+            event (QtGui.QWheelEvent): The wheel event.
 
         """
-        modifiers = QtWidgets.QApplication.keyboardModifiers()
+        if event.modifiers() == QtCore.Qt.KeyboardModifier.ControlModifier:
+
+            # Wheel deltas are accumulated and the view is scaled once per frame
+            self._wheel_delta += event.angleDelta().y()
+            self._wheel_timer.start()
+            event.accept()
 
-        if modifiers == QtCore.Qt.KeyboardModifier.ControlModifier:
+        else:
+            # Scrolling goes to the scroll bars directly, without delivering the event to the scene widgets
+            QtWidgets.QAbstractScrollArea.wheelEvent(self, event)
 
-            if event.angleDelta().y() > 0:
-                factor = 1.25
-                self._zoom += 1
-            else:
-                factor = 0.8
-                self._zoom -= 1
+    def _apply_wheel_zoom(self) -> None:
+        """
+        The method scales the view by the accumulated wheel deltas.
 
-            if self._zoom > -1:
-                self.scale(factor, factor)
-            else:
-                self._zoom = 0
-                # self.resetTransform()
+        Note:
+            One wheel step (120 eighths of a degree) zooms in by 1.25 or out by 0.8,
+            the view can't be zoomed out of the start scale.
+            The rest of not full steps is kept for the next wheel events.
 
-            # Alternative variant
-            # angle = event.angleDelta().y()
-            # factor = 1 + (angle / 1000)
-            # self.scale(factor, factor)
+        """
+        steps = int(self._wheel_delta / 120)
+        self._wheel_delta -= steps * 120
 
-        else:
-            super(CustomGraphicView, self).wheelEvent(event)
+        zoom = max(self._zoom + steps, 0)
+        steps, self._zoom = zoom - self._zoom, zoom
+
+        if steps > 0:
+            factor = 1.25 ** steps
+            self.scale(factor, factor)
+        elif steps < 0:
+            factor = 0.8 ** -steps
+            self.scale(factor, factor)
 
     def contextMenuEvent(self, event: QtGui.QContextMenuEvent) -> None:
         """
@@ -388,6 +551,14 @@ class CustomTextEditLogger(QtWidgets.QPlainTextEdit, logging.Handler):
     """
     new_record = QtCore.pyqtSignal(str)
 
+    __LEVEL_COLOURS = {
+        logging.DEBUG: '#000000',
+        logging.INFO: '#000000',
+        logging.WARNING: '#ffffff',
+        logging.ERROR: '#ff0000',
+        logging.CRITICAL: '#ff0000',
+    }
+
     def __init__(self, parent=None) -> None:
         super(CustomTextEditLogger, self).__init__(parent)
         self.setReadOnly(True)
@@ -405,24 +576,16 @@ class CustomTextEditLogger(QtWidgets.QPlainTextEdit, logging.Handler):
         Signals:
             - new_record(str): The text to be appended to the logs terminal.
 
-        """
-        msg = self.format(record)
-
-        color_info = '#000000'
-        color_warning = '#ffffff'
-        color_error = '#ff0000'
-
-        if 'DEBUG' in msg or 'INFO' in msg:
-            msg = f"<span style='color:{color_info};'>{msg}</span>"
-        elif 'WARNING' in msg:
-            msg = f"<span style='color:{color_warning};'>{msg}</span>"
-        elif 'ERROR' in msg or 'CRITICAL' in msg:
-            msg = f"<span style='color:{color_error};'>{msg}</span>"
+        Note:
+            Records come from the loading threads too, so the text is appended
+            through the signal in the GUI thread.
 
-        self.new_record.emit(msg)
+        """
+        color = self.__LEVEL_COLOURS.get(record.levelno, '#000000')
+        self.new_record.emit(f"<span style='color:{color};'>{self.format(record)}</span>")
 
 
-class ConfirmWindow(QtWidgets.QDialog):
+class ConfirmWindow(QtWidgets.QDialog, Ui_ConfirmWindow):
     # noinspection PyUnresolvedReferences
     """
     The class initializes custom QDialog object.
@@ -435,7 +598,7 @@ class ConfirmWindow(QtWidgets.QDialog):
 
     def __init__(self, parent=None, msg: str = None) -> None:
         super(ConfirmWindow, self).__init__(parent)
-        uic.loadUi(GUI_DIR / 'confirm.ui', self)
+        self.setupUi(self)
 
         self.setWindowFlag(QtCore.Qt.WindowContextHelpButtonHint, False)  # noqa
 
@@ -451,6 +614,29 @@ class WindowMixin:
         - window_center_position: The method centers the window on the screen.
 
     """
+    __screen_size: ty.Tuple[int, int] = None
+
+    @staticmethod
+    def __get_screen_size() -> ty.Tuple[int, int]:
+        """
+        Service method, returns the primary screen size.
+
+        The size is queried once and updated only when the screen geometry changes.
+
+        Returns:
+            ty.Tuple[int, int]: The primary screen width and height.
+
+        """
+        def __update(geometry: QtCore.QRect) -> None:
+            WindowMixin.__screen_size = geometry.width(), geometry.height()
+
+        if WindowMixin.__screen_size is None:
+            screen = QtWidgets.QApplication.primaryScreen()
+            __update(screen.geometry())
+            screen.geometryChanged.connect(__update)
+
+        return WindowMixin.__screen_size
+
     def window_center_position(self: GraphicWindow,
                                shift_x: int = 0,
                                shift_y: int = 0,
@@ -464,13 +650,10 @@ class WindowMixin:
             relative (ty.Tuple[int], optional): Relative position of one window relative to another.
 
         """
-        desktop = QtWidgets.QDesktopWidget().screenGeometry()
-        screen_width = desktop.width()
-        screen_height = desktop.height()
-        x = int((screen_width - self.width()) / 2)
-        y = int((screen_height - self.height()) / 2)
-
         if not relative:
+            screen_width, screen_height = WindowMixin.__get_screen_size()
+            x = int((screen_width - self.width()) / 2)
+            y = int((screen_height - self.height()) / 2)
             self.move(
                 int(x + self.width() * shift_x / 100),
                 int(y - self.height() * shift_y / 100)
@@ -483,44 +666,60 @@ class WindowMixin:
             )
 
 
-##################
-# Custom threads #
-##################
+####################
+# Custom runnables #
+####################
 
-class GraphicsDataThread(QtCore.QThread):
+class GraphicsDataSignals(QtCore.QObject):
     # noinspection PyUnresolvedReferences
     """
-    The class defines a thread for loading graphics data.
-
-    Attributes:
-        parent (QtWdgets.QWidget, optional): The parent widget.
-        outer_fn (Callable, optional): The outer function object.
-        inner_fn (Callable, optional): The inner function object.
+    The class defines signals of the graphics data runnable.
 
     Signals:
         - save_data(object): The data to be saved.
         - read_data(object): The data to be read.
+        - read_image(object, object): The data to be read and its rendered image.
         - load_complete(str): The message to be displayed on the success of loading.
         - load_failure(str): The message to be displayed on the failure of loading.
 
     """
     save_data = QtCore.pyqtSignal(object)
     read_data = QtCore.pyqtSignal(object)
+    read_image = QtCore.pyqtSignal(object, object)
     load_complete = QtCore.pyqtSignal(str)
     load_failure = QtCore.pyqtSignal(str)
 
-    def __init__(self, parent=None,
+
+class GraphicsDataRunnable(QtCore.QRunnable):
+    # noinspection PyUnresolvedReferences
+    """
+    The class defines a runnable for loading graphics data in the global thread pool.
+
+    Attributes:
+        outer_fn (Callable, optional): The outer function object.
+        inner_fn (Callable, optional): The inner function object.
+        render (bool, optional): Whether the figure is rendered to the static image. Defaults to False.
+
+    Note:
+        QRunnable is not a QObject, so the signals are placed in the GraphicsDataSignals object,
+        which is created in the thread of the caller and available as 'signals' attribute.
+
+    """
+    def __init__(self,
                  outer_fn: ty.Union[GraphicClass, ty.Callable] = None,
                  inner_fn: ty.Union[GraphicClass, ty.Callable] = None,
-                 *args) -> None:
-        super(GraphicsDataThread, self).__init__(parent)
+                 *args,
+                 render: bool = False) -> None:
+        super(GraphicsDataRunnable, self).__init__()
+        self.signals = GraphicsDataSignals()
         self.outer_fn = outer_fn
         self.inner_fn = inner_fn
         self.args = (*args,)
+        self.render = render
 
     def run(self) -> ty.Any:
         """
-        The method runs separated thread.
+        The method runs in the worker thread of the pool.
 
         """
         try:
@@ -531,68 +730,137 @@ class GraphicsDataThread(QtCore.QThread):
 
             only_fig = data.fig
 
-            self.save_data.emit(data)
-            self.read_data.emit(only_fig)
-            self.load_complete.emit(
+            self.signals.save_data.emit(data)
+            self.signals.read_data.emit(only_fig)
+            # Static figures are rendered here, not in the GUI thread
+            if self.render:
+                self.signals.read_image.emit(only_fig, CustomGraphicView.render_figure(only_fig))
+            self.signals.load_complete.emit(
                 f"Graphics '{self.outer_fn.LOGS_NAME}' successfully loaded."
             )
 
         except (Exception,):
-            self.load_failure.emit(
+            self.signals.load_failure.emit(
                 f"Problems with graphics initialization. '{self.outer_fn.LOGS_NAME}' not loaded."
             )
 
 
-class TableDataThread(QtCore.QThread):
+class TableDataSignals(QtCore.QObject):
     # noinspection PyUnresolvedReferences
     """
-    The class defines a thread for loading table data.
-
-    Attributes:
-        parent (QtWdgets.QWidget, optional): The parent widget.
-        table (Table): The table object.
+    The class defines signals of the table data runnable.
 
     Signals:
-        - load_data(object): The data to be loaded.
+        - load_data(object, object): The data to be loaded and its rendered image.
         - load_complete(str): The message to be displayed on the success of loading.
         - load_failure(str): The message to be displayed on the failure of loading.
 
     """
-    load_data = QtCore.pyqtSignal(object)
+    load_data = QtCore.pyqtSignal(object, object)
     load_complete = QtCore.pyqtSignal(str)
     load_failure = QtCore.pyqtSignal(str)
 
-    def __init__(self, parent=None, table: BT = None):
-        super(TableDataThread, self).__init__(parent)
+
+class TableDataRunnable(QtCore.QRunnable):
+    # noinspection PyUnresolvedReferences
+    """
+    The class defines a runnable for loading table data in the global thread pool.
+
+    Attributes:
+        table (Table): The table object.
+
+    Note:
+        QRunnable is not a QObject, so the signals are placed in the TableDataSignals object,
+        which is created in the thread of the caller and available as 'signals' attribute.
+
+    """
+    def __init__(self, table: BT = None) -> None:
+        super(TableDataRunnable, self).__init__()
+        self.signals = TableDataSignals()
         self.table = table
 
-    def run(self):
+    def run(self) -> None:
         """
-        The method runs separated thread.
+        The method runs in the worker thread of the pool.
 
         """
         try:
-            if 'JoinedMixin' in map(lambda x: x.__name__, self.table.__mro__):
+            if issubclass(self.table, JoinedMixin):
                 data = self.table.show_table(self.table.read_joined_table())
             else:
                 data = self.table.show_table(self.table.read_table())
 
-            self.load_data.emit(data)
-            self.load_complete.emit(
+            self.signals.load_data.emit(data, CustomGraphicView.render_figure(data))
+            self.signals.load_complete.emit(
                 f"Table '{self.table.__tablename__}' successfully loaded."
             )
 
         except (Exception,):
-            self.load_failure.emit(
+            self.signals.load_failure.emit(
                 f"Problems with table '{self.table.__tablename__}'. Try to reinstall database."
             )
 
 
+class DatabaseInstallSignals(QtCore.QObject):
+    # noinspection PyUnresolvedReferences
+    """
+    The class defines signals of the database installation runnable.
+
+    Signals:
+        - load_complete(str): The message to be displayed on the success of installation.
+        - load_failure(str): The message to be displayed on the failure of installation.
+        - finished(): Emitted when the installation is over, successfully or not.
+
+    """
+    load_complete = QtCore.pyqtSignal(str)
+    load_failure = QtCore.pyqtSignal(str)
+    finished = QtCore.pyqtSignal()
+
+
+class DatabaseInstallRunnable(QtCore.QRunnable):
+    # noinspection PyUnresolvedReferences
+    """
+    The class defines a runnable for installing the database in the global thread pool.
+
+    Attributes:
+        clear (bool, optional): If True, clear existing data before deployment.
+
+    Note:
+        QRunnable is not a QObject, so the signals are placed in the DatabaseInstallSignals object,
+        which is created in the thread of the caller and available as 'signals' attribute.
+
+    """
+    def __init__(self, clear: bool = False) -> None:
+        super(DatabaseInstallRunnable, self).__init__()
+        self.signals = DatabaseInstallSignals()
+        self.clear = clear
+
+    def run(self) -> None:
+        """
+        The method runs in the worker thread of the pool.
+
+        """
+        try:
+            db_install(clear=self.clear)
+            self.signals.load_complete.emit('Database successfully installed.')
+
+        except (Exception,):
+            self.signals.load_failure.emit('Problems with database installation. Check the database connection.')
+
+        finally:
+            self.signals.finished.emit()
+
+
 ####################
 # App main windows #
 ####################
 
-class MainWindow(QtWidgets.QMainWindow, WindowMixin):
+# Compiled ui modules import the custom widgets declared above
+from shortcircuitcalc.gui.ui_main_window import Ui_MainWindow  # noqa: E402
+from shortcircuitcalc.gui.ui_db_browser import Ui_Form  # noqa: E402
+
+
+class MainWindow(QtWidgets.QMainWindow, WindowMixin, Ui_MainWindow):
     # noinspection PyUnresolvedReferences
     """
     The class defines the main window of the program.
@@ -615,7 +883,7 @@ class MainWindow(QtWidgets.QMainWindow, WindowMixin):
     """
     def __init__(self, parent=None) -> None:
         super(MainWindow, self).__init__(parent)
-        uic.loadUi(GUI_DIR / 'main_window.ui', self)
+        self.setupUi(self)
 
         # Saved instances
         self.results_figure = None
@@ -724,59 +992,62 @@ class MainWindow(QtWidgets.QMainWindow, WindowMixin):
         ###########################
         BoxParams = namedtuple('BoxParams', ('editable', 'values', 'default', 'update'))
 
+        # Current values of settings, each is read once
+        config = {param: config_manager(param) for param in (
+            'SQLITE_DB_NAME', 'DB_EXISTING_CONNECTION', 'DB_TABLES_CLEAR_INSTALL', 'ENGINE_ECHO',
+            'SYSTEM_PHASES', 'SYSTEM_VOLTAGE_IN_KILOVOLTS', 'CALCULATIONS_ACCURACY'
+        )}
+
         box_config = {
 
             # Database settings
             self.settingsBox: BoxParams(
-                True, [config_manager('SQLITE_DB_NAME')], config_manager('SQLITE_DB_NAME'),
-                lambda: self.admit_changes('SQLITE_DB_NAME', self.settingsBox)
+                True, [config['SQLITE_DB_NAME']], config['SQLITE_DB_NAME'],
+                lambda _: self.admit_changes('SQLITE_DB_NAME', self.settingsBox)
             ),
 
             self.settingsBox2: BoxParams(
-                False, ['MySQL', 'SQLite'], config_manager('DB_EXISTING_CONNECTION'),
-                lambda: self.admit_changes('DB_EXISTING_CONNECTION', self.settingsBox2)
+                False, ['MySQL', 'SQLite'], config['DB_EXISTING_CONNECTION'],
+                lambda _: self.admit_changes('DB_EXISTING_CONNECTION', self.settingsBox2)
             ),
 
             self.settingsBox3: BoxParams(
-                False, [True, False], config_manager('DB_TABLES_CLEAR_INSTALL'),
+                False, [True, False], config['DB_TABLES_CLEAR_INSTALL'],
                 lambda x: config_manager('DB_TABLES_CLEAR_INSTALL', x)
             ),
 
             self.settingsBox4: BoxParams(
-                False, [True, False], config_manager('ENGINE_ECHO'),
-                lambda: self.admit_changes('ENGINE_ECHO', self.settingsBox4)
+                False, [True, False], config['ENGINE_ECHO'],
+                lambda _: self.admit_changes('ENGINE_ECHO', self.settingsBox4)
             ),
 
             # Calculations settings
             self.settingsBox5: BoxParams(
-                False, [3, 1], config_manager('SYSTEM_PHASES'),
+                False, [3, 1], config['SYSTEM_PHASES'],
                 lambda x: config_manager('SYSTEM_PHASES', x)
             ),
 
             self.settingsBox6: BoxParams(
-                False, [Decimal('0.4')], config_manager('SYSTEM_VOLTAGE_IN_KILOVOLTS'),
+                False, [Decimal('0.4')], config['SYSTEM_VOLTAGE_IN_KILOVOLTS'],
                 lambda x: config_manager('SYSTEM_VOLTAGE_IN_KILOVOLTS', x)
             ),
 
             self.settingsBox7: BoxParams(
-                True, [config_manager('CALCULATIONS_ACCURACY')], config_manager('CALCULATIONS_ACCURACY'),
+                True, [config['CALCULATIONS_ACCURACY']], config['CALCULATIONS_ACCURACY'],
                 lambda x: config_manager('CALCULATIONS_ACCURACY', x)
             )
         }
 
         for box in box_config:
-            # Creating combo box options list
+            # Creating combo box options list, default option is the first
             default = box_config[box].default
-            others = box_config[box].values
-            others.remove(default)
-            default = [default]
-            default.extend(others)
-            for i in range(len(default)):
-                default[i] = str(default[i])
+            options = [str(default)] + [str(value) for value in box_config[box].values if value != default]
 
             # Creating GUI for combo box options list
-            box.addItems(default)
+            box.blockSignals(True)
+            box.addItems(options)
             box.setEditable(True)
+            box.blockSignals(False)
             line_edit = box.lineEdit()
             line_edit.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
             line_edit.setReadOnly(not box_config[box].editable)
@@ -787,22 +1058,10 @@ class MainWindow(QtWidgets.QMainWindow, WindowMixin):
 
             box.previous_index = box.currentText()
 
-        # Actions if combo boxes changed
-        self.settingsBox.currentIndexChanged.connect(box_config[self.settingsBox].update)
-        self.settingsBox2.currentIndexChanged.connect(box_config[self.settingsBox2].update)
-        self.settingsBox3.currentIndexChanged.connect(
-            lambda: box_config[self.settingsBox3].update(self.settingsBox3.currentText())
-        )
-        self.settingsBox4.currentIndexChanged.connect(box_config[self.settingsBox4].update)
-        self.settingsBox5.currentIndexChanged.connect(
-            lambda: box_config[self.settingsBox5].update(self.settingsBox5.currentText())
-        )
-        self.settingsBox6.currentIndexChanged.connect(
-            lambda: box_config[self.settingsBox6].update(self.settingsBox6.currentText())
-        )
-        self.settingsBox7.currentIndexChanged.connect(
-            lambda: box_config[self.settingsBox7].update(self.settingsBox7.currentText())
-        )
+            # Actions if combo box changed, default arguments bind the current box
+            box.currentIndexChanged.connect(
+                lambda _, owner=box, update=box_config[box].update: update(owner.currentText())
+            )
 
     def admit_changes(self, critical_param: str, owner: QtWidgets.QComboBox) -> None:
         """
@@ -833,17 +1092,27 @@ class MainWindow(QtWidgets.QMainWindow, WindowMixin):
         """
         The method set catalog figure in the catalog view.
 
-        Loading catalog figure processing in a separate thread
+        Loading catalog figure processing in the global thread pool
         and when it is done, the catalog view is updated.
 
         """
-        catalog_thread = GraphicsDataThread(self, CatalogFigure)
+        catalog_runnable = GraphicsDataRunnable(CatalogFigure, render=True)
+
+        catalog_runnable.signals.read_image.connect(self.catalogView.set_static_figure)
+        catalog_runnable.signals.load_complete.connect(logger.info)
+        catalog_runnable.signals.load_failure.connect(logger.error)
+
+        QtCore.QThreadPool.globalInstance().start(catalog_runnable)
+
+    def reload_catalog(self) -> None:
+        """
+        The method drops the cached catalog tables and sets the catalog figure again.
 
-        catalog_thread.read_data.connect(self.catalogView.set_figure)
-        catalog_thread.load_complete.connect(logger.info)
-        catalog_thread.load_failure.connect(logger.error)
+        Used after the database installation, which changes all catalog tables.
 
-        catalog_thread.start()
+        """
+        CatalogFigure.invalidate_cache()
+        self.set_catalog()
 
     def open_db_browser(self) -> None:
         """
@@ -873,8 +1142,8 @@ class MainWindow(QtWidgets.QMainWindow, WindowMixin):
         """
         The method handles eventFilter.
 
-        When console input is focused and pressed 'CTRL + ENTER', the method start new thread
-        for loading interactive results figure. When it is done, the results view is updated.
+        When console input is focused and pressed 'CTRL + ENTER', the method starts new runnable in the
+        global thread pool for loading interactive results figure. When it is done, the results view is updated.
 
         Args:
             obj (QtWidgets.QWidget): The widget object.
@@ -884,16 +1153,16 @@ class MainWindow(QtWidgets.QMainWindow, WindowMixin):
         if event.type() == QtCore.QEvent.KeyPress and obj is self.consoleInput:  # noqa
             if event.modifiers() == QtCore.Qt.ControlModifier and event.key() == QtCore.Qt.Key_Return:  # noqa
                 text = self.consoleInput.toPlainText()
-                results_thread = GraphicsDataThread(
-                    self, ResultsFigure, ChainsSystem, text
+                results_runnable = GraphicsDataRunnable(
+                    ResultsFigure, ChainsSystem, text
                 )
 
-                results_thread.save_data.connect(self.save_interactive_stmt)
-                results_thread.read_data.connect(self.resultsView.set_figure)
-                results_thread.load_complete.connect(logger.info)
-                results_thread.load_failure.connect(logger.error)
+                results_runnable.signals.save_data.connect(self.save_interactive_stmt)
+                results_runnable.signals.read_data.connect(self.resultsView.set_figure)
+                results_runnable.signals.load_complete.connect(logger.info)
+                results_runnable.signals.load_failure.connect(logger.error)
 
-                results_thread.start()
+                QtCore.QThreadPool.globalInstance().start(results_runnable)
 
         return super().eventFilter(obj, event)
 
@@ -928,7 +1197,7 @@ class MainWindow(QtWidgets.QMainWindow, WindowMixin):
         os.execl(sys.executable, sys.executable, *sys.argv)
 
 
-class DatabaseBrowser(QtWidgets.QWidget, WindowMixin):
+class DatabaseBrowser(QtWidgets.QWidget, WindowMixin, Ui_Form):
     # noinspection PyUnresolvedReferences
     """
     The class creates database browser window and allows to manage database.
@@ -946,11 +1215,12 @@ class DatabaseBrowser(QtWidgets.QWidget, WindowMixin):
 
     Handling events:
         - crud_event: The method get tools and ready for CRUD operations to execution, await command.
+        - closeEvent: The method handles the close event of the window.
 
     """
     def __init__(self, parent=None) -> None:
         super(DatabaseBrowser, self).__init__(parent)
-        uic.loadUi(GUI_DIR / 'db_browser.ui', self)
+        self.setupUi(self)
 
         self.init_gui()
         self.main_menu = next(widget for widget in QtWidgets.QApplication.topLevelWidgets()
@@ -1000,39 +1270,63 @@ class DatabaseBrowser(QtWidgets.QWidget, WindowMixin):
 
     def show_database(self) -> None:
         """
-        The method loads data from database in separate threads and shows it in the views.
+        The method loads data from database in the global thread pool and shows it in the views.
 
         """
         tables = Transformer, Cable, CurrentBreaker, OtherContact
         views = self.transformersView, self.cablesView, self.contactsView, self.resistancesView
 
-        threads = []
-
         for table, view in zip(tables, views):
-            table_data_thread = TableDataThread(self, table)
+            self.show_table(table, view)
+
+    def show_table(self, table: BT, view: CustomGraphicView) -> None:
+        """
+        The method loads one table from database in the global thread pool and shows it in the view.
+
+        Args:
+            table (BT): The database table.
+            view (CustomGraphicView): The view for the table.
+
+        """
+        table_runnable = TableDataRunnable(table)
 
-            table_data_thread.load_data.connect(view.set_figure)
-            table_data_thread.load_complete.connect(logger.info)
-            table_data_thread.load_failure.connect(logger.error)
+        table_runnable.signals.load_data.connect(view.set_static_figure)
+        table_runnable.signals.load_complete.connect(logger.info)
+        table_runnable.signals.load_failure.connect(logger.error)
 
-            threads.append(table_data_thread)
-            table_data_thread.start()
+        QtCore.QThreadPool.globalInstance().start(table_runnable)
 
     def reinstall_database(self) -> None:
         """
         The method allows to install or reinstall the database.
 
         Clear or partially install depending on the installation settings configuration.
-        After operation, the catalog view is updated.
+        Installation runs in the global thread pool, after operation the database
+        and the catalog views are updated.
 
         """
         confirm_window = ConfirmWindow(self, 'RE/INSTALL DATABASE?')
         confirm_window.exec_()
 
         if confirm_window.result() == QtWidgets.QDialog.Accepted:
-            db_install(clear=config_manager('DB_TABLES_CLEAR_INSTALL'))
-            self.show_database()
-            self.main_menu.set_catalog()
+            install_runnable = DatabaseInstallRunnable(config_manager('DB_TABLES_CLEAR_INSTALL'))
+
+            install_runnable.signals.load_complete.connect(logger.info)
+            install_runnable.signals.load_failure.connect(logger.error)
+            # The catalog is reloaded by the main window, even if the browser is closed meanwhile
+            install_runnable.signals.finished.connect(self.main_menu.reload_catalog)
+            install_runnable.signals.finished.connect(self.__reinstall_finished)
+
+            self.installButton.setEnabled(False)
+            QtCore.QThreadPool.globalInstance().start(install_runnable)
+
+    def __reinstall_finished(self) -> None:
+        """
+        Service method, updates the database browser views after the database installation.
+
+        """
+        self.installButton.setEnabled(True)
+        self.show_database()
 
     def crud_operations(self) -> None:
         """
@@ -1043,6 +1337,81 @@ class DatabaseBrowser(QtWidgets.QWidget, WindowMixin):
         and source tables (from catalog).
 
         """
+        # Line edits of the CRUD pages in order of the datasets fields
+        self.__insert_trans_edits = (
+            self.insertTransEdit, self.insertTransEdit2, self.insertTransEdit3, self.insertTransEdit4,
+            self.insertTransEdit5, self.insertTransEdit6, self.insertTransEdit7, self.insertTransEdit8,
+            self.insertTransEdit9
+        )
+        self.__insert_cable_edits = (
+            self.insertCableEdit, self.insertCableEdit2, self.insertCableEdit3, self.insertCableEdit4,
+            self.insertCableEdit5, self.insertCableEdit6, self.insertCableEdit7, self.insertCableEdit8
+        )
+        self.__insert_contact_edits = (
+            self.insertContactEdit, self.insertContactEdit2, self.insertContactEdit3, self.insertContactEdit4,
+            self.insertContactEdit5, self.insertContactEdit6
+        )
+        self.__insert_resist_edits = (
+            self.insertResistEdit, self.insertResistEdit2, self.insertResistEdit3, self.insertResistEdit4,
+            self.insertResistEdit5
+        )
+        self.__update_trans_edits = (
+            self.updateTransEdit, self.updateTransEdit2, self.updateTransEdit3, self.updateTransEdit4,
+            self.updateTransEdit5, self.updateTransEdit6, self.updateTransEdit7, self.updateTransEdit8,
+            self.updateTransEdit9, self.updateTransEdit10, self.updateTransEdit11, self.updateTransEdit12
+        )
+        self.__update_cable_edits = (
+            self.updateCableEdit, self.updateCableEdit2, self.updateCableEdit3, self.updateCableEdit4,
+            self.updateCableEdit5, self.updateCableEdit6, self.updateCableEdit7, self.updateCableEdit8,
+            self.updateCableEdit9, self.updateCableEdit10, self.updateCableEdit11
+        )
+        self.__update_contact_edits = (
+            self.updateContactEdit, self.updateContactEdit2, self.updateContactEdit3, self.updateContactEdit4,
+            self.updateContactEdit5, self.updateContactEdit6, self.updateContactEdit7, self.updateContactEdit8
+        )
+        self.__update_resist_edits = (
+            self.updateResistEdit, self.updateResistEdit2, self.updateResistEdit3, self.updateResistEdit4,
+            self.updateResistEdit5, self.updateResistEdit6
+        )
+        self.__delete_trans_edits = (self.deleteTransEdit, self.deleteTransEdit2, self.deleteTransEdit3)
+        self.__delete_cable_edits = (self.deleteCableEdit, self.deleteCableEdit2, self.deleteCableEdit3)
+        self.__delete_contact_edits = (self.deleteContactEdit, self.deleteContactEdit2)
+        self.__delete_resist_edits = (self.deleteResistEdit,)
+
+        # Tools of the CRUD pages by the page names
+        self.__insert_tools = {
+            'insertTransPage': InsertTuple(Transformer, self.transformersView, self.__insert_trans),
+            'insertCablePage': InsertTuple(Cable, self.cablesView, self.__insert_cable),
+            'insertContactPage': InsertTuple(CurrentBreaker, self.contactsView, self.__insert_contact),
+            'insertResistPage': InsertTuple(OtherContact, self.resistancesView, self.__insert_resist)
+        }
+        self.__update_tools = {
+            'updateTransPage': UpdateTuple(Transformer, self.transformersView, self.__update_trans),
+            'updateCablePage': UpdateTuple(Cable, self.cablesView, self.__update_cable),
+            'updateContactPage': UpdateTuple(CurrentBreaker, self.contactsView, self.__update_contact),
+            'updateResistPage': UpdateTuple(OtherContact, self.resistancesView, self.__update_resist)
+        }
+        self.__delete_tools = {
+            'deleteTransPage': DeleteTuple(Transformer, self.transformersView, self.__delete_trans),
+            'deleteCablePage': DeleteTuple(Cable, self.cablesView, self.__delete_cable),
+            'deleteContactPage': DeleteTuple(CurrentBreaker, self.contactsView, self.__delete_contact),
+            'deleteResistPage': DeleteTuple(OtherContact, self.resistancesView, self.__delete_resist)
+        }
+
+        # Tools of the current CRUD pages, updated on the page change by the page index
+        self.__current_tools = {}
+        stacks = (
+            ('insert', self.insertWidget, self.__insert_tools),
+            ('update', self.updateWidget, self.__update_tools),
+            ('delete', self.deleteWidget, self.__delete_tools)
+        )
+        for kind, widget, tools in stacks:
+            indexed = tuple(tools[widget.widget(index).objectName()] for index in range(widget.count()))
+            self.__current_tools[kind] = indexed[widget.currentIndex()]
+            widget.currentChanged.connect(
+                lambda index, key=kind, pages=indexed: self.__current_tools.update({key: pages[index]})
+            )
+
         ##############################
         # Insert operations settings #
         ##############################
@@ -1069,328 +1438,296 @@ class DatabaseBrowser(QtWidgets.QWidget, WindowMixin):
 
         """
         tools = get_tools()
-        tools.operation(*args, **kwargs)
-
-        if 'JoinedMixin' in map(lambda x: x.__name__, tools.table.__mro__):
-            tools.view.set_figure(
-                tools.table.show_table(tools.table.read_joined_table())
-            )
-        else:
-            tools.view.set_figure(
-                tools.table.show_table(tools.table.read_table())
-            )
+        try:
+            tools.operation(*args, **kwargs)
+        finally:
+            # Catalog shows the source tables of the changed table
+            CatalogFigure.invalidate_cache(*getattr(tools.table, 'SUBTABLES', (tools.table,)))
 
+        self.show_table(tools.table, tools.view)
         self.main_menu.set_catalog()
 
-    def get_insert_tools(self) -> namedtuple:
+    def get_insert_tools(self) -> InsertTuple:
         """
         The method returns tools for insert operations.
 
         Returns:
-            namedtuple: tools for insert operations.
-
-        """
-        InsertTuple = namedtuple('InsertTuple', ('table', 'view', 'operation'))
-
-        insert_operations = {
-            'insertTransPage': InsertTuple(
-                Transformer, self.transformersView, lambda: Transformer.insert_joined_table(
-                    data=[
-                        asdict(
-                            InsertTrans(
-                                self.insertTransEdit.text(),
-                                self.insertTransEdit2.text(),
-                                self.insertTransEdit3.text(),
-                                self.insertTransEdit4.text(),
-                                self.insertTransEdit5.text(),
-                                self.insertTransEdit6.text(),
-                                self.insertTransEdit7.text(),
-                                self.insertTransEdit8.text(),
-                                self.insertTransEdit9.text()
-                            )
-                        )
-                    ]
-                )
-            ),
+            InsertTuple: tools for insert operations.
 
-            'insertCablePage': InsertTuple(
-                Cable, self.cablesView, lambda: Cable.insert_joined_table(
-                    data=[
-                        asdict(
-                            InsertCable(
-                                self.insertCableEdit.text(),
-                                self.insertCableEdit2.text(),
-                                self.insertCableEdit3.text(),
-                                self.insertCableEdit4.text(),
-                                self.insertCableEdit5.text(),
-                                self.insertCableEdit6.text(),
-                                self.insertCableEdit7.text(),
-                                self.insertCableEdit8.text()
-                            )
-                        )
-                    ]
-                )
-            ),
+        """
+        return self.__current_tools['insert']
 
-            'insertContactPage': InsertTuple(
-                CurrentBreaker, self.contactsView, lambda: CurrentBreaker.insert_joined_table(
-                    data=[
-                        asdict(
-                            InsertContact(
-                                self.insertContactEdit.text(),
-                                self.insertContactEdit2.text(),
-                                self.insertContactEdit3.text(),
-                                self.insertContactEdit4.text(),
-                                self.insertContactEdit5.text(),
-                                self.insertContactEdit6.text()
-                            )
-                        )
-                    ]
-                )
-            ),
+    def get_update_tools(self) -> UpdateTuple:
+        """
+        The method returns tools for update operations.
 
-            'insertResistPage': InsertTuple(
-                OtherContact, self.resistancesView, lambda: OtherContact.insert_table(
-                    data=[
-                        asdict(
-                            InsertResist(
-                                self.insertResistEdit.text(),
-                                self.insertResistEdit2.text(),
-                                self.insertResistEdit3.text(),
-                                self.insertResistEdit4.text(),
-                                self.insertResistEdit5.text()
-                            )
-                        )
-                    ]
-                )
-            )
-        }
+        Returns:
+            UpdateTuple: tools for update operations.
 
-        return insert_operations[self.insertWidget.currentWidget().objectName()]
+        """
+        return self.__current_tools['update']
 
-    def get_update_tools(self) -> namedtuple:
+    def get_delete_tools(self) -> DeleteTuple:
         """
-        The method returns tools for update operations.
+        The method returns tools for delete operations.
 
         Returns:
-            namedtuple: tools for update operations.
-
-        """
-        UpdateTuple = namedtuple('UpdateTuple', ('table', 'view', 'operation'))
-
-        update_operations = {
-            'updateTransPage': UpdateTuple(
-                Transformer, self.transformersView, lambda: Transformer.update_joined_table(
-                    old_source_data=asdict(
-                        dict_factory=self.__dict_factory,
-                        obj=UpdateTransOldSource(
-                            self.updateTransEdit.text(),
-                            self.updateTransEdit2.text(),
-                            self.updateTransEdit3.text()
-                        )
-                    ),
-                    new_source_data=asdict(
-                        dict_factory=self.__dict_factory,
-                        obj=UpdateTransNewSource(
-                            self.updateTransEdit4.text(),
-                            self.updateTransEdit5.text(),
-                            self.updateTransEdit6.text()
-                        )
-                    ),
-                    target_row_data=asdict(
-                        dict_factory=self.__dict_factory,
-                        obj=UpdateTransRow(
-                            self.updateTransEdit7.text(),
-                            self.updateTransEdit8.text(),
-                            self.updateTransEdit9.text(),
-                            self.updateTransEdit10.text(),
-                            self.updateTransEdit11.text(),
-                            self.updateTransEdit12.text()
-                        )
-                    )
-                )
-            ),
+            DeleteTuple: tools for delete operations.
 
-            'updateCablePage': UpdateTuple(
-                Cable, self.cablesView, lambda: Cable.update_joined_table(
-                    old_source_data=asdict(
-                        dict_factory=self.__dict_factory,
-                        obj=UpdateCableOldSource(
-                            self.updateCableEdit.text(),
-                            self.updateCableEdit2.text(),
-                            self.updateCableEdit3.text()
-                        )
-                    ),
-                    new_source_data=asdict(
-                        dict_factory=self.__dict_factory,
-                        obj=UpdateCableNewSource(
-                            self.updateCableEdit4.text(),
-                            self.updateCableEdit5.text(),
-                            self.updateCableEdit6.text()
-                        )
-                    ),
-                    target_row_data=asdict(
-                        dict_factory=self.__dict_factory,
-                        obj=UpdateCableRow(
-                            self.updateCableEdit7.text(),
-                            self.updateCableEdit8.text(),
-                            self.updateCableEdit9.text(),
-                            self.updateCableEdit10.text(),
-                            self.updateCableEdit11.text()
-                        )
-                    )
-                )
-            ),
+        """
+        return self.__current_tools['delete']
+
+    def __insert_trans(self) -> None:
+        """
+        Service method, inserts the transformer from the insert page into the database.
 
-            'updateContactPage': UpdateTuple(
-                CurrentBreaker, self.contactsView, lambda: CurrentBreaker.update_joined_table(
-                    old_source_data=asdict(
-                        dict_factory=self.__dict_factory,
-                        obj=UpdateContactOldSource(
-                            self.updateContactEdit.text(),
-                            self.updateContactEdit2.text()
-                        )
-                    ),
-                    new_source_data=asdict(
-                        dict_factory=self.__dict_factory,
-                        obj=UpdateContactNewSource(
-                            self.updateContactEdit3.text(),
-                            self.updateContactEdit4.text()
-                        )
-                    ),
-                    target_row_data=asdict(
-                        dict_factory=self.__dict_factory,
-                        obj=UpdateContactRow(
-                            self.updateContactEdit5.text(),
-                            self.updateContactEdit6.text(),
-                            self.updateContactEdit7.text(),
-                            self.updateContactEdit8.text()
-                        )
-                    )
+        """
+        Transformer.insert_joined_table(
+            data=[
+                self.__as_dict(
+                    InsertTrans(*map(QtWidgets.QLineEdit.text, self.__insert_trans_edits))
                 )
-            ),
+            ]
+        )
+
+    def __insert_cable(self) -> None:
+        """
+        Service method, inserts the cable from the insert page into the database.
 
-            'updateResistPage': UpdateTuple(
-                OtherContact, self.resistancesView, lambda: OtherContact.update_table(
-                    {
-                        **asdict(
-                            dict_factory=self.__dict_factory,
-                            obj=UpdateResistNewSource(
-                                self.updateResistEdit2.text()
-                            )
-                        ),
-                        **asdict(
-                            dict_factory=self.__dict_factory,
-                            obj=UpdateResistRow(
-                                self.updateResistEdit3.text(),
-                                self.updateResistEdit4.text(),
-                                self.updateResistEdit5.text(),
-                                self.updateResistEdit6.text()
-                            )
-                        )
-                    },
-                    options='where_condition',
-                    attr='contact_type',
-                    criteria=(
-                        asdict(
-                            dict_factory=self.__dict_factory,
-                            obj=UpdateResistOldSource(
-                                self.updateResistEdit.text()
-                            )
-                        )['contact_type'],
-                    )
+        """
+        Cable.insert_joined_table(
+            data=[
+                self.__as_dict(
+                    InsertCable(*map(QtWidgets.QLineEdit.text, self.__insert_cable_edits))
                 )
-            )
-        }
+            ]
+        )
 
-        return update_operations[self.updateWidget.currentWidget().objectName()]
+    def __insert_contact(self) -> None:
+        """
+        Service method, inserts the current breaker from the insert page into the database.
 
-    def get_delete_tools(self) -> namedtuple:
         """
-        The method returns tools for delete operations.
+        CurrentBreaker.insert_joined_table(
+            data=[
+                self.__as_dict(
+                    InsertContact(*map(QtWidgets.QLineEdit.text, self.__insert_contact_edits))
+                )
+            ]
+        )
 
-        Returns:
-            namedtuple: tools for delete operations.
-
-        """
-        DeleteTuple = namedtuple('DeleteTuple', ('table', 'view', 'operation'))
-
-        delete_operations = {
-            'deleteTransPage': DeleteTuple(
-                Transformer, self.transformersView, lambda x: Transformer.delete_joined_table(
-                    from_source=x,
-                    source_data=asdict(
-                        dict_factory=self.__dict_factory,
-                        obj=DeleteTrans(
-                            self.deleteTransEdit.text(),
-                            self.deleteTransEdit2.text(),
-                            self.deleteTransEdit3.text()
-                        )
-                    )
+    def __insert_resist(self) -> None:
+        """
+        Service method, inserts the other contact from the insert page into the database.
+
+        """
+        OtherContact.insert_table(
+            data=[
+                self.__as_dict(
+                    InsertResist(*map(QtWidgets.QLineEdit.text, self.__insert_resist_edits))
                 )
+            ]
+        )
+
+    def __update_trans(self) -> None:
+        """
+        Service method, updates the transformer from the update page in the database.
+
+        """
+        Transformer.update_joined_table(
+            old_source_data=self.__as_dict(
+                obj=UpdateTransOldSource(*map(QtWidgets.QLineEdit.text, self.__update_trans_edits[:3])),
+                skip_none=True
             ),
+            new_source_data=self.__as_dict(
+                obj=UpdateTransNewSource(*map(QtWidgets.QLineEdit.text, self.__update_trans_edits[3:6])),
+                skip_none=True
+            ),
+            target_row_data=self.__as_dict(
+                obj=UpdateTransRow(*map(QtWidgets.QLineEdit.text, self.__update_trans_edits[6:])),
+                skip_none=True
+            )
+        )
 
-            'deleteCablePage': DeleteTuple(
-                Cable, self.cablesView, lambda x: Cable.delete_joined_table(
-                    from_source=x,
-                    source_data=asdict(
-                        dict_factory=self.__dict_factory,
-                        obj=DeleteCable(
-                            self.deleteCableEdit.text(),
-                            self.deleteCableEdit2.text(),
-                            self.deleteCableEdit3.text()
-                        )
-                    )
-                )
+    def __update_cable(self) -> None:
+        """
+        Service method, updates the cable from the update page in the database.
+
+        """
+        Cable.update_joined_table(
+            old_source_data=self.__as_dict(
+                obj=UpdateCableOldSource(*map(QtWidgets.QLineEdit.text, self.__update_cable_edits[:3])),
+                skip_none=True
+            ),
+            new_source_data=self.__as_dict(
+                obj=UpdateCableNewSource(*map(QtWidgets.QLineEdit.text, self.__update_cable_edits[3:6])),
+                skip_none=True
             ),
+            target_row_data=self.__as_dict(
+                obj=UpdateCableRow(*map(QtWidgets.QLineEdit.text, self.__update_cable_edits[6:])),
+                skip_none=True
+            )
+        )
 
-            'deleteContactPage': DeleteTuple(
-                CurrentBreaker, self.contactsView, lambda x: CurrentBreaker.delete_joined_table(
-                    from_source=x,
-                    source_data=asdict(
-                        dict_factory=self.__dict_factory,
-                        obj=DeleteContact(
-                            self.deleteContactEdit.text(),
-                            self.deleteContactEdit2.text()
-                        )
-                    )
-                )
+    def __update_contact(self) -> None:
+        """
+        Service method, updates the current breaker from the update page in the database.
+
+        """
+        CurrentBreaker.update_joined_table(
+            old_source_data=self.__as_dict(
+                obj=UpdateContactOldSource(*map(QtWidgets.QLineEdit.text, self.__update_contact_edits[:2])),
+                skip_none=True
             ),
-            'deleteResistPage': DeleteTuple(
-                OtherContact, self.resistancesView, lambda x: OtherContact.delete_table(
-                    filtrate=next(
-                        map(
-                            lambda pair: f"{pair[0]} = '{pair[1]}'",
-                            tuple(
-                                asdict(
-                                    dict_factory=self.__dict_factory,
-                                    obj=DeleteResist(
-                                        self.deleteResistEdit.text()
-                                    )
-                                ).items()
-                            )
-                        )
-                    )
-                )
+            new_source_data=self.__as_dict(
+                obj=UpdateContactNewSource(*map(QtWidgets.QLineEdit.text, self.__update_contact_edits[2:4])),
+                skip_none=True
+            ),
+            target_row_data=self.__as_dict(
+                obj=UpdateContactRow(*map(QtWidgets.QLineEdit.text, self.__update_contact_edits[4:])),
+                skip_none=True
             )
-        }
+        )
+
+    def __update_resist(self) -> None:
+        """
+        Service method, updates the other contact from the update page in the database.
+
+        """
+        old_source = UpdateResistOldSource(*map(QtWidgets.QLineEdit.text, self.__update_resist_edits[:1]))
+        new_source = UpdateResistNewSource(*map(QtWidgets.QLineEdit.text, self.__update_resist_edits[1:2]))
+        target_row = UpdateResistRow(*map(QtWidgets.QLineEdit.text, self.__update_resist_edits[2:]))
+
+        OtherContact.update_table(
+            {
+                name: value for obj in (new_source, target_row)
+                for name, value in self.__as_dict(obj).items() if value is not None
+            },
+            options='where_condition',
+            attr='contact_type',
+            criteria=(old_source.contact_type,)
+        )
+
+    def __delete_trans(self, from_source: bool) -> None:
+        """
+        Service method, deletes the transformer from the delete page from the database.
+
+        Args:
+            from_source (bool): The flag for deleting values from the source tables.
 
-        return delete_operations[self.deleteWidget.currentWidget().objectName()]
+        """
+        Transformer.delete_joined_table(
+            from_source=from_source,
+            source_data=self.__as_dict(
+                obj=DeleteTrans(*map(QtWidgets.QLineEdit.text, self.__delete_trans_edits)),
+                skip_none=True
+            )
+        )
 
-    @property
-    def __dict_factory(self) -> ty.Callable:
+    def __delete_cable(self, from_source: bool) -> None:
         """
-        The method returns a dictionary factory template lambda function.
+        Service method, deletes the cable from the delete page from the database.
+
+        Args:
+            from_source (bool): The flag for deleting values from the source tables.
+
+        """
+        Cable.delete_joined_table(
+            from_source=from_source,
+            source_data=self.__as_dict(
+                obj=DeleteCable(*map(QtWidgets.QLineEdit.text, self.__delete_cable_edits)),
+                skip_none=True
+            )
+        )
+
+    def __delete_contact(self, from_source: bool) -> None:
+        """
+        Service method, deletes the current breaker from the delete page from the database.
+
+        Args:
+            from_source (bool): The flag for deleting values from the source tables.
+
+        """
+        CurrentBreaker.delete_joined_table(
+            from_source=from_source,
+            source_data=self.__as_dict(
+                obj=DeleteContact(*map(QtWidgets.QLineEdit.text, self.__delete_contact_edits)),
+                skip_none=True
+            )
+        )
+
+    def __delete_resist(self, from_source: bool) -> None:
+        """
+        Service method, deletes the other contact from the delete page from the database.
+
+        Args:
+            from_source (bool): The flag for deleting values from the source tables,
+                not used because the table has no source tables.
+
+        """
+        contact_type = DeleteResist(*map(QtWidgets.QLineEdit.text, self.__delete_resist_edits)).contact_type
+        if contact_type is None:
+            raise ValueError("Field 'contact_type' must not be empty")
+
+        # Quotes are doubled to keep the value inside the SQL string literal
+        contact_type = str(contact_type).replace("'", "''")
+        OtherContact.delete_table(filtrate=f"contact_type = '{contact_type}'")
+
+    @staticmethod
+    def __as_dict(obj: ty.Any, skip_none: bool = False) -> dict:
+        """
+        The method returns fields of the dataclass object as a dictionary.
+
+        Unlike 'dataclasses.asdict' the values are not deep copied, the dataset
+        fields contain only plain values, validated by their descriptors.
+
+        Args:
+            obj (Any): The dataclass object.
+            skip_none (bool, optional): The flag for skipping fields with None values.
 
         Returns:
-            ty.Callable: dictionary factory template lambda function.
+            dict: The dictionary with pairs "field name - value".
+
+        """
+        data = {name: getattr(obj, name) for name in _field_names(type(obj))}
+        if skip_none:
+            return {k: v for (k, v) in data.items() if v is not None}
+        return data
 
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         """
-        return lambda x: {k: v for (k, v) in x if v is not None}
+        The method handles the close event of the window.
+
+        The closed window is deleted together with its table views and figures,
+        the main window creates a new database browser on the next opening.
+
+        Args:
+            event (QtGui.QCloseEvent): The close event object.
+
+        """
+        if self.main_menu.db_browser is self:
+            self.main_menu.db_browser = None
+        self.deleteLater()
+        super().closeEvent(event)
 
 
 ########################
 # Others functionality #
 ########################
 
-pass
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> ty.Tuple[str, ...]:
+    """
+    The function returns field names of the dataclass.
+
+    Args:
+        cls (type): The dataclass.
+
+    Returns:
+        Tuple[str, ...]: The names of the dataclass fields.
+
+    Note:
+        Field names are read from the dataclass once and cached by the class.
+
+    """
+    return tuple(item.name for item in fields(cls))
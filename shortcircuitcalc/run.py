@@ -15,10 +15,10 @@ def main():
     The function creates and shows app main window.
 
     """
-    app = QtWidgets.QApplication(sys.argv)
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
     main_window = MainWindow()
     main_window.show()
-    app.exec_()
+    sys.exit(app.exec_())
 
 
 if __name__ == '__main__':
@@ -11,5 +11,27 @@ Modules:
 """
 
 
+import typing as ty
+
+from shortcircuitcalc.tools import tools as _tools
 from shortcircuitcalc.tools.tools import *
 from shortcircuitcalc.tools.elements import *
+
+
+def __getattr__(name: str) -> ty.Any:
+    """
+    Provides lazy access to the package 'engine' and 'Session' objects.
+
+    Args:
+        name (str): The name of the package attribute.
+
+    Returns:
+        ty.Any: The SQLAlchemy engine object or the session factory.
+
+    Raises:
+        AttributeError: If the package has no such attribute.
+
+    """
+    if name in ('engine', 'Session'):
+        return getattr(_tools, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -41,6 +41,9 @@ class ElemChain(ty.Sequence, ty.Mapping):
         - two_phase_current_short_circuit: The method calculates the two-phase current during a short circuit.
         - one_phase_current_short_circuit: The method calculates the one-phase current during a short circuit.
 
+    Public methods:
+        - cumulative_currents_short_circuit: The method calculates the currents at the end of every element.
+
     Samples data input as sequence:
 
     .. code-block:: python
@@ -84,13 +87,7 @@ class ElemChain(ty.Sequence, ty.Mapping):
         :math:`z_{^{(3)}}` - three-phase summary resistance.
 
         """
-        return round(
-            (
-                config_manager('SYSTEM_VOLTAGE_IN_KILOVOLTS') / Decimal(math.sqrt(3)) /
-                self.__three_phase_summary_resistance()
-            ),
-            config_manager('CALCULATIONS_ACCURACY')
-        )
+        return self.__currents_short_circuit(*self.__summary_resistances())[0]
 
     @property
     def two_phase_current_short_circuit(self) -> Decimal:
@@ -106,12 +103,7 @@ class ElemChain(ty.Sequence, ty.Mapping):
         :math:`I_{k^{(3)}}` - three-phase current during a short circuit.
 
         """
-        return round(
-            (
-                Decimal(math.sqrt(3)) / 2 * self.three_phase_current_short_circuit
-            ),
-            config_manager('CALCULATIONS_ACCURACY')
-        )
+        return self.__currents_short_circuit(*self.__summary_resistances())[1]
 
     @property
     def one_phase_current_short_circuit(self) -> Decimal:
@@ -128,113 +120,95 @@ class ElemChain(ty.Sequence, ty.Mapping):
         :math:`I_{k^{(1)}}` - one-phase current during a short circuit.
 
         """
-        return round(
-            (
-                Decimal(math.sqrt(3)) * config_manager('SYSTEM_VOLTAGE_IN_KILOVOLTS') /
-                self.__one_phase_summary_resistance()
-            ),
-            config_manager('CALCULATIONS_ACCURACY')
-        )
+        return self.__currents_short_circuit(*self.__summary_resistances())[2]
 
-    def __three_phase_summary_resistance(self) -> Decimal:
+    def cumulative_currents_short_circuit(self) -> ty.List[ty.Tuple[Decimal, Decimal, Decimal]]:
         """
-        Service function, calculates three-phase summary resistance.
+        Calculates the short circuit currents at the end of every element of the chain.
+
+        Resistances of each element are read once and summed cumulatively, so the result
+        is the same as calculating the currents for each chain prefix separately.
 
         Returns:
-            single Decimal value.
+            List[Tuple[Decimal, Decimal, Decimal]]: three-phase, two-phase and one-phase
+            currents during a short circuit for each chain prefix.
 
-        .. math::
-            z_{^{(3)}} = \\sqrt{r_{1\\sum_{}^{2}} + x_{1\\sum_{}^{2}}}
+        """
+        currents = []
+        summary = None
+        for elem in self.__elements():
+            values = (elem.resistance_r1, elem.reactance_x1, elem.resistance_r0, elem.reactance_x0)
+            summary = values if summary is None else tuple(x + y for x, y in zip(summary, values))
+            currents.append(self.__currents_short_circuit(*summary))
 
-        :math:`r_1` - resistance value resistance_r1,
-        :math:`x_1` - reactance value reactance_x1.
+        return currents
 
+    def __elements(self) -> ty.Iterable:
         """
-        def __summary_resistance(obj: ty.Union[ty.Sequence, dict.values]) -> Decimal:
-            """
-            Service function, calculates summary resistance.
-
-            Args:
-                obj (Union[Sequence, Mapping]): The chain of elements.
-
-            Returns:
-                summary resistance as single Decimal value.
-
-            """
-            return Decimal(
-                math.sqrt(
-                    math.pow(
-                        reduce(
-                            lambda x, y: x + y, (i.resistance_r1 for i in obj)
-                        ), 2
-                    ) +
-                    math.pow(
-                        reduce(
-                            lambda x, y: x + y, (i.reactance_x1 for i in obj)
-                        ), 2
-                    )
-                )
-            )
+        Service function, returns the elements of the chain.
 
-        if isinstance(self.obj, ty.Sequence):
-            return __summary_resistance(self.obj)
+        Returns:
+            Iterable: The chain elements without names.
 
-        if isinstance(self.obj, ty.Mapping):
-            return __summary_resistance(self.obj.values())
+        """
+        return self.obj.values() if isinstance(self.obj, ty.Mapping) else self.obj
+
+    def __summary_resistances(self) -> ty.Tuple[Decimal, Decimal, Decimal, Decimal]:
+        """
+        Service function, calculates summary resistances of the chain.
 
-    def __one_phase_summary_resistance(self) -> Decimal:
+        Returns:
+            Tuple[Decimal, Decimal, Decimal, Decimal]: summary resistance_r1, reactance_x1,
+            resistance_r0 and reactance_x0 values.
+
+        """
+        elements = tuple(self.__elements())
+        return (
+            reduce(lambda x, y: x + y, (i.resistance_r1 for i in elements)),
+            reduce(lambda x, y: x + y, (i.reactance_x1 for i in elements)),
+            reduce(lambda x, y: x + y, (i.resistance_r0 for i in elements)),
+            reduce(lambda x, y: x + y, (i.reactance_x0 for i in elements))
+        )
+
+    @staticmethod
+    def __currents_short_circuit(r1: Decimal, x1: Decimal,
+                                 r0: Decimal, x0: Decimal) -> ty.Tuple[Decimal, Decimal, Decimal]:
         """
-        Service function, calculates one-phase summary resistance.
+        Service function, calculates the currents during a short circuit by summary resistances.
+
+        Args:
+            r1 (Decimal): summary resistance_r1 value.
+            x1 (Decimal): summary reactance_x1 value.
+            r0 (Decimal): summary resistance_r0 value.
+            x0 (Decimal): summary reactance_x0 value.
 
         Returns:
-            single Decimal value.
+            Tuple[Decimal, Decimal, Decimal]: three-phase, two-phase and one-phase
+            currents during a short circuit.
 
         .. math::
-            z_{^{(1)}} = \\sqrt{{(2r_{1\\sum_{}} + r_{0\\sum_{}})}^{2} + {(2x_{1\\sum_{}} + x_{0\\sum_{}})}^{2}}
+            z_{^{(3)}} = \\sqrt{r_{1\\sum_{}^{2}} + x_{1\\sum_{}^{2}}}
 
-        :math:`r_1` - resistance value resistance_r1,
-        :math:`r_0` - resistance value resistance_r0,
-        :math:`x_1` - reactance value reactance_x1,
-        :math:`x_0` - reactance value reactance_x0.
+        .. math::
+            z_{^{(1)}} = \\sqrt{{(2r_{1\\sum_{}} + r_{0\\sum_{}})}^{2} + {(2x_{1\\sum_{}} + x_{0\\sum_{}})}^{2}}
 
         """
-        def __summary_resistance(obj: ty.Union[ty.Sequence, dict.values]) -> Decimal:
-            """
-            Service function, calculates summary resistance.
-
-            Args:
-                obj (Union[Sequence, Mapping]): The chain of elements.
-
-            Returns:
-                summary resistance as single Decimal value.
-
-            """
-            return Decimal(
-                math.sqrt(
-                    math.pow(
-                        2 * reduce(
-                            lambda x, y: x + y, (i.resistance_r1 for i in obj)
-                        ) +
-                        reduce(
-                            lambda x, y: x + y, (i.resistance_r0 for i in obj)
-                        ), 2
-                    ) +
-                    math.pow(
-                        2 * reduce(
-                            lambda x, y: x + y, (i.reactance_x1 for i in obj)
-                        ) +
-                        reduce(
-                            lambda x, y: x + y, (i.reactance_x0 for i in obj)
-                        ), 2
-                    )
-                )
-            )
+        voltage = config_manager('SYSTEM_VOLTAGE_IN_KILOVOLTS')
+        accuracy = config_manager('CALCULATIONS_ACCURACY')
 
-        if isinstance(self.obj, ty.Sequence):
-            return __summary_resistance(self.obj)
+        three_phase = round(
+            voltage / Decimal(math.sqrt(3)) /
+            Decimal(math.sqrt(math.pow(r1, 2) + math.pow(x1, 2))),
+            accuracy
+        )
+        two_phase = round(Decimal(math.sqrt(3)) / 2 * three_phase, accuracy)
+        one_phase = round(
+            Decimal(math.sqrt(3)) * voltage /
+            Decimal(math.sqrt(math.pow(2 * r1 + r0, 2) + math.pow(2 * x1 + x0, 2))),
+            accuracy
+        )
 
-        if isinstance(self.obj, ty.Mapping):
-            return __summary_resistance(self.obj.values())
+        return three_phase, two_phase, one_phase
 
     def __getitem__(self, key):
         if isinstance(self.obj, ty.Sequence):
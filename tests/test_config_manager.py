@@ -1,6 +1,10 @@
 import unittest
+import pathlib
+import tempfile
+from unittest import mock
 from decimal import Decimal
 from shortcircuitcalc.tools import config_manager
+from shortcircuitcalc.tools.tools import _load_config
 
 
 class TestConfigManager(unittest.TestCase):
@@ -108,6 +112,42 @@ class TestConfigManager(unittest.TestCase):
         self.assertEqual(self.cm_set73, 0.4)
         self.assertEqual(self.cm_set75, Decimal('0.4'))
 
+    def test_set_same_config(self):
+        config_manager('SQLITE_DB_NAME')
+
+        with mock.patch('pathlib.Path.write_text') as mocked_write:
+            config_manager('SQLITE_DB_NAME', 'electrical_product_catalog.db')
+            config_manager('SYSTEM_PHASES', 3)
+            config_manager('SYSTEM_VOLTAGE_IN_KILOVOLTS', Decimal('0.4'))
+
+        mocked_write.assert_not_called()
+
+    def test_get_quoted_config(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_config = pathlib.Path(temp_dir, 'config.py')
+            temp_config.write_text(
+                "SQLITE_DB_NAME = '1.db'\n"
+                "OTHER_DB_NAME = 'my db.db'\n"
+                "SYSTEM_PHASES = '3'\n"
+                "ENGINE_ECHO = 'True'\n",
+                encoding='UTF-8'
+            )
+
+            _load_config.cache_clear()
+            try:
+                with mock.patch('shortcircuitcalc.tools.tools.CONFIG_DIR', temp_config):
+                    self.cm_quoted1 = config_manager('SQLITE_DB_NAME')
+                    self.cm_quoted2 = config_manager('OTHER_DB_NAME')
+                    self.cm_quoted3 = config_manager('SYSTEM_PHASES')
+                    self.cm_quoted4 = config_manager('ENGINE_ECHO')
+            finally:
+                _load_config.cache_clear()
+
+        self.assertEqual(self.cm_quoted1, '1.db')
+        self.assertEqual(self.cm_quoted2, 'my db.db')
+        self.assertEqual(self.cm_quoted3, '3')
+        self.assertEqual(self.cm_quoted4, 'True')
+
 
 if __name__ == '__main__':
     unittest.main()
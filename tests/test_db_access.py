@@ -0,0 +1,27 @@
+import unittest
+from unittest import mock
+from shortcircuitcalc.tools.tools import db_access, _db_access
+
+
+class TestDbAccess(unittest.TestCase):
+    def setUp(self):
+        _db_access.cache_clear()
+
+    def tearDown(self):
+        _db_access.cache_clear()
+
+    def test_failed_access_not_cached(self):
+        with mock.patch('shortcircuitcalc.tools.tools.config_manager', return_value='NOT_EXISTING'):
+            self.db_access1 = db_access()
+
+        self.db_access2 = db_access()
+        self.db_access3 = db_access()
+
+        self.assertEqual(self.db_access1, None)
+        self.assertTrue(self.db_access2.startswith('sqlite:///'))
+        self.assertEqual(self.db_access3, self.db_access2)
+        self.assertEqual(_db_access.cache_info().hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+import sqlalchemy as sa
+from shortcircuitcalc.tools import Base, session_scope, config_manager
+from shortcircuitcalc.database.mixins import BaseMixin
+
+
+class MissingTable(BaseMixin, Base):
+    pass
+
+
+class TestDropTable(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        Base.metadata.remove(MissingTable.__table__)
+
+    @unittest.skipUnless(config_manager('DB_EXISTING_CONNECTION') == 'SQLite', 'SQLite connection only')
+    def test_forced_drop_missing_table_keeps_foreign_keys(self):
+        MissingTable.drop_table(MissingTable.__tablename__, forced=True)
+
+        with session_scope() as session:
+            foreign_keys = session.execute(sa.text('PRAGMA foreign_keys;')).scalar()
+
+        self.assertEqual(foreign_keys, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from collections import namedtuple
+from decimal import Decimal
+from shortcircuitcalc.tools import ElemChain
+
+
+Element = namedtuple('Element', ('resistance_r1', 'reactance_x1', 'resistance_r0', 'reactance_x0'))
+
+
+class TestElemChain(unittest.TestCase):
+    def setUp(self):
+        self.elements = (
+            Element(Decimal('3.1'), Decimal('13.6'), Decimal('3.1'), Decimal('13.6')),
+            Element(Decimal('0.4'), Decimal('0.5'), Decimal('0.4'), Decimal('0.5')),
+            Element(Decimal('5.5'), Decimal('0.09'), Decimal('22.0'), Decimal('0.36')),
+            Element(Decimal('7.0'), Decimal('4.5'), Decimal('7.0'), Decimal('4.5'))
+        )
+
+    def test_cumulative_currents_sequence(self):
+        chain = ElemChain(self.elements)
+        currents = chain.cumulative_currents_short_circuit()
+
+        self.assertEqual(len(currents), len(self.elements))
+        for n, current in enumerate(currents):
+            prefix = ElemChain(self.elements[:n + 1])
+            self.assertEqual(current, (
+                prefix.three_phase_current_short_circuit,
+                prefix.two_phase_current_short_circuit,
+                prefix.one_phase_current_short_circuit
+            ))
+
+    def test_cumulative_currents_mapping(self):
+        chain = ElemChain({f'E{n}': elem for n, elem in enumerate(self.elements)})
+        currents = chain.cumulative_currents_short_circuit()
+
+        self.assertEqual(len(currents), len(self.elements))
+        for n, current in enumerate(currents):
+            prefix = chain[:n + 1]
+            self.assertEqual(current, (
+                prefix.three_phase_current_short_circuit,
+                prefix.two_phase_current_short_circuit,
+                prefix.one_phase_current_short_circuit
+            ))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -100,6 +100,32 @@ class TestTypesManager(unittest.TestCase):
         self.tm_int_type5 = TypesManager(1, as_decimal=True, as_string=True, quoting=True)
         self.assertEqual(self.tm_int_type5, "\"Decimal('1')\"")
 
+    def test_signed_and_exponent_str(self):
+        self.tm_num_str1 = TypesManager("-3")
+        self.assertEqual(self.tm_num_str1, -3)
+        self.assertIsInstance(self.tm_num_str1, int)
+
+        self.tm_num_str2 = TypesManager("1e3")
+        self.assertEqual(self.tm_num_str2, 1000.0)
+        self.assertIsInstance(self.tm_num_str2, float)
+
+        self.tm_num_str3 = TypesManager("-.5", as_decimal=True)
+        self.assertEqual(self.tm_num_str3, Decimal('-0.5'))
+
+        self.tm_num_str4 = TypesManager("nan")
+        self.assertEqual(self.tm_num_str4, "nan")
+
+    def test_repeated_str(self):
+        self.tm_rep_str1 = TypesManager("[1, 2]")
+        self.tm_rep_str1.append(3)
+        self.tm_rep_str2 = TypesManager("[1, 2]")
+        self.assertEqual(self.tm_rep_str2, [1, 2])
+
+        self.tm_rep_dec1 = TypesManager(Decimal('0.10'), as_string=True)
+        self.tm_rep_dec2 = TypesManager(Decimal('0.1'), as_string=True)
+        self.assertEqual(self.tm_rep_dec1, "Decimal('0.10')")
+        self.assertEqual(self.tm_rep_dec2, "Decimal('0.1')")
+
     def test_string(self):
         self.tm_string1 = TypesManager("billy")
         self.assertEqual(self.tm_string1, "billy")